@@ -0,0 +1,6 @@
+"""
+Benchmarks for the analysis engines
+
+Run as modules from the repository root, e.g.:
+    python -m benchmarks.bench_statistics
+"""
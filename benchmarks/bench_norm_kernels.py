@@ -0,0 +1,95 @@
+"""
+Benchmark - normal CDF/PDF kernels vs scipy.stats.norm
+
+Reports the per-call cost of scipy.stats.norm.cdf/pdf and of the
+src.greeks.kernels replacements, on a scalar and on arrays, plus a scalar
+Black-Scholes call price computed both ways (the pricing formula as it was
+written against scipy.stats.norm, and BlackScholesModel.call_price today).
+
+Usage:
+    python -m benchmarks.bench_norm_kernels
+    python -m benchmarks.bench_norm_kernels --sizes 1000 1000000 --calls 200000
+"""
+
+import argparse
+import math
+import sys
+import time
+from typing import Callable, List, Optional
+
+import numpy as np
+from loguru import logger
+from scipy import stats as scipy_stats
+
+from src.greeks.black_scholes import BlackScholesModel
+from src.greeks.kernels import batch_norm_cdf, batch_norm_pdf, norm_cdf, norm_pdf
+
+
+def baseline_call_price(
+    spot: float, strike: float, time_to_expiry: float, rate: float, volatility: float
+) -> float:
+    """Scalar call price on scipy.stats.norm, as before the kernels"""
+    sqrt_t = math.sqrt(time_to_expiry)
+    d1 = (
+        math.log(spot / strike) + (rate + 0.5 * volatility ** 2) * time_to_expiry
+    ) / (volatility * sqrt_t)
+    d2 = d1 - volatility * sqrt_t
+    return max(0, (
+        spot * scipy_stats.norm.cdf(d1) -
+        strike * math.exp(-rate * time_to_expiry) * scipy_stats.norm.cdf(d2)
+    ))
+
+
+def per_call(func: Callable[[], object], calls: int, repeat: int = 3) -> float:
+    """Best per-call wall time over repeat runs of calls calls, in seconds"""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(calls):
+            func()
+        timings.append((time.perf_counter() - start) / calls)
+    return min(timings)
+
+
+def report(label: str, before: float, after: float) -> None:
+    print(f"  {label:<28} {before * 1e6:>12.3f} us {after * 1e6:>12.3f} us "
+          f"{before / after:>8.1f}x")
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Normal CDF/PDF kernel benchmark")
+    parser.add_argument("--calls", type=int, default=20_000, help="Scalar calls per timing")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 1_000_000])
+    args = parser.parse_args(argv)
+
+    logger.remove()
+    logger.add(sys.stderr, level="WARNING")
+
+    print(f"  {'per call':<28} {'scipy.stats':>15} {'kernels':>15} {'speedup':>9}")
+
+    x = 0.3
+    report("cdf(scalar)", per_call(lambda: scipy_stats.norm.cdf(x), args.calls),
+           per_call(lambda: norm_cdf(x), args.calls))
+    report("pdf(scalar)", per_call(lambda: scipy_stats.norm.pdf(x), args.calls),
+           per_call(lambda: norm_pdf(x), args.calls))
+
+    for size in args.sizes:
+        values = np.random.default_rng(0).standard_normal(size)
+        calls = max(3, args.calls // size)
+        report(f"cdf(array[{size:,}])",
+               per_call(lambda values=values: scipy_stats.norm.cdf(values), calls),
+               per_call(lambda values=values: batch_norm_cdf(values), calls))
+        report(f"pdf(array[{size:,}])",
+               per_call(lambda values=values: scipy_stats.norm.pdf(values), calls),
+               per_call(lambda values=values: batch_norm_pdf(values), calls))
+
+    calls = max(1, args.calls // 4)
+    report(
+        "call_price(scalar)",
+        per_call(lambda: baseline_call_price(100.0, 105.0, 0.2, 0.05, 0.3), calls),
+        per_call(lambda: BlackScholesModel.call_price(100.0, 105.0, 0.2, 0.05, 0.3), calls)
+    )
+
+
+if __name__ == "__main__":
+    main()
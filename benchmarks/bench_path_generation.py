@@ -0,0 +1,108 @@
+"""
+Benchmark - correlated price path generation: time and peak memory
+
+Compares MonteCarloSimulator's block-wise generator, which writes into
+preallocated per-symbol buffers, with the previous implementation, which
+materialized the full (paths x days x assets) independent and correlated
+normal tensors plus per-asset log-return temporaries. Peak memory is
+measured with tracemalloc (numpy reports its buffers to it) and shown next
+to the size of the output paths themselves.
+
+Usage:
+    python -m benchmarks.bench_path_generation
+    python -m benchmarks.bench_path_generation --paths 100000 --assets 50 --dtype float32
+"""
+
+import argparse
+import sys
+import time
+import tracemalloc
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+from loguru import logger
+
+from src.monte_carlo.models import PathDType
+from src.monte_carlo.simulator import MonteCarloSimulator
+
+
+def full_tensor_paths(
+    simulator: MonteCarloSimulator,
+    prices: Dict[str, float],
+    volatilities: Dict[str, float],
+    cholesky: np.ndarray
+) -> Dict[str, np.ndarray]:
+    """Path generation as implemented before block-wise generation"""
+    num_paths, num_days = simulator.config.num_paths, simulator.config.num_days
+    z_independent = simulator.rng.standard_normal((num_paths, num_days, len(prices)))
+    z_correlated = np.einsum('ijk,lk->ijl', z_independent, cholesky)
+
+    result = {}
+    dt = 1 / 252
+    for i, symbol in enumerate(prices):
+        vol = volatilities[symbol]
+        daily_drift = (simulator.config.risk_free_rate - 0.5 * vol ** 2) * dt
+        log_returns = daily_drift + vol * np.sqrt(dt) * z_correlated[:, :, i]
+        paths = np.zeros((num_paths, num_days + 1))
+        paths[:, 0] = prices[symbol]
+        paths[:, 1:] = prices[symbol] * np.exp(np.cumsum(log_returns, axis=1))
+        result[symbol] = paths
+    return result
+
+
+def measure(func: Callable[[], Dict[str, np.ndarray]]) -> Tuple[float, int, int]:
+    """Wall time, tracemalloc peak bytes and output bytes of one call"""
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak, sum(paths.nbytes for paths in result.values())
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Benchmark correlated path generation")
+    parser.add_argument("--paths", type=int, default=20_000)
+    parser.add_argument("--days", type=int, default=30)
+    parser.add_argument("--assets", type=int, default=50)
+    parser.add_argument("--dtype", default="float64", choices=["float64", "float32"])
+    parser.add_argument("--no-baseline", action="store_true", help="Skip the full-tensor version")
+    args = parser.parse_args(argv)
+
+    logger.remove()
+    logger.add(sys.stderr, level="WARNING")
+
+    symbols = [f"SYM{i}" for i in range(args.assets)]
+    prices = {symbol: 100.0 + i for i, symbol in enumerate(symbols)}
+    volatilities = {symbol: 0.15 + 0.005 * i for i, symbol in enumerate(symbols)}
+    correlation = np.full((args.assets, args.assets), 0.4) + 0.6 * np.eye(args.assets)
+    cholesky = np.linalg.cholesky(correlation)
+
+    def simulator(dtype: PathDType = "float64") -> MonteCarloSimulator:
+        return MonteCarloSimulator(
+            num_paths=args.paths, num_days=args.days, random_seed=0, dtype=dtype
+        )
+
+    runs = {
+        f"block-wise ({args.dtype})": lambda: simulator(args.dtype)._correlated_paths(
+            prices, volatilities, cholesky, None, num_paths=args.paths
+        ),
+    }
+    if not args.no_baseline:
+        runs["full tensor (float64)"] = lambda: full_tensor_paths(
+            simulator(), prices, volatilities, cholesky
+        )
+
+    print(f"{args.paths:,} paths x {args.days} days x {args.assets} assets")
+    print(f"{'method':<24} {'time (s)':>9} {'peak (MB)':>10} {'output (MB)':>12} {'overhead':>9}")
+    for name, run in runs.items():
+        elapsed, peak, output = measure(run)
+        print(
+            f"{name:<24} {elapsed:>9.2f} {peak / 2 ** 20:>10.0f} {output / 2 ** 20:>12.0f} "
+            f"{peak / output:>8.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
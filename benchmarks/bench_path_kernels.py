@@ -0,0 +1,85 @@
+"""
+Benchmark - NumPy vs Numba path kernels
+
+Times the three simulator inner loops (GBM path construction, option
+repricing along paths, per-path drawdown scan) and a full portfolio
+simulation on the synthetic option book with each backend, after a warm-up
+call so JIT compilation is excluded. Without numba only the NumPy column is
+reported.
+
+Usage:
+    python -m benchmarks.bench_path_kernels
+    python -m benchmarks.bench_path_kernels --paths 200000 --days 60
+"""
+
+import argparse
+import sys
+import time
+from typing import Callable, List, Optional
+
+import numpy as np
+from loguru import logger
+
+from src.monte_carlo import kernels
+from src.monte_carlo.simulator import MonteCarloSimulator
+
+from .portfolios import option_book
+
+
+def best_time(func: Callable[[], object], repeat: int = 3) -> float:
+    """Best wall time of repeat runs in seconds (after one warm-up run)"""
+    func()
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Path kernel backend benchmark")
+    parser.add_argument("--paths", type=int, default=100_000)
+    parser.add_argument("--days", type=int, default=30)
+    parser.add_argument("--legs", type=int, default=40)
+    args = parser.parse_args(argv)
+
+    logger.remove()
+    logger.add(sys.stderr, level="WARNING")
+
+    backends = ["numpy"] + (["numba"] if kernels.NUMBA_AVAILABLE else [])
+    if not kernels.NUMBA_AVAILABLE:
+        print("numba not installed - NumPy backend only (pip install numba)")
+
+    z = np.random.default_rng(0).standard_normal((args.paths, args.days))
+    paths = np.empty((args.paths, args.days + 1))
+    kernels.gbm_paths(z, 0.0, 0.015, 100.0, paths)
+    time_to_expiry = np.maximum(20 - np.arange(args.days + 1), 0) / 365.0
+    positions, market_data = option_book(args.legs)
+
+    cases = {
+        "gbm_paths": lambda backend: kernels.gbm_paths(
+            z, 0.0, 0.015, 100.0, paths, backend
+        ),
+        "option_prices": lambda backend: kernels.option_prices(
+            paths, 101.0, time_to_expiry, 0.05, 0.3, True, backend
+        ),
+        "max_drawdowns": lambda backend: kernels.max_drawdowns(paths, backend),
+        f"simulate_portfolio ({args.legs} legs)": lambda backend: MonteCarloSimulator(
+            num_paths=args.paths, num_days=args.days, random_seed=0, backend=backend
+        ).simulate_portfolio(positions, market_data),
+    }
+
+    print(f"{args.paths:,} paths, {args.days} days")
+    print(f"  {'kernel':<32}" + "".join(f"{backend:>12}" for backend in backends))
+    for name, case in cases.items():
+        repeat = 1 if name.startswith("simulate") else 3
+        timings = [
+            best_time(lambda case=case, backend=backend: case(backend), repeat)
+            for backend in backends
+        ]
+        print(f"  {name:<32}" + "".join(f"{seconds:>10.3f} s" for seconds in timings))
+
+
+if __name__ == "__main__":
+    main()
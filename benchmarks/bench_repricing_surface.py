@@ -0,0 +1,61 @@
+"""
+Benchmark - interpolated repricing surfaces vs exact Black-Scholes along paths
+
+Simulates the synthetic option book twice on the same seed, once pricing
+every leg with Black-Scholes at every (path, day) point and once with one
+repricing surface per underlying, and reports run time, the largest surface error
+found by the build-time check, and the largest difference in final
+portfolio value and VaR between the two runs.
+
+Usage:
+    python -m benchmarks.bench_repricing_surface
+    python -m benchmarks.bench_repricing_surface --paths 200000 --legs 1000
+"""
+
+import argparse
+import sys
+import time
+from typing import List, Optional
+
+import numpy as np
+from loguru import logger
+
+from src.monte_carlo.simulator import MonteCarloSimulator
+
+from .portfolios import option_book
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Repricing surface benchmark")
+    parser.add_argument("--paths", type=int, default=50_000)
+    parser.add_argument("--days", type=int, default=30)
+    parser.add_argument("--legs", type=int, default=40)
+    args = parser.parse_args(argv)
+
+    logger.remove()
+    logger.add(sys.stderr, level="WARNING")
+
+    positions, market_data = option_book(args.legs)
+    print(f"{args.legs} option legs, {args.paths:,} paths, {args.days} days")
+
+    results = {}
+    for repricing in ("exact", "surface"):
+        simulator = MonteCarloSimulator(
+            num_paths=args.paths, num_days=args.days, random_seed=0, repricing=repricing
+        )
+        start = time.perf_counter()
+        results[repricing] = simulator.simulate_portfolio(positions, market_data)
+        seconds = time.perf_counter() - start
+        print(f"  {repricing:<8} {seconds:>7.2f} s")
+
+    surfaces = simulator._surfaces.values()
+    exact, surface = results["exact"], results["surface"]
+    print(f"  surfaces: {len(surfaces)}, nodes {min(s.num_nodes for s in surfaces)}"
+          f"-{max(s.num_nodes for s in surfaces)}, "
+          f"max checked error ${max(s.max_error for s in surfaces):.1e}/share")
+    print(f"  max |final value difference|: ${np.abs(surface.final_values - exact.final_values).max():.2f}")
+    print(f"  VaR 95: exact ${exact.statistics.var_95:,.2f}, surface ${surface.statistics.var_95:,.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""
+Benchmark - full-revaluation scenario grid vs delta-gamma-vega approximation
+
+Reprices a synthetic option book on a spot x IV x time grid with
+GreeksCalculator.scenario_grid, checks it against pricing every cell
+directly with BlackScholesModel.batch_price, and reports how far the
+Taylor approximation in scenario_analysis is from the exact P&L.
+
+Usage:
+    python -m benchmarks.bench_scenario_grid
+    python -m benchmarks.bench_scenario_grid --legs 1000 --spot 50 --iv 50 --days 10
+"""
+
+import argparse
+import sys
+import time
+from typing import List, Optional
+
+import numpy as np
+from loguru import logger
+
+from src.greeks.black_scholes import BlackScholesModel
+from src.greeks.calculator import GreeksCalculator
+
+from .portfolios import option_book
+
+
+def direct_grid(
+    calculator: GreeksCalculator,
+    positions: list,
+    market_data: dict,
+    spot_changes: np.ndarray,
+    iv_changes: np.ndarray,
+    days: np.ndarray
+) -> np.ndarray:
+    """Reference P&L: every leg priced at every grid point, one time step at a time"""
+    legs = [
+        (
+            market_data[p.con_id].underlying_price, p.option_details.strike,
+            p.option_details.days_to_expiry, market_data[p.con_id].implied_volatility,
+            p.option_details.is_call, p.position * p.option_details.multiplier
+        )
+        for p in positions
+    ]
+    spot, strike, dte, volatility, is_call, quantity = (
+        np.array(col) for col in zip(*legs, strict=True)
+    )
+    r = calculator.risk_free_rate
+    base = BlackScholesModel.batch_price(spot, strike, dte / 365.0, r, volatility, is_call) @ quantity
+
+    grid = np.empty((len(spot_changes), len(iv_changes), len(days)))
+    for k, day in enumerate(days):
+        prices = BlackScholesModel.batch_price(
+            spot * (1 + spot_changes[:, None, None] / 100),
+            strike,
+            np.maximum(dte - day, 0) / 365.0,
+            r,
+            volatility * (1 + iv_changes[None, :, None] / 100),
+            is_call
+        )
+        grid[:, :, k] = prices @ quantity - base
+    return grid
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Scenario grid full revaluation benchmark")
+    parser.add_argument("--legs", type=int, default=1000)
+    parser.add_argument("--spot", type=int, default=50, help="Spot shocks (-30%% .. +30%%)")
+    parser.add_argument("--iv", type=int, default=50, help="IV shocks (-50%% .. +100%%)")
+    parser.add_argument("--days", type=int, default=10, help="Time steps (0 .. 20 days)")
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    logger.remove()
+    logger.add(sys.stderr, level="WARNING")
+
+    positions, market_data = option_book(args.legs)
+    calculator = GreeksCalculator()
+    spot_changes = np.linspace(-30, 30, args.spot)
+    iv_changes = np.linspace(-50, 100, args.iv)
+    days = np.round(np.linspace(0, 20, args.days))
+
+    grid_axes = (spot_changes.tolist(), iv_changes.tolist(), [int(day) for day in days])
+
+    timings = []
+    for _ in range(args.repeats):
+        start = time.perf_counter()
+        grid = calculator.scenario_grid(positions, market_data, *grid_axes)
+        timings.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    reference = direct_grid(calculator, positions, market_data, spot_changes, iv_changes, days)
+    direct_seconds = time.perf_counter() - start
+
+    # Taylor approximation on integer percent shocks at day 0
+    spot_int: List[float] = [-30, -20, -10, -5, 0, 5, 10, 20, 30]
+    iv_int: List[float] = [-50, -20, 0, 20, 50, 100]
+    taylor = calculator.scenario_analysis(positions, market_data, spot_int, iv_int)
+    exact = calculator.scenario_grid(positions, market_data, spot_int, iv_int)[:, :, 0]
+    taylor_error = max(
+        abs(taylor[f"spot_{s:+d}%"][f"iv_{v:+d}%"] - exact[i, j])
+        for i, s in enumerate(spot_int) for j, v in enumerate(iv_int)
+    )
+
+    print(f"{args.legs:,} legs x {args.spot}x{args.iv}x{args.days} grid ({grid.size:,} points)")
+    print(f"  scenario_grid:        {min(timings):.3f} s")
+    print(f"  direct batch_price:   {direct_seconds:.3f} s")
+    print(f"  max |grid - direct|:  ${np.abs(grid - reference).max():.2e}")
+    print(f"  P&L range:            ${grid.min():,.0f} .. ${grid.max():,.0f}")
+    print(f"  max Taylor error:     ${taylor_error:,.0f}")
+
+
+if __name__ == "__main__":
+    main()
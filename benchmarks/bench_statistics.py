@@ -0,0 +1,109 @@
+"""
+Benchmark - Monte Carlo statistics stage
+
+Times MonteCarloSimulator's statistics stage (percentiles, VaR/CVaR,
+moments, drawdowns, Sharpe/Sortino) on synthetic portfolio value paths, and
+compares it against the previous implementation: a Python loop over paths for
+drawdowns and a separate np.percentile pass per quantile.
+
+Usage:
+    python -m benchmarks.bench_statistics
+    python -m benchmarks.bench_statistics --paths 10000 100000 1000000 --days 30
+"""
+
+import argparse
+import time
+from typing import Callable, List, Optional
+
+import numpy as np
+from scipy import stats as scipy_stats
+
+from src.monte_carlo.models import PercentileResults
+from src.monte_carlo.simulator import MonteCarloSimulator
+
+
+def synthetic_paths(num_paths: int, num_days: int, seed: int = 0) -> np.ndarray:
+    """GBM portfolio value paths starting at 100,000"""
+    rng = np.random.default_rng(seed)
+    log_returns = -0.00005 + 0.012 * rng.standard_normal((num_paths, num_days))
+    paths = np.empty((num_paths, num_days + 1))
+    paths[:, 0] = 100_000.0
+    paths[:, 1:] = 100_000.0 * np.exp(np.cumsum(log_returns, axis=1))
+    return paths
+
+
+def vectorized_statistics(simulator: MonteCarloSimulator, paths: np.ndarray) -> None:
+    initial_value = float(paths[0, 0])
+    final_values = np.array(paths[:, -1])
+    pnl = final_values - initial_value
+    percentiles = PercentileResults.from_array(final_values)
+    simulator._calculate_statistics(paths, initial_value, final_values, pnl, percentiles)
+
+
+def baseline_statistics(simulator: MonteCarloSimulator, paths: np.ndarray) -> None:
+    """Statistics as computed before the vectorized kernel"""
+    initial_value = float(paths[0, 0])
+    final_values = paths[:, -1]
+    pnl = final_values - initial_value
+
+    for q in (5, 1):
+        np.percentile(final_values, q)
+    for q in (5, 1):
+        threshold = np.percentile(final_values, q)
+        np.mean(final_values[final_values <= threshold])
+    for q in (1, 5, 10, 25, 50, 75, 90, 95, 99):
+        np.percentile(final_values, q)
+
+    drawdowns = []
+    for path in paths:
+        running_max = np.maximum.accumulate(path)
+        drawdowns.append(np.max((running_max - path) / running_max))
+
+    daily_returns = np.diff(paths, axis=1) / paths[:, :-1]
+    np.mean(daily_returns), np.std(daily_returns)
+    np.std(daily_returns[daily_returns < 0])
+    np.mean(pnl < 0), np.mean(pnl > 0)
+    scipy_stats.skew(pnl), scipy_stats.kurtosis(pnl)
+
+
+def best_time(func: Callable[[], None], repeat: int) -> float:
+    """Best wall time of repeat runs in seconds"""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the Monte Carlo statistics stage")
+    parser.add_argument("--paths", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--days", type=int, default=30)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--no-baseline", action="store_true", help="Skip the previous implementation")
+    args = parser.parse_args(argv)
+
+    simulator = MonteCarloSimulator(num_days=args.days)
+
+    print(f"{'paths':>10} {'vectorized (s)':>15} {'Mpaths/s':>9} {'baseline (s)':>13} {'speedup':>8}")
+    for num_paths in args.paths:
+        paths = synthetic_paths(num_paths, args.days)
+        vectorized = best_time(
+            lambda paths=paths: vectorized_statistics(simulator, paths), args.repeat
+        )
+
+        if args.no_baseline:
+            baseline_text, speedup_text = "-", "-"
+        else:
+            baseline = best_time(lambda paths=paths: baseline_statistics(simulator, paths), 1)
+            baseline_text, speedup_text = f"{baseline:.3f}", f"{baseline / vectorized:.1f}x"
+
+        print(
+            f"{num_paths:>10,} {vectorized:>15.3f} {num_paths / vectorized / 1e6:>9.2f} "
+            f"{baseline_text:>13} {speedup_text:>8}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+"""
+Benchmark - stress scenarios on common random numbers vs independent runs
+
+The independent baseline is the previous stress_test: one simulate_portfolio
+call per scenario, each with fresh draws. The batched run simulates base
+paths once and transforms them per scenario. Besides run time, the noise
+column is the standard deviation across seeds of each scenario's expected
+P&L minus the base scenario's: with common random numbers the comparison
+between scenarios is no longer dominated by Monte Carlo noise.
+
+Usage:
+    python -m benchmarks.bench_stress_test
+    python -m benchmarks.bench_stress_test --paths 20000 --seeds 8
+"""
+
+import argparse
+import sys
+import time
+from typing import Dict, List, Optional
+
+import numpy as np
+from loguru import logger
+
+from src.ib_client.models import MarketData
+from src.monte_carlo.models import SimulationResult
+from src.monte_carlo.simulator import MonteCarloSimulator
+
+from .portfolios import sample_correlation, sample_portfolio
+
+SCENARIOS = {
+    "base": {},
+    "market_crash_10pct": {"_all": -0.10},
+    "market_crash_20pct": {"_all": -0.20},
+    "market_rally_10pct": {"_all": 0.10},
+    "volatility_spike": {"_vol_mult": 1.5},
+    "volatility_collapse": {"_vol_mult": 0.5},
+}
+
+
+def sample_market_data() -> Dict[int, MarketData]:
+    """Quotes for the sample portfolio so price and volatility shocks apply"""
+    return {
+        1: MarketData(symbol="SPY", con_id=1, bid=469.9, ask=470.1),
+        2: MarketData(symbol="SPY", con_id=2, bid=6.9, ask=7.1,
+                      underlying_price=470.0, implied_volatility=0.3),
+        3: MarketData(symbol="QQQ", con_id=3, bid=399.9, ask=400.1),
+        4: MarketData(symbol="QQQ", con_id=4, bid=4.9, ask=5.1,
+                      underlying_price=400.0, implied_volatility=0.35),
+    }
+
+
+def independent_runs(simulator: MonteCarloSimulator, positions, market_data, correlation):
+    """Previous behaviour: a separate simulate_portfolio run per scenario"""
+    return {
+        name: simulator.simulate_portfolio(
+            positions, simulator._apply_scenario(market_data, adjustments), correlation
+        )
+        for name, adjustments in SCENARIOS.items()
+    }
+
+
+def expected_pnl_differences(results: Dict[str, SimulationResult]) -> Dict[str, float]:
+    """Each scenario's expected P&L minus the base scenario's"""
+    base = results["base"].statistics.mean
+    return {
+        name: result.statistics.mean - base for name, result in results.items() if name != "base"
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Stress test common random numbers benchmark")
+    parser.add_argument("--paths", type=int, default=10_000)
+    parser.add_argument("--days", type=int, default=30)
+    parser.add_argument("--seeds", type=int, default=6)
+    args = parser.parse_args(argv)
+
+    logger.remove()
+    logger.add(sys.stderr, level="WARNING")
+
+    positions = sample_portfolio()
+    market_data = sample_market_data()
+    correlation = sample_correlation()
+
+    timings = {"independent": 0.0, "common": 0.0}
+    differences = {"independent": [], "common": []}
+    for seed in range(args.seeds):
+        simulator = MonteCarloSimulator(num_paths=args.paths, num_days=args.days, random_seed=seed)
+        start = time.perf_counter()
+        results = independent_runs(simulator, positions, market_data, correlation)
+        timings["independent"] += time.perf_counter() - start
+        differences["independent"].append(expected_pnl_differences(results))
+
+        simulator = MonteCarloSimulator(num_paths=args.paths, num_days=args.days, random_seed=seed)
+        start = time.perf_counter()
+        results = simulator.stress_test(positions, market_data, SCENARIOS, correlation)
+        timings["common"] += time.perf_counter() - start
+        differences["common"].append(expected_pnl_differences(results))
+
+    print(f"{len(SCENARIOS)} scenarios, {args.paths:,} paths, {args.days} days, {args.seeds} seeds")
+    shocked = [name for name in SCENARIOS if name != "base"]
+    print(f"{'mode':<14} {'s/run':>7}" + "".join(f" {name:>21}" for name in shocked))
+    for mode in ("independent", "common"):
+        noise = [
+            float(np.std([run[name] for run in differences[mode]], ddof=1)) for name in shocked
+        ]
+        line = f"{mode:<14} {timings[mode] / args.seeds:>7.3f}"
+        print(line + "".join(f" {value:>21,.2f}" for value in noise))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+Benchmark - variance reduction: standard error and time to a target accuracy
+
+Simulates the sample option portfolio with independent seeds for each
+method and reports the standard error of the mean, VaR and CVaR across
+replications. The speedup column is the work-normalized efficiency
+(SE_plain / SE_method)^2 * (time_plain / time_method): how many times less
+run time the method needs to reach the same confidence interval.
+
+Usage:
+    python -m benchmarks.bench_variance_reduction
+    python -m benchmarks.bench_variance_reduction --paths 5000 --replications 32
+"""
+
+import argparse
+import sys
+import time
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+from loguru import logger
+
+from src.monte_carlo.simulator import MonteCarloSimulator
+
+from .portfolios import sample_correlation, sample_portfolio
+
+# Method name -> MonteCarloSimulator keyword arguments
+METHODS: Dict[str, Dict[str, Any]] = {
+    "plain": {},
+    "control variate": {"use_control_variate": True},
+    "importance sampling": {"importance_sampling": True},
+}
+
+METRICS = ("mean", "var_95", "cvar_95", "var_99", "cvar_99")
+
+
+def replicate(
+    options: Dict[str, Any],
+    num_paths: int,
+    num_days: int,
+    replications: int
+) -> Dict[str, float]:
+    """Standard error of each metric across seeds, and mean seconds per run"""
+    positions = sample_portfolio()
+    correlation = sample_correlation()
+    samples: Dict[str, List[float]] = {metric: [] for metric in METRICS}
+
+    start = time.perf_counter()
+    for seed in range(replications):
+        simulator = MonteCarloSimulator(
+            num_paths=num_paths, num_days=num_days, random_seed=seed, **options
+        )
+        stats = simulator.simulate_portfolio(positions, correlation_matrix=correlation).statistics
+        for metric in METRICS:
+            samples[metric].append(getattr(stats, metric))
+
+    result = {metric: float(np.std(values, ddof=1)) for metric, values in samples.items()}
+    result["seconds"] = (time.perf_counter() - start) / replications
+    return result
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Variance reduction efficiency report")
+    parser.add_argument("--paths", type=int, default=10_000)
+    parser.add_argument("--days", type=int, default=30)
+    parser.add_argument("--replications", type=int, default=24)
+    args = parser.parse_args(argv)
+
+    logger.remove()
+    logger.add(sys.stderr, level="WARNING")
+
+    print(f"{args.paths:,} paths, {args.days} days, {args.replications} replications")
+    header = f"{'method':<22}" + "".join(f"{'SE ' + m:>12} {'speedup':>8}" for m in METRICS)
+    print(header + f" {'s/run':>7}")
+
+    baseline = None
+    for name, options in METHODS.items():
+        result = replicate(options, args.paths, args.days, args.replications)
+        baseline = baseline or result
+
+        line = f"{name:<22}"
+        for metric in METRICS:
+            efficiency = (
+                (baseline[metric] / result[metric]) ** 2 * baseline["seconds"] / result["seconds"]
+                if result[metric] > 0 else float("inf")
+            )
+            line += f"{result[metric]:>12.2f} {efficiency:>7.1f}x"
+        print(line + f" {result['seconds']:>7.3f}")
+
+
+if __name__ == "__main__":
+    main()
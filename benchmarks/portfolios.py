@@ -0,0 +1,74 @@
+"""
+Sample portfolios shared by the benchmarks
+"""
+
+from datetime import date, timedelta
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from src.ib_client.models import MarketData, OptionDetails, Position
+
+# Underlying -> spot price for the synthetic option book
+BOOK_UNDERLYINGS = {"SPY": 470.0, "QQQ": 400.0, "IWM": 200.0, "AAPL": 190.0, "NVDA": 480.0}
+
+
+def sample_portfolio() -> List[Position]:
+    """Two correlated underlyings with a protective put and a short call"""
+    expiry = date.today() + timedelta(days=45)
+    return [
+        Position(symbol="SPY", sec_type="STK", con_id=1, position=100,
+                 avg_cost=450.0, market_price=470.0, market_value=47000.0),
+        Position(symbol="SPY", sec_type="OPT", con_id=2, position=1,
+                 avg_cost=8.0, market_price=7.0, market_value=700.0,
+                 option_details=OptionDetails(strike=450.0, right="P", expiry=expiry)),
+        Position(symbol="QQQ", sec_type="STK", con_id=3, position=80,
+                 avg_cost=380.0, market_price=400.0, market_value=32000.0),
+        Position(symbol="QQQ", sec_type="OPT", con_id=4, position=-1,
+                 avg_cost=6.0, market_price=5.0, market_value=-500.0,
+                 option_details=OptionDetails(strike=420.0, right="C", expiry=expiry)),
+    ]
+
+
+def sample_correlation() -> np.ndarray:
+    """Correlation matrix for the sample portfolio's underlyings (SPY, QQQ)"""
+    return np.array([[1.0, 0.85], [0.85, 1.0]])
+
+
+def option_book(
+    num_legs: int = 1000,
+    seed: int = 0
+) -> Tuple[List[Position], Dict[int, MarketData]]:
+    """
+    Synthetic book of long and short option legs across five underlyings
+
+    Strikes span 70%-130% of spot and expiries 1-365 days, so the book has
+    deep ITM/OTM short options that a Taylor expansion misprices.
+
+    Returns:
+        (positions, market data with underlying price and IV per leg)
+    """
+    rng = np.random.default_rng(seed)
+    symbols = list(BOOK_UNDERLYINGS)
+    positions: List[Position] = []
+    market_data: Dict[int, MarketData] = {}
+
+    for con_id in range(1, num_legs + 1):
+        symbol = symbols[rng.integers(len(symbols))]
+        spot = BOOK_UNDERLYINGS[symbol]
+        positions.append(Position(
+            symbol=symbol, sec_type="OPT", con_id=con_id,
+            position=int(rng.choice([-10, -5, -1, 1, 5, 10])),
+            avg_cost=5.0, market_price=5.0, market_value=500.0,
+            option_details=OptionDetails(
+                strike=round(spot * rng.uniform(0.7, 1.3)),
+                right="C" if rng.random() < 0.5 else "P",
+                expiry=date.today() + timedelta(days=int(rng.integers(1, 366)))
+            )
+        ))
+        market_data[con_id] = MarketData(
+            symbol=symbol, con_id=con_id, last=5.0,
+            underlying_price=spot, implied_volatility=float(rng.uniform(0.15, 0.6))
+        )
+
+    return positions, market_data
@@ -0,0 +1,64 @@
+"""
+Validation harness - float32 vs float64 simulation accuracy
+
+Runs the sample option portfolio in both precisions on the same random
+stream, prints the statistics and relative errors, and exits with status 1
+if any relative error exceeds the tolerance.
+
+Usage:
+    python -m benchmarks.validate_float32
+    python -m benchmarks.validate_float32 --paths 100000 --days 252 --tolerance 5e-4
+"""
+
+import argparse
+import sys
+from typing import List, Optional
+
+from loguru import logger
+
+from src.monte_carlo.validation import (
+    DEFAULT_FLOAT32_TOLERANCE,
+    VALIDATED_METRICS,
+    validate_float32,
+)
+
+from .portfolios import sample_correlation, sample_portfolio
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Validate float32 simulation against float64")
+    parser.add_argument("--paths", type=int, default=50_000)
+    parser.add_argument("--days", type=int, default=30)
+    parser.add_argument("--sampler", default="pseudo", choices=["pseudo", "sobol"])
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_FLOAT32_TOLERANCE)
+    args = parser.parse_args(argv)
+
+    logger.remove()
+    logger.add(sys.stderr, level="WARNING")
+
+    report = validate_float32(
+        sample_portfolio(),
+        correlation_matrix=sample_correlation(),
+        tolerance=args.tolerance,
+        raise_on_failure=False,
+        num_paths=args.paths,
+        num_days=args.days,
+        sampler=args.sampler
+    )
+
+    print(f"{args.paths:,} paths, {args.days} days, tolerance {args.tolerance:.0e}")
+    print(f"{'metric':<10} {'float64':>14} {'float32':>14} {'rel error':>10}")
+    for metric in VALIDATED_METRICS:
+        error = report.relative_errors[metric]
+        flag = "" if error <= args.tolerance else "  FAIL"
+        print(
+            f"{metric:<10} {report.reference[metric]:>14,.2f} "
+            f"{report.candidate[metric]:>14,.2f} {error:>10.2e}{flag}"
+        )
+
+    print("PASSED" if report.passed else "FAILED")
+    return 0 if report.passed else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -10,12 +10,15 @@ Native Messaging 协议:
 
 import sys
 import json
+import time
 import struct
+import hashlib
 import logging
 import traceback
+from collections import OrderedDict
 from pathlib import Path
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 # 添加项目根目录到路径
 PROJECT_ROOT = Path(__file__).parent.parent.parent
@@ -32,22 +35,127 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+if TYPE_CHECKING:
+    from src.advisor.analyzer import PortfolioAdvisor
+    from src.advisor.models import PortfolioAdvice
+    from src.greeks.calculator import GreeksCalculator
+    from src.greeks.models import PortfolioGreeks
+    from src.ib_client.client import IBClient
+    from src.ib_client.models import MarketData, Position
+    from src.monte_carlo.models import SimulationResult
+    from src.monte_carlo.simulator import MonteCarloSimulator
+
+
+class ResultCache:
+    """
+    Native Host 计算结果缓存
+
+    键 = action + 请求参数 + 快照哈希; 每个 action 有独立的 TTL,
+    超过 max_entries 时按 LRU 淘汰. 快照哈希覆盖持仓 (合约、数量、成本)
+    和计算所用的行情 (mid / last / IV / 标的价格), 持仓或行情变化时
+    哈希随之变化, 旧条目自然失效.
+    """
+
+    DEFAULT_TTLS = {
+        'get_portfolio': 30.0,
+        'get_positions': 30.0,
+        'get_greeks': 15.0,
+        'get_risk': 120.0,
+    }
+
+    def __init__(self, max_entries: int = 32, ttls: Optional[Dict[str, float]] = None) -> None:
+        self.max_entries = max_entries
+        self.ttls = dict(self.DEFAULT_TTLS, **(ttls or {}))
+        self._entries: OrderedDict[str, tuple] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def snapshot_hash(
+        positions: List["Position"],
+        market_data: Optional[Dict[int, "MarketData"]] = None
+    ) -> str:
+        """
+        持仓与行情快照的内容哈希
 
-class NativeMessagingHost:
-    """Native Messaging 主机"""
+        每个持仓取 (合约、数量、成本); 给出 market_data 时再加上该合约的
+        mid、last、隐含波动率和标的价格, 即希腊值和模拟实际使用的行情.
+        """
+        market_data = market_data or {}
+        rows = []
+        for p in positions:
+            md = market_data.get(p.con_id)
+            quote = (md.mid, md.last, md.implied_volatility, md.underlying_price) if md else None
+            rows.append((p.con_id, p.position, p.avg_cost, quote))
+        rows.sort(key=lambda row: row[0])
+        return hashlib.sha1(json.dumps(rows).encode('utf-8')).hexdigest()
+
+    @staticmethod
+    def make_key(action: str, params: Dict, snapshot_hash: str) -> str:
+        """缓存键: action | 排序后的请求参数 | 快照哈希"""
+        return f"{action}|{json.dumps(params, sort_keys=True, default=str)}|{snapshot_hash}"
+
+    def get(self, key: str) -> Optional[Dict]:
+        """命中且未过期时返回缓存值"""
+        entry = self._entries.get(key)
+        if entry is None or entry[0] < time.monotonic():
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[1]
 
-    def __init__(self):
-        self.ib_client = None
-        self.greeks_calculator = None
-        self.monte_carlo = None
-        self.advisor = None
+    def put(self, key: str, action: str, value: Dict) -> None:
+        """写入条目 (按 action 的 TTL), 超出容量时淘汰最久未用的条目"""
+        ttl = self.ttls.get(action, 30.0)
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+class NativeMessagingHost:
+    """
+    Native Messaging 主机
+
+    扩展通过 connectNative 建立长连接, 主机进程在整个连接期间常驻:
+    IB 连接、希腊值计算器、蒙特卡洛模拟器和顾问实例在消息之间复用,
+    刷新请求直接使用热状态, 连接断开时按需重连.
+    """
+
+    # IB 连接健康检查间隔（秒）
+    HEALTH_CHECK_INTERVAL = 30.0
+
+    # 可缓存的 action 及其在完整投资组合数据中需要的字段
+    CACHED_ACTION_FIELDS = {
+        'get_positions': ('positions',),
+        'get_greeks': ('greeks',),
+        'get_risk': ('risk',),
+        'get_portfolio': ('account', 'greeks', 'risk', 'recommendations', 'positions'),
+    }
+
+    def __init__(self) -> None:
+        self.ib_client: Optional[IBClient] = None
+        self.greeks_calculator: Optional[GreeksCalculator] = None
+        self.monte_carlo: Optional[MonteCarloSimulator] = None
+        self.advisor: Optional[PortfolioAdvisor] = None
+        self._connection_params: Dict[str, Any] = {}
+        self._last_health_check = 0.0
+        self.result_cache = ResultCache()
         logger.info("Native Host 初始化")
 
-    def run(self):
+    def run(self) -> None:
         """主循环：读取消息并处理"""
         logger.info("Native Host 开始运行")
 
         while True:
+            message = None
             try:
                 message = self._read_message()
                 if message is None:
@@ -57,14 +165,32 @@ class NativeMessagingHost:
                 logger.debug(f"收到消息: {message}")
                 response = self._handle_message(message)
                 logger.debug(f"发送响应: {response}")
-                self._send_message(response)
+                self._send_message(self._tag_response(message, response))
 
             except Exception as e:
                 logger.error(f"处理消息时出错: {e}\n{traceback.format_exc()}")
-                self._send_message({
+                self._send_message(self._tag_response(message, {
                     "success": False,
                     "error": str(e)
-                })
+                }))
+
+        self.shutdown()
+
+    def shutdown(self) -> None:
+        """断开常驻的 IB 连接"""
+        if self.ib_client is not None:
+            try:
+                self.ib_client.disconnect()
+            except Exception as e:
+                logger.warning(f"断开 IB 连接时出错: {e}")
+            self.ib_client = None
+
+    @staticmethod
+    def _tag_response(message: Optional[Dict], response: Dict) -> Dict:
+        """回传 request_id, 让长连接上的扩展把响应对应到请求"""
+        if isinstance(message, dict) and 'request_id' in message:
+            response = dict(response, request_id=message['request_id'])
+        return response
 
     def _read_message(self) -> Optional[Dict]:
         """读取 Native Messaging 格式的消息"""
@@ -79,7 +205,7 @@ class NativeMessagingHost:
         message_data = sys.stdin.buffer.read(message_length)
         return json.loads(message_data.decode('utf-8'))
 
-    def _send_message(self, message: Dict):
+    def _send_message(self, message: Dict) -> None:
         """发送 Native Messaging 格式的响应"""
         encoded = json.dumps(message, ensure_ascii=False).encode('utf-8')
 
@@ -122,57 +248,120 @@ class NativeMessagingHost:
             "timestamp": datetime.now().isoformat()
         }
 
-    def _handle_get_portfolio(self, params: Dict) -> Dict:
-        """获取完整投资组合数据"""
-        try:
-            # 尝试连接真实的 IB API
-            try:
-                from src.ib_client.client import IBClient
-                from src.greeks.calculator import GreeksCalculator
-                from src.monte_carlo.simulator import MonteCarloSimulator
-                from src.advisor.investment_advisor import InvestmentAdvisor
+    def _ensure_services(self) -> None:
+        """按需创建计算器、模拟器和顾问, 之后的请求复用同一实例"""
+        from src.greeks.calculator import GreeksCalculator
+        from src.monte_carlo.simulator import MonteCarloSimulator
+        from src.advisor.analyzer import PortfolioAdvisor
 
-                # 连接 IB
-                ib_client = IBClient()
-                if not ib_client.connect():
-                    raise ConnectionError("无法连接到 TWS/IB Gateway")
+        if self.greeks_calculator is None:
+            self.greeks_calculator = GreeksCalculator()
+        if self.monte_carlo is None:
+            self.monte_carlo = MonteCarloSimulator()
+        if self.advisor is None:
+            self.advisor = PortfolioAdvisor()
 
-                # 获取真实数据
-                positions = ib_client.get_positions()
-                account = ib_client.get_account_summary()
+    def _get_ib_client(self, params: Dict) -> "IBClient":
+        """
+        获取常驻的 IB 连接
 
-                # 计算希腊值
-                calculator = GreeksCalculator()
-                greeks_summary = calculator.calculate_portfolio_greeks(positions)
+        首次调用时连接; 之后每 HEALTH_CHECK_INTERVAL 秒做一次心跳检测,
+        连接断开时重连; 连接参数变化时重建连接.
+        """
+        from src.ib_client.client import IBClient
 
-                # 风险分析
-                advisor = InvestmentAdvisor()
-                analysis = advisor.analyze(positions, account)
+        connection_params = {
+            "host": params.get('host', '127.0.0.1'),
+            "port": params.get('port', 7497),
+            "client_id": params.get('clientId', 1),
+        }
 
-                ib_client.disconnect()
+        if self.ib_client is not None and connection_params != self._connection_params:
+            logger.info("连接参数变化，重建 IB 连接")
+            self.shutdown()
+            self.result_cache.clear()
 
-                return {
-                    "success": True,
-                    "data": {
-                        "account": {
-                            "net_liquidation": account.get('NetLiquidation', 0),
-                            "unrealized_pnl": account.get('UnrealizedPnL', 0),
-                            "daily_pnl": account.get('RealizedPnL', 0),
-                        },
-                        "greeks": greeks_summary,
-                        "risk": analysis.get('risk_assessment', {}),
-                        "recommendations": analysis.get('recommendations', []),
-                        "positions": [self._format_position(p) for p in positions]
-                    }
-                }
+        if self.ib_client is None:
+            self.ib_client = IBClient(reconnect_delay=0.5)
+            self._connection_params = connection_params
+            if not self.ib_client.connect(**connection_params):
+                raise ConnectionError("无法连接到 TWS/IB Gateway")
+            self._last_health_check = time.monotonic()
+            return self.ib_client
+
+        now = time.monotonic()
+        if not self.ib_client.is_connected or now - self._last_health_check >= self.HEALTH_CHECK_INTERVAL:
+            if not (self.ib_client.check_connection() or self.ib_client.ensure_connected()):
+                raise ConnectionError("IB 连接已断开且重连失败")
+            self._last_health_check = now
+
+        return self.ib_client
+
+    def _handle_get_portfolio(self, params: Dict) -> Dict:
+        """获取完整投资组合数据"""
+        return self._serve_cached('get_portfolio', params)
+
+    def _serve_cached(self, action: str, params: Dict) -> Dict:
+        """
+        通过结果缓存处理 get_portfolio / get_positions / get_greeks / get_risk
+
+        持仓来自常驻连接的本地状态, 并为其保持流式行情订阅; 除
+        get_positions 外先取行情 (已收到推送的持仓直接来自本地缓存, 只有
+        尚无报价的持仓走快照), 与持仓一起计算缓存键. 未命中时只计算该
+        action 需要的部分, 并把结果同时写入可由它派生的其他 action 的条目.
+        """
+        try:
+            # 尝试使用常驻的 IB 连接
+            try:
+                ib_client = self._get_ib_client(params)
+                if ib_client.simulation_mode:
+                    raise ImportError("ib_insync 未安装")
+
+                positions = ib_client.get_positions()
+                # 持仓保持流式订阅 (只为新持仓开线), 行情直接来自本地缓存
+                ib_client.subscribe_market_data(positions)
 
             except ImportError:
                 logger.warning("IB 模块未安装，使用模拟数据")
-                return self._get_simulated_portfolio()
+                return self._project_response(action, self._get_simulated_portfolio())
 
             except ConnectionError as e:
                 logger.warning(f"IB 连接失败: {e}，使用模拟数据")
-                return self._get_simulated_portfolio()
+                return self._project_response(action, self._get_simulated_portfolio())
+
+            # get_positions 不依赖行情, 只按持仓计算哈希
+            market_data = None
+            if action != 'get_positions':
+                market_data = ib_client.get_market_data(positions)
+            snapshot_hashes = {
+                'get_positions': self.result_cache.snapshot_hash(positions),
+                'market': self.result_cache.snapshot_hash(positions, market_data),
+            }
+
+            def cache_key(cached_action: str) -> str:
+                snapshot = 'get_positions' if cached_action == 'get_positions' else 'market'
+                return self.result_cache.make_key(
+                    cached_action, params, snapshot_hashes[snapshot]
+                )
+
+            cached = self.result_cache.get(cache_key(action))
+            if cached is not None:
+                logger.debug(f"{action} 命中缓存")
+                return cached
+
+            data = self._compute_portfolio_data(action, ib_client, positions, market_data)
+            portfolio = {"success": True, "data": data}
+
+            response = None
+            for cached_action, fields in self.CACHED_ACTION_FIELDS.items():
+                if not all(field in data for field in fields):
+                    continue
+                projected = self._project_response(cached_action, portfolio)
+                self.result_cache.put(cache_key(cached_action), cached_action, projected)
+                if cached_action == action:
+                    response = projected
+
+            return response
 
         except Exception as e:
             logger.error(f"获取投资组合失败: {e}\n{traceback.format_exc()}")
@@ -181,6 +370,79 @@ class NativeMessagingHost:
                 "error": str(e)
             }
 
+    def _compute_portfolio_data(
+        self,
+        action: str,
+        ib_client: "IBClient",
+        positions: List["Position"],
+        market_data: Optional[Dict[int, "MarketData"]]
+    ) -> Dict:
+        """只计算 action 需要的部分: 持仓 -> 希腊值 -> 蒙特卡洛与建议"""
+        data = {"positions": [self._format_position(p) for p in positions]}
+        if action == 'get_positions':
+            return data
+
+        self._ensure_services()
+        greeks = self.greeks_calculator.calculate_portfolio_greeks(positions, market_data)
+        data["greeks"] = self._format_greeks(greeks)
+        if action == 'get_greeks':
+            return data
+
+        account = ib_client.get_account_summary()
+        simulation = self.monte_carlo.simulate_portfolio(positions, market_data)
+        advice = self.advisor.generate_report(positions, greeks, simulation)
+
+        data["account"] = {
+            "net_liquidation": account.net_liquidation if account else 0,
+            "unrealized_pnl": account.unrealized_pnl if account else 0,
+            "daily_pnl": account.realized_pnl if account else 0,
+        }
+        data["risk"] = self._format_risk(simulation, advice)
+        data["recommendations"] = [
+            {"priority": rec.priority.value, "message": rec.title}
+            for rec in advice.recommendations
+        ]
+        return data
+
+    def _project_response(self, action: str, portfolio: Dict) -> Dict:
+        """从完整投资组合响应中取出 action 对应的字段"""
+        if action == 'get_portfolio' or not portfolio.get('success'):
+            return portfolio
+
+        field = self.CACHED_ACTION_FIELDS[action][0]
+        return {
+            "success": True,
+            field: portfolio['data'][field]
+        }
+
+    @staticmethod
+    def _format_greeks(greeks: "PortfolioGreeks") -> Dict:
+        return {
+            "delta": greeks.total_delta,
+            "delta_dollars": greeks.total_delta_dollars,
+            "gamma": greeks.total_gamma,
+            "gamma_dollars": greeks.total_gamma_dollars,
+            "theta": greeks.total_theta,
+            "theta_dollars": greeks.total_theta_dollars,
+            "vega": greeks.total_vega,
+            "vega_dollars": greeks.total_vega_dollars,
+        }
+
+    @staticmethod
+    def _format_risk(simulation: "SimulationResult", advice: "PortfolioAdvice") -> Dict:
+        stats = simulation.statistics
+        initial_value = simulation.initial_portfolio_value
+        risk = advice.risk_assessment
+
+        return {
+            "level": risk.overall_level.value,
+            "score": risk.risk_score,
+            "var_95": stats.var_95 if stats else risk.var_95,
+            "expected_return": stats.mean - initial_value if stats else 0,
+            "max_loss": max(initial_value - stats.min_value, 0) if stats else 0,
+            "probability_loss": stats.probability_loss if stats else 0,
+        }
+
     def _get_simulated_portfolio(self) -> Dict:
         """
         返回模拟的投资组合数据（用于测试）
@@ -335,7 +597,7 @@ class NativeMessagingHost:
             "simulated": True
         }
 
-    def _format_position(self, position) -> Dict:
+    def _format_position(self, position: "Position") -> Dict:
         """格式化持仓数据"""
         return {
             "symbol": position.symbol,
@@ -817,33 +1079,15 @@ class NativeMessagingHost:
 
     def _handle_get_positions(self, params: Dict) -> Dict:
         """仅获取持仓列表"""
-        portfolio = self._handle_get_portfolio({})
-        if portfolio.get('success'):
-            return {
-                "success": True,
-                "positions": portfolio['data']['positions']
-            }
-        return portfolio
+        return self._serve_cached('get_positions', params)
 
     def _handle_get_greeks(self, params: Dict) -> Dict:
         """仅获取希腊值"""
-        portfolio = self._handle_get_portfolio({})
-        if portfolio.get('success'):
-            return {
-                "success": True,
-                "greeks": portfolio['data']['greeks']
-            }
-        return portfolio
+        return self._serve_cached('get_greeks', params)
 
     def _handle_get_risk(self, params: Dict) -> Dict:
         """仅获取风险评估"""
-        portfolio = self._handle_get_portfolio({})
-        if portfolio.get('success'):
-            return {
-                "success": True,
-                "risk": portfolio['data']['risk']
-            }
-        return portfolio
+        return self._serve_cached('get_risk', params)
 
     def _handle_test_connection(self, params: Dict) -> Dict:
         """测试 IB TWS/Gateway 连接"""
@@ -937,7 +1181,7 @@ class NativeMessagingHost:
         }
 
 
-def main():
+def main() -> None:
     """入口点"""
     host = NativeMessagingHost()
     host.run()
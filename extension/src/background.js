@@ -22,6 +22,52 @@ chrome.runtime.onMessage.addListener((message, sender, sendResponse) => {
   }
 });
 
+/**
+ * 获取常驻的 Native 端口（长连接模式）
+ * 主机进程在端口存活期间保持 IB 连接和计算实例, 断开后下次请求时重建
+ */
+function getNativePort() {
+  if (nativePort) {
+    return nativePort;
+  }
+
+  nativePort = chrome.runtime.connectNative(NATIVE_HOST_NAME);
+
+  // 按 request_id 分发响应
+  nativePort.onMessage.addListener((response) => {
+    const pending = pendingRequests.get(response.request_id);
+    if (!pending) {
+      console.warn('[Background] 未匹配的 Native 响应:', response);
+      return;
+    }
+
+    pendingRequests.delete(response.request_id);
+    clearTimeout(pending.timeout);
+    console.log('[Background] 收到 Native 响应:', response);
+
+    if (response.error) {
+      pending.reject(new Error(response.error));
+    } else {
+      pending.resolve(response);
+    }
+  });
+
+  // 端口断开: 拒绝所有未完成的请求, 下次请求时重新连接
+  nativePort.onDisconnect.addListener(() => {
+    const error = chrome.runtime.lastError;
+    console.error('[Background] Native host 断开连接:', error);
+    nativePort = null;
+
+    for (const pending of pendingRequests.values()) {
+      clearTimeout(pending.timeout);
+      pending.reject(new Error(error?.message || 'Native host 连接断开'));
+    }
+    pendingRequests.clear();
+  });
+
+  return nativePort;
+}
+
 /**
  * 处理 Native Messaging 请求
  */
@@ -30,45 +76,20 @@ async function handleNativeMessage(payload) {
 
   return new Promise((resolve, reject) => {
     try {
-      // 每次请求创建新连接（短连接模式）
-      const port = chrome.runtime.connectNative(NATIVE_HOST_NAME);
-      let responseReceived = false;
+      const port = getNativePort();
+      const id = ++requestId;
 
       // 设置超时
       const timeout = setTimeout(() => {
-        if (!responseReceived) {
-          port.disconnect();
+        if (pendingRequests.delete(id)) {
           reject(new Error('Native host 响应超时'));
         }
       }, 30000); // 30秒超时
 
-      // 监听响应
-      port.onMessage.addListener((response) => {
-        responseReceived = true;
-        clearTimeout(timeout);
-        console.log('[Background] 收到 Native 响应:', response);
-
-        if (response.error) {
-          reject(new Error(response.error));
-        } else {
-          resolve(response);
-        }
-
-        port.disconnect();
-      });
-
-      // 监听断开连接
-      port.onDisconnect.addListener(() => {
-        clearTimeout(timeout);
-        if (!responseReceived) {
-          const error = chrome.runtime.lastError;
-          console.error('[Background] Native host 断开连接:', error);
-          reject(new Error(error?.message || 'Native host 连接断开'));
-        }
-      });
+      pendingRequests.set(id, { resolve, reject, timeout });
 
       // 发送消息
-      port.postMessage(payload);
+      port.postMessage({ ...payload, request_id: id });
 
     } catch (error) {
       console.error('[Background] Native messaging 错误:', error);
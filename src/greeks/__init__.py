@@ -4,12 +4,18 @@ Greeks Calculation Module
 
 from .calculator import GreeksCalculator
 from .black_scholes import BlackScholesModel
-from .models import Greeks, PortfolioGreeks, GreeksByUnderlying
+from .incremental import IncrementalGreeksEngine
+from .models import (
+    Greeks, BatchGreeks, ImpliedVolatilityResult, PortfolioGreeks, GreeksByUnderlying
+)
 
 __all__ = [
     "GreeksCalculator",
     "BlackScholesModel",
+    "IncrementalGreeksEngine",
     "Greeks",
+    "BatchGreeks",
+    "ImpliedVolatilityResult",
     "PortfolioGreeks",
     "GreeksByUnderlying"
 ]
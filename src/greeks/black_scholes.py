@@ -6,11 +6,14 @@ and Greeks calculation.
 """
 
 import math
-from typing import Tuple
-from scipy import stats
+from typing import Tuple, Union
+import numpy as np
 from loguru import logger
 
-from .models import Greeks
+from .kernels import norm_cdf, norm_pdf, batch_norm_cdf, batch_norm_pdf
+from .models import Greeks, BatchGreeks, ImpliedVolatilityResult
+
+ArrayLike = Union[float, np.ndarray]
 
 
 class BlackScholesModel:
@@ -103,8 +106,8 @@ class BlackScholesModel:
         d2_val = cls.d2(spot, strike, time_to_expiry, rate, volatility, dividend_yield)
 
         call = (
-            spot * math.exp(-dividend_yield * time_to_expiry) * stats.norm.cdf(d1_val) -
-            strike * math.exp(-rate * time_to_expiry) * stats.norm.cdf(d2_val)
+            spot * math.exp(-dividend_yield * time_to_expiry) * norm_cdf(d1_val) -
+            strike * math.exp(-rate * time_to_expiry) * norm_cdf(d2_val)
         )
 
         return max(0, call)
@@ -131,12 +134,300 @@ class BlackScholesModel:
         d2_val = cls.d2(spot, strike, time_to_expiry, rate, volatility, dividend_yield)
 
         put = (
-            strike * math.exp(-rate * time_to_expiry) * stats.norm.cdf(-d2_val) -
-            spot * math.exp(-dividend_yield * time_to_expiry) * stats.norm.cdf(-d1_val)
+            strike * math.exp(-rate * time_to_expiry) * norm_cdf(-d2_val) -
+            spot * math.exp(-dividend_yield * time_to_expiry) * norm_cdf(-d1_val)
         )
 
         return max(0, put)
 
+    @staticmethod
+    def _broadcast_batch_inputs(
+        spot: ArrayLike,
+        strike: ArrayLike,
+        time_to_expiry: ArrayLike,
+        rate: ArrayLike,
+        volatility: ArrayLike,
+        is_call: Union[bool, np.ndarray],
+        dividend_yield: ArrayLike
+    ) -> Tuple[np.ndarray, ...]:
+        """Convert batch inputs to float/bool arrays of one broadcast shape"""
+        return tuple(np.broadcast_arrays(
+            np.asarray(spot, dtype=float),
+            np.asarray(strike, dtype=float),
+            np.asarray(time_to_expiry, dtype=float),
+            np.asarray(rate, dtype=float),
+            np.asarray(volatility, dtype=float),
+            np.asarray(is_call, dtype=bool),
+            np.asarray(dividend_yield, dtype=float)
+        ))
+
+    @staticmethod
+    def _batch_d1_d2(
+        spot: np.ndarray,
+        strike: np.ndarray,
+        time_to_expiry: np.ndarray,
+        rate: ArrayLike,
+        volatility: np.ndarray,
+        dividend_yield: ArrayLike
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Vectorized d1/d2 with the same degenerate-input rules as d1()/d2()
+
+        Returns:
+            Tuple of (d1, d2, sqrt_t) arrays; sqrt_t is 0 where T <= 0
+        """
+        valid = (time_to_expiry > 0) & (volatility > 0) & (spot > 0) & (strike > 0)
+
+        # Substitute harmless values so invalid cells don't raise warnings
+        safe_spot = np.where(valid, spot, 1.0)
+        safe_strike = np.where(valid, strike, 1.0)
+        safe_vol = np.where(valid, volatility, 1.0)
+        safe_t = np.where(valid, time_to_expiry, 1.0)
+        sqrt_t = np.sqrt(np.maximum(time_to_expiry, 0.0))
+
+        numerator = (
+            np.log(safe_spot / safe_strike) +
+            (rate - dividend_yield + 0.5 * safe_vol ** 2) * safe_t
+        )
+        d1 = np.where(valid, numerator / (safe_vol * np.sqrt(safe_t)), 0.0)
+
+        # d2 only collapses to 0 on T <= 0 or sigma <= 0 (see d2())
+        d2 = np.where(
+            (time_to_expiry > 0) & (volatility > 0),
+            d1 - volatility * sqrt_t,
+            0.0
+        )
+
+        return d1, d2, sqrt_t
+
+    @classmethod
+    def batch_price(
+        cls,
+        spot: ArrayLike,
+        strike: ArrayLike,
+        time_to_expiry: ArrayLike,
+        rate: ArrayLike,
+        volatility: ArrayLike,
+        is_call: Union[bool, np.ndarray],
+        dividend_yield: ArrayLike = 0.0
+    ) -> np.ndarray:
+        """
+        Vectorized Black-Scholes price for arrays of options
+
+        All inputs broadcast against each other, so a (num_paths, num_days)
+        spot grid can be priced against a (1, num_days) time-to-expiry row in
+        one call. Matches call_price()/put_price() element by element,
+        including intrinsic value at T <= 0 and the floor at zero.
+
+        Args:
+            spot: Spot prices
+            strike: Strike prices
+            time_to_expiry: Times to expiration in years
+            rate: Risk-free rate(s)
+            volatility: Implied volatilities
+            is_call: True for calls, False for puts
+            dividend_yield: Continuous dividend yield(s)
+
+        Returns:
+            Array of option prices with the broadcast shape of the inputs
+        """
+        spot, strike, time_to_expiry, rate, volatility, is_call, dividend_yield = (
+            cls._broadcast_batch_inputs(
+                spot, strike, time_to_expiry, rate, volatility, is_call, dividend_yield
+            )
+        )
+
+        d1, d2, _ = cls._batch_d1_d2(
+            spot, strike, time_to_expiry, rate, volatility, dividend_yield
+        )
+
+        live = time_to_expiry > 0
+        t_live = np.where(live, time_to_expiry, 0.0)
+        forward = spot * np.exp(-dividend_yield * t_live)
+        discounted_strike = strike * np.exp(-rate * t_live)
+
+        # Call: S*e^(-qt)*N(d1) - K*e^(-rt)*N(d2); put is the mirror with sign -1
+        sign = np.where(is_call, 1.0, -1.0)
+        price = sign * (
+            forward * batch_norm_cdf(sign * d1) -
+            discounted_strike * batch_norm_cdf(sign * d2)
+        )
+
+        intrinsic = sign * (spot - strike)
+
+        prices: np.ndarray = np.maximum(np.where(live, price, intrinsic), 0.0)
+        return prices
+
+    @classmethod
+    def batch_price_grid(
+        cls,
+        spot: ArrayLike,
+        strike: ArrayLike,
+        time_to_expiry: ArrayLike,
+        rate: ArrayLike,
+        volatility: ArrayLike,
+        is_call: Union[bool, np.ndarray],
+        dividend_yield: ArrayLike = 0.0,
+        spot_multipliers: ArrayLike = 1.0,
+        volatility_multipliers: ArrayLike = 1.0
+    ) -> np.ndarray:
+        """
+        Price a batch of options on every spot x volatility shock combination
+
+        Log-moneyness only depends on (spot shock, option) and sigma*sqrt(T)
+        only on (volatility shock, option), so both are built on their own
+        axes; only d1, d2 and the two normal CDFs are evaluated on the full
+        grid. Puts are priced from the call by put-call parity, so every cell
+        costs two ndtr calls. Matches batch_price() on the broadcast inputs.
+
+        Args:
+            spot: Spot prices, shape (num_options,)
+            strike: Strike prices
+            time_to_expiry: Times to expiration in years (intrinsic value at T <= 0)
+            rate: Risk-free rate(s)
+            volatility: Implied volatilities; shocked volatilities must stay positive
+            is_call: True for calls, False for puts
+            dividend_yield: Continuous dividend yield(s)
+            spot_multipliers: Spot shocks as multipliers, e.g. 1.05 for +5%
+            volatility_multipliers: Volatility shocks as multipliers
+
+        Returns:
+            Array of shape (num_spot_shocks, num_volatility_shocks, num_options)
+        """
+        spot, strike, time_to_expiry, rate, volatility, is_call, dividend_yield = (
+            np.atleast_1d(array) for array in cls._broadcast_batch_inputs(
+                spot, strike, time_to_expiry, rate, volatility, is_call, dividend_yield
+            )
+        )
+        spot_multipliers = np.atleast_1d(np.asarray(spot_multipliers, dtype=float))
+        volatility_multipliers = np.atleast_1d(np.asarray(volatility_multipliers, dtype=float))
+
+        live = time_to_expiry > 0
+        t_live = np.where(live, time_to_expiry, 0.0)
+        spot_q = spot * np.exp(-dividend_yield * t_live)
+        strike_r = strike * np.exp(-rate * t_live)
+
+        # Per (spot shock, option) and per (volatility shock, option) terms
+        shocked_spot = spot_multipliers[:, None] * spot
+        shocked_spot_q = spot_multipliers[:, None] * spot_q
+        safe_t = np.where(live, time_to_expiry, 1.0)
+        log_forward_moneyness = (
+            np.log(shocked_spot / strike) + (rate - dividend_yield) * safe_t
+        )
+        sigma_sqrt_t = volatility_multipliers[:, None] * volatility * np.sqrt(safe_t)
+
+        # d1 = m / (sigma sqrt T) + sigma sqrt T / 2, d2 = d1 - sigma sqrt T
+        d1 = log_forward_moneyness[:, None, :] / sigma_sqrt_t
+        d1 += 0.5 * sigma_sqrt_t
+        d2 = d1 - sigma_sqrt_t
+
+        price = batch_norm_cdf(d1, out=d1)
+        price *= shocked_spot_q[:, None, :]
+        cdf_d2 = batch_norm_cdf(d2, out=d2)
+        cdf_d2 *= strike_r
+        price -= cdf_d2
+
+        # Put = call - S*e^(-qt) + K*e^(-rt)
+        price += np.where(is_call, 0.0, strike_r - shocked_spot_q)[:, None, :]
+
+        if not live.all():
+            sign = np.where(is_call[~live], 1.0, -1.0)
+            intrinsic = sign * (shocked_spot[:, ~live] - strike[~live])
+            price[:, :, ~live] = intrinsic[:, None, :]
+
+        prices: np.ndarray = np.maximum(price, 0.0, out=price)
+        return prices
+
+    @classmethod
+    def batch_greeks(
+        cls,
+        spot: ArrayLike,
+        strike: ArrayLike,
+        time_to_expiry: ArrayLike,
+        rate: ArrayLike,
+        volatility: ArrayLike,
+        is_call: Union[bool, np.ndarray],
+        dividend_yield: ArrayLike = 0.0
+    ) -> BatchGreeks:
+        """
+        Calculate prices and all Greeks for a batch of options in one pass
+
+        d1/d2, the discount factors, N(±d1), N(±d2) and n(d1) are computed
+        once and shared by every output. Units follow the scalar methods:
+        per-share values, daily theta, vega and rho per 1% change.
+
+        Args:
+            spot: Spot prices
+            strike: Strike prices
+            time_to_expiry: Times to expiration in years
+            rate: Risk-free rate(s)
+            volatility: Implied volatilities
+            is_call: True for calls, False for puts
+            dividend_yield: Continuous dividend yield(s)
+
+        Returns:
+            BatchGreeks with one array per output, all in the broadcast shape
+        """
+        spot, strike, time_to_expiry, rate, volatility, is_call, dividend_yield = (
+            cls._broadcast_batch_inputs(
+                spot, strike, time_to_expiry, rate, volatility, is_call, dividend_yield
+            )
+        )
+
+        d1, d2, sqrt_t = cls._batch_d1_d2(
+            spot, strike, time_to_expiry, rate, volatility, dividend_yield
+        )
+
+        live = time_to_expiry > 0
+        t_live = np.where(live, time_to_expiry, 0.0)
+        discount_q = np.exp(-dividend_yield * t_live)
+        discount_r = np.exp(-rate * t_live)
+
+        # Shared intermediates: sign = +1 for calls, -1 for puts
+        sign = np.where(is_call, 1.0, -1.0)
+        cdf_d1 = batch_norm_cdf(sign * d1)
+        cdf_d2 = batch_norm_cdf(sign * d2)
+        pdf_d1 = batch_norm_pdf(d1)
+
+        spot_q = spot * discount_q
+        strike_r = strike * discount_r
+
+        # Price (intrinsic value at expiry, floored at zero)
+        price = sign * (spot_q * cdf_d1 - strike_r * cdf_d2)
+        price = np.maximum(np.where(live, price, sign * (spot - strike)), 0.0)
+
+        # Delta (0/±1 at expiry)
+        expired_delta = np.where(sign * (spot - strike) > 0, sign, 0.0)
+        delta = np.where(live, sign * cdf_d1 * discount_q, expired_delta)
+
+        # Gamma and vega share n(d1)
+        gamma_valid = live & (volatility > 0) & (spot > 0)
+        gamma_denominator = np.where(gamma_valid, spot * volatility * sqrt_t, 1.0)
+        gamma = np.where(gamma_valid, pdf_d1 * discount_q / gamma_denominator, 0.0)
+
+        vega = np.where(live & (spot > 0), spot_q * sqrt_t * pdf_d1 * 0.01, 0.0)
+
+        # Theta (daily)
+        safe_sqrt_t = np.where(live, sqrt_t, 1.0)
+        annual_theta = (
+            -(spot_q * volatility * pdf_d1) / (2 * safe_sqrt_t) +
+            sign * dividend_yield * spot_q * cdf_d1 -
+            sign * rate * strike_r * cdf_d2
+        )
+        theta = np.where(live, annual_theta / 365, 0.0)
+
+        # Rho (per 1%)
+        rho = np.where(live, sign * strike_r * t_live * cdf_d2 * 0.01, 0.0)
+
+        return BatchGreeks(
+            price=price,
+            delta=delta,
+            gamma=gamma,
+            theta=theta,
+            vega=vega,
+            rho=rho
+        )
+
     @classmethod
     def delta(
         cls,
@@ -167,9 +458,9 @@ class BlackScholesModel:
         discount = math.exp(-dividend_yield * time_to_expiry)
 
         if is_call:
-            return stats.norm.cdf(d1_val) * discount
+            return norm_cdf(d1_val) * discount
         else:
-            return (stats.norm.cdf(d1_val) - 1) * discount
+            return (norm_cdf(d1_val) - 1) * discount
 
     @classmethod
     def gamma(
@@ -196,7 +487,7 @@ class BlackScholesModel:
         d1_val = cls.d1(spot, strike, time_to_expiry, rate, volatility, dividend_yield)
         discount = math.exp(-dividend_yield * time_to_expiry)
 
-        numerator = stats.norm.pdf(d1_val) * discount
+        numerator = norm_pdf(d1_val) * discount
         denominator = spot * volatility * math.sqrt(time_to_expiry)
 
         return numerator / denominator
@@ -229,14 +520,14 @@ class BlackScholesModel:
         discount_r = math.exp(-rate * time_to_expiry)
 
         # First term (same for calls and puts)
-        term1 = -(spot * volatility * discount_q * stats.norm.pdf(d1_val)) / (2 * sqrt_t)
+        term1 = -(spot * volatility * discount_q * norm_pdf(d1_val)) / (2 * sqrt_t)
 
         if is_call:
-            term2 = dividend_yield * spot * discount_q * stats.norm.cdf(d1_val)
-            term3 = -rate * strike * discount_r * stats.norm.cdf(d2_val)
+            term2 = dividend_yield * spot * discount_q * norm_cdf(d1_val)
+            term3 = -rate * strike * discount_r * norm_cdf(d2_val)
         else:
-            term2 = -dividend_yield * spot * discount_q * stats.norm.cdf(-d1_val)
-            term3 = rate * strike * discount_r * stats.norm.cdf(-d2_val)
+            term2 = -dividend_yield * spot * discount_q * norm_cdf(-d1_val)
+            term3 = rate * strike * discount_r * norm_cdf(-d2_val)
 
         annual_theta = term1 + term2 + term3
 
@@ -268,7 +559,7 @@ class BlackScholesModel:
         discount = math.exp(-dividend_yield * time_to_expiry)
 
         # Vega per 1% change (multiply by 0.01)
-        vega = spot * math.sqrt(time_to_expiry) * stats.norm.pdf(d1_val) * discount * 0.01
+        vega = spot * math.sqrt(time_to_expiry) * norm_pdf(d1_val) * discount * 0.01
 
         return vega
 
@@ -297,9 +588,9 @@ class BlackScholesModel:
         discount = math.exp(-rate * time_to_expiry)
 
         if is_call:
-            rho = strike * time_to_expiry * discount * stats.norm.cdf(d2_val) * 0.01
+            rho = strike * time_to_expiry * discount * norm_cdf(d2_val) * 0.01
         else:
-            rho = -strike * time_to_expiry * discount * stats.norm.cdf(-d2_val) * 0.01
+            rho = -strike * time_to_expiry * discount * norm_cdf(-d2_val) * 0.01
 
         return rho
 
@@ -424,3 +715,160 @@ class BlackScholesModel:
 
         logger.warning(f"IV did not converge. Last estimate: {iv:.4f}")
         return iv
+
+    @classmethod
+    def _batch_price_vega(
+        cls,
+        spot: np.ndarray,
+        strike: np.ndarray,
+        time_to_expiry: np.ndarray,
+        rate: np.ndarray,
+        volatility: np.ndarray,
+        sign: np.ndarray,
+        dividend_yield: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Unfloored price and raw vega (dPrice/dSigma) for live options"""
+        d1, d2, sqrt_t = cls._batch_d1_d2(
+            spot, strike, time_to_expiry, rate, volatility, dividend_yield
+        )
+        spot_q = spot * np.exp(-dividend_yield * time_to_expiry)
+        strike_r = strike * np.exp(-rate * time_to_expiry)
+
+        price = sign * (
+            spot_q * batch_norm_cdf(sign * d1) - strike_r * batch_norm_cdf(sign * d2)
+        )
+        vega = spot_q * sqrt_t * batch_norm_pdf(d1)
+
+        return price, vega
+
+    @classmethod
+    def batch_implied_volatility(
+        cls,
+        option_price: ArrayLike,
+        spot: ArrayLike,
+        strike: ArrayLike,
+        time_to_expiry: ArrayLike,
+        rate: ArrayLike,
+        is_call: Union[bool, np.ndarray],
+        dividend_yield: ArrayLike = 0.0,
+        precision: float = 0.0001,
+        max_iterations: int = 100,
+        min_volatility: float = 1e-4,
+        max_volatility: float = 5.0
+    ) -> ImpliedVolatilityResult:
+        """
+        Solve implied volatility for a whole array of quotes at once
+
+        Starts from the Corrado-Miller closed-form approximation and runs a
+        vectorized Newton-Raphson iteration. Each element keeps a
+        [low, high] bracket that is tightened on every step; whenever a
+        Newton step leaves the bracket (or vega vanishes) that element falls
+        back to bisection, so every quote inside the no-arbitrage bounds
+        converges. Converged elements drop out of the working set.
+
+        Args:
+            option_price: Market prices of the options
+            spot: Spot prices
+            strike: Strike prices
+            time_to_expiry: Times to expiration in years
+            rate: Risk-free rate(s)
+            is_call: True for calls, False for puts
+            dividend_yield: Continuous dividend yield(s)
+            precision: Target absolute price error (same as implied_volatility)
+            max_iterations: Maximum iterations per element
+            min_volatility: Lower end of the search bracket
+            max_volatility: Upper end of the search bracket
+
+        Returns:
+            ImpliedVolatilityResult with per-element volatility, convergence
+            mask and iteration counts. Quotes with T <= 0 or price <= 0 get
+            0.0 (as implied_volatility does); quotes outside the
+            no-arbitrage bounds get NaN. Neither counts as converged.
+        """
+        arrays = np.broadcast_arrays(
+            np.asarray(option_price, dtype=float),
+            np.asarray(spot, dtype=float),
+            np.asarray(strike, dtype=float),
+            np.asarray(time_to_expiry, dtype=float),
+            np.asarray(rate, dtype=float),
+            np.asarray(is_call, dtype=bool),
+            np.asarray(dividend_yield, dtype=float)
+        )
+        shape = arrays[0].shape
+        target, spot, strike, time_to_expiry, rate, is_call, dividend_yield = (
+            a.ravel() for a in arrays
+        )
+
+        size = target.size
+        iv = np.zeros(size)
+        converged = np.zeros(size, dtype=bool)
+        iterations = np.zeros(size, dtype=int)
+
+        solvable = (time_to_expiry > 0) & (target > 0) & (spot > 0) & (strike > 0)
+        t_live = np.where(solvable, time_to_expiry, 0.0)
+        sign = np.where(is_call, 1.0, -1.0)
+        spot_q = spot * np.exp(-dividend_yield * t_live)
+        strike_r = strike * np.exp(-rate * t_live)
+
+        # No-arbitrage bounds: intrinsic (discounted) below, S*e^(-qt) or K*e^(-rt) above
+        lower_bound = np.maximum(sign * (spot_q - strike_r), 0.0)
+        upper_bound = np.where(is_call, spot_q, strike_r)
+        in_bounds = solvable & (target > lower_bound) & (target < upper_bound)
+        iv[solvable & ~in_bounds] = np.nan
+
+        active = np.flatnonzero(in_bounds)
+
+        # Corrado-Miller initial guess on the call-equivalent price (put-call parity)
+        call_price = target[active] + np.where(
+            is_call[active], 0.0, spot_q[active] - strike_r[active]
+        )
+        gap = spot_q[active] - strike_r[active]
+        adjusted = call_price - 0.5 * gap
+        root = np.sqrt(np.maximum(adjusted ** 2 - gap ** 2 / math.pi, 0.0))
+        sigma = (
+            math.sqrt(2 * math.pi) / (spot_q[active] + strike_r[active]) *
+            (adjusted + root) / np.sqrt(time_to_expiry[active])
+        )
+        sigma = np.clip(np.nan_to_num(sigma, nan=0.25), min_volatility, max_volatility)
+
+        low = np.full(active.size, min_volatility)
+        high = np.full(active.size, max_volatility)
+
+        for iteration in range(1, max_iterations + 1):
+            if active.size == 0:
+                break
+
+            price, vega = cls._batch_price_vega(
+                spot[active], strike[active], time_to_expiry[active], rate[active],
+                sigma, sign[active], dividend_yield[active]
+            )
+            diff = price - target[active]
+            iterations[active] = iteration
+
+            done = np.abs(diff) < precision
+            iv[active[done]] = sigma[done]
+            converged[active[done]] = True
+
+            # Price is increasing in sigma, so the sign of diff tightens the bracket
+            low = np.where(diff < 0, sigma, low)
+            high = np.where(diff > 0, sigma, high)
+
+            with np.errstate(divide='ignore', invalid='ignore'):
+                newton = sigma - diff / vega
+            bisect = ~np.isfinite(newton) | (newton <= low) | (newton >= high)
+            sigma = np.where(bisect, 0.5 * (low + high), newton)
+
+            remaining = ~done
+            active, sigma = active[remaining], sigma[remaining]
+            low, high = low[remaining], high[remaining]
+
+        # Elements that ran out of iterations keep their last estimate
+        iv[active] = sigma
+        if active.size:
+            logger.warning(f"IV did not converge for {active.size} of {size} quotes")
+
+        return ImpliedVolatilityResult(
+            implied_volatility=iv.reshape(shape),
+            converged=converged.reshape(shape),
+            iterations=iterations.reshape(shape)
+        )
@@ -15,13 +15,24 @@ Greeks Calculator - Main calculator for portfolio Greeks
 """
 
 from datetime import date
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+import numpy as np
 from loguru import logger
 
 from ..ib_client.models import Position, MarketData, SecType
 from .black_scholes import BlackScholesModel
 from .models import Greeks, PortfolioGreeks, GreeksByUnderlying
 
+# Greeks fields in model order; each becomes one column in the batched path
+GREEK_FIELDS = tuple(Greeks.model_fields)
+
+# Default scenario grid (percent changes)
+DEFAULT_SPOT_CHANGES = (-10, -5, -2, 0, 2, 5, 10)
+DEFAULT_IV_CHANGES = (-20, -10, 0, 10, 20)
+
+# IV shocks below -99% are floored so shocked volatility stays positive
+MIN_IV_MULTIPLIER = 0.01
+
 
 class GreeksCalculator:
     """
@@ -479,105 +490,381 @@ class GreeksCalculator:
             multiplier=opt.multiplier
         )
 
-    def calculate_portfolio_greeks(
+    def _option_leg_spec(
+        self,
+        position: Position,
+        market_data: Optional[MarketData],
+        spot: float
+    ) -> tuple:
+        """(underlying spot, strike, dte, volatility, is_call) of an option-like position"""
+        opt = position.option_details
+        if opt is None:
+            raise ValueError(f"{position.symbol} has no option details")
+        underlying_spot = (
+            market_data.underlying_price if market_data and market_data.underlying_price else spot
+        )
+        volatility = self.default_volatility
+        if market_data and market_data.implied_volatility:
+            volatility = market_data.implied_volatility
+        return (underlying_spot, opt.strike, opt.days_to_expiry, volatility, opt.is_call)
+
+    def _pricing_volatilities(
+        self,
+        positions: List[Position],
+        market_data: Optional[Dict[int, MarketData]]
+    ) -> np.ndarray:
+        """Volatility each option-like leg is priced with (0 for other positions)"""
+        volatilities = np.zeros(len(positions))
+        for i, position in enumerate(positions):
+            if self._position_kind(position) == "option":
+                md = market_data.get(position.con_id) if market_data else None
+                volatilities[i] = self._option_leg_spec(position, md, 0.0)[3]
+        return volatilities
+
+    def _position_kind(self, position: Position) -> str:
+        """Classify a position the same way calculate_position_greeks dispatches it"""
+        if position.is_stock:
+            return "stock"
+        if position.is_option and position.option_details:
+            return "option"
+        if position.is_futures:
+            return "futures"
+        if position.is_forex or position.is_cfd:
+            return "linear"
+        if (position.is_futures_option or position.is_warrant) and position.option_details:
+            return "option"
+        if position.is_fund or position.is_crypto:
+            return "linear"
+        if position.is_bond:
+            return "bond"
+        return "unknown"
+
+    def calculate_greeks_columns(
         self,
         positions: List[Position],
         market_data: Optional[Dict[int, MarketData]] = None
-    ) -> PortfolioGreeks:
+    ) -> Dict[str, np.ndarray]:
         """
-        Calculate aggregated Greeks for the entire portfolio
+        Calculate per-position Greeks as columns in a single batch
+
+        Position attributes are gathered into arrays in one pass, every
+        option-like leg is priced with one BlackScholesModel.batch_greeks
+        call, and linear/bond exposures are filled in vectorized. Values match
+        calculate_position_greeks row by row.
 
         Args:
             positions: List of Position objects
             market_data: Dictionary mapping conId to MarketData
 
         Returns:
-            PortfolioGreeks object with totals and breakdown by underlying
+            Dictionary with one array (len(positions),) per Greeks field, plus
+            the inputs used for portfolio-level metrics:
+            - underlying_price: price reported by market data (NaN if none)
+            - implied_volatility: market IV for OPT positions (0 if unavailable)
+            - days_to_expiry: DTE for OPT positions (-1 otherwise)
+            - option_value: absolute market value of OPT positions
         """
-        logger.info(f"Calculating portfolio Greeks for {len(positions)} positions")
-
-        portfolio_greeks = PortfolioGreeks()
-        underlying_groups: Dict[str, List[tuple]] = {}  # symbol -> [(position, greeks, market_data)]
-
-        # Calculate Greeks for each position and group by underlying
-        for position in positions:
+        n = len(positions)
+        columns = {field: np.zeros(n) for field in GREEK_FIELDS}
+        columns["underlying_price"] = np.full(n, np.nan)
+        columns["implied_volatility"] = np.zeros(n)
+        columns["days_to_expiry"] = np.full(n, -1, dtype=int)
+        columns["option_value"] = np.zeros(n)
+
+        spots = np.zeros(n)
+        quantities = np.zeros(n)
+        linear_rows: List[int] = []
+        bond_rows: List[int] = []
+        bond_durations: List[float] = []
+        option_rows: List[int] = []
+        option_spec: List[tuple] = []  # (spot, strike, dte, volatility, is_call)
+
+        for i, position in enumerate(positions):
             md = market_data.get(position.con_id) if market_data else None
-            greeks = self.calculate_position_greeks(position, md)
+            spot = self._get_spot_price(position, md)
+            kind = self._position_kind(position)
+
+            spots[i] = spot
+            quantities[i] = position.position
+
+            if md:
+                if position.is_stock:
+                    columns["underlying_price"][i] = md.mid
+                elif md.underlying_price:
+                    columns["underlying_price"][i] = md.underlying_price
+
+            if position.is_option and position.option_details:
+                columns["days_to_expiry"][i] = position.option_details.days_to_expiry
+                columns["option_value"][i] = abs(position.market_value)
+                if md and md.implied_volatility:
+                    columns["implied_volatility"][i] = md.implied_volatility
+
+            if kind == "option":
+                spec = self._option_leg_spec(position, md, spot)
+                quantities[i] = position.position * position.multiplier
+                spots[i] = spec[0]
+                option_rows.append(i)
+                option_spec.append(spec)
+
+            elif kind == "futures":
+                multiplier = position.futures_details.multiplier if position.futures_details else 1.0
+                quantities[i] = position.position * multiplier
+                linear_rows.append(i)
+
+            elif kind == "bond":
+                duration = 5.0
+                if position.bond_details:
+                    years_to_maturity = position.bond_details.days_to_maturity / 365.0
+                    duration = min(years_to_maturity * 0.8, 10.0)
+                bond_rows.append(i)
+                bond_durations.append(duration)
+
+            else:
+                if kind == "unknown":
+                    logger.warning(
+                        f"Unknown position type for {position.symbol}: {position.sec_type}. "
+                        f"Treating as spot asset with Delta = position_size."
+                    )
+                linear_rows.append(i)
+
+        # Linear exposures: delta = quantity (x futures multiplier)
+        rows = np.array(linear_rows, dtype=int)
+        columns["delta"][rows] = quantities[rows]
+        columns["delta_dollars"][rows] = quantities[rows] * spots[rows]
+
+        # Bonds: duration-based rate sensitivity
+        if bond_rows:
+            rows = np.array(bond_rows, dtype=int)
+            market_value = spots[rows] * quantities[rows]
+            columns["delta"][rows] = quantities[rows]
+            columns["rho"][rows] = -np.array(bond_durations) * market_value / 100
+            columns["delta_dollars"][rows] = market_value
+
+        if option_rows:
+            self._fill_option_columns(
+                columns, np.array(option_rows, dtype=int), option_spec, quantities, spots
+            )
 
-            symbol = position.symbol
-            if symbol not in underlying_groups:
-                underlying_groups[symbol] = []
-            underlying_groups[symbol].append((position, greeks, md))
+        return columns
 
-            logger.debug(
-                f"Position {symbol} ({position.sec_type}): "
-                f"Δ={greeks.delta:.2f}, Θ=${greeks.theta_dollars:.2f}"
+    def _fill_option_columns(
+        self,
+        columns: Dict[str, np.ndarray],
+        rows: np.ndarray,
+        option_spec: List[tuple],
+        quantities: np.ndarray,
+        spots: np.ndarray
+    ) -> None:
+        """Price all option-like rows with one batched Black-Scholes call"""
+        spot, strike, dte, volatility, is_call = (
+            np.array(col) for col in zip(*option_spec, strict=True)
+        )
+        quantity = quantities[rows]
+
+        expired = dte <= 0
+        if expired.any():
+            for day in dte[expired]:
+                logger.warning(f"Option expired or expiring today (DTE={day})")
+
+            # Same at-expiry convention as calculate_option_greeks
+            itm = (is_call & (spot > strike)) | (~is_call & (spot < strike))
+            exp_rows = rows[expired]
+            intrinsic_delta = np.where(itm[expired], 1.0, 0.0)
+            columns["delta"][exp_rows] = intrinsic_delta * quantity[expired]
+            columns["delta_dollars"][exp_rows] = (
+                intrinsic_delta * quantity[expired] * spot[expired]
             )
 
-        # Aggregate by underlying
-        total_vega_weighted_iv = 0.0
-        total_vega = 0.0
-        min_dte = None
-        total_value_weighted_dte = 0.0
-        total_option_value = 0.0
-
-        for symbol, group in underlying_groups.items():
-            underlying_greeks = Greeks()
-            underlying_price = 0.0
-            position_count = len(group)
-
-            for position, greeks, md in group:
-                underlying_greeks = underlying_greeks + greeks
-
-                # Track underlying price
-                if md:
-                    if position.is_stock:
-                        underlying_price = md.mid
-                    elif md.underlying_price:
-                        underlying_price = md.underlying_price
-
-                # Track IV for weighted average
-                if position.is_option and md and md.implied_volatility:
-                    abs_vega = abs(greeks.vega_dollars)
-                    total_vega_weighted_iv += md.implied_volatility * abs_vega
-                    total_vega += abs_vega
-
-                # Track DTE for weighted average
-                if position.is_option and position.option_details:
-                    dte = position.option_details.days_to_expiry
-                    option_value = abs(position.market_value)
-
-                    if min_dte is None or dte < min_dte:
-                        min_dte = dte
-
-                    total_value_weighted_dte += dte * option_value
-                    total_option_value += option_value
-
-            # Create underlying summary
-            underlying_summary = GreeksByUnderlying(
-                symbol=symbol,
-                underlying_price=underlying_price,
-                position_count=position_count,
-                greeks=underlying_greeks,
-                stock_equivalent_shares=underlying_greeks.delta
-            )
+        live = ~expired
+        if not live.any():
+            return
+
+        volatility = np.where(volatility > 0, volatility, self.default_volatility)
+        batch = self.bs_model.batch_greeks(
+            spot[live],
+            strike[live],
+            dte[live] / 365.0,
+            self.risk_free_rate,
+            volatility[live],
+            is_call[live],
+            self.default_dividend_yield
+        )
+
+        live_rows = rows[live]
+        quantity = quantity[live]
+        spot = spot[live]
+
+        columns["delta"][live_rows] = batch.delta * quantity
+        columns["gamma"][live_rows] = batch.gamma * quantity
+        columns["theta"][live_rows] = batch.theta * quantity
+        columns["vega"][live_rows] = batch.vega * quantity
+        columns["rho"][live_rows] = batch.rho * quantity
+        columns["delta_dollars"][live_rows] = batch.delta * quantity * spot
+        columns["gamma_dollars"][live_rows] = batch.gamma * quantity * spot * 0.01
+        columns["theta_dollars"][live_rows] = batch.theta * quantity
+        columns["vega_dollars"][live_rows] = batch.vega * quantity
+
+    def summarize_underlying(
+        self,
+        symbol: str,
+        rows: np.ndarray,
+        columns: Dict[str, np.ndarray],
+        totals: Optional[Dict[str, float]] = None
+    ) -> GreeksByUnderlying:
+        """
+        Build the GreeksByUnderlying summary for one symbol's rows
+
+        Args:
+            symbol: Underlying symbol
+            rows: Row indices of the symbol's positions in columns, in position order
+            columns: Greeks columns from calculate_greeks_columns
+            totals: Precomputed per-field sums over rows (summed here if None)
+
+        Returns:
+            GreeksByUnderlying for the symbol
+        """
+        if totals is None:
+            totals = {field: float(np.sum(columns[field][rows])) for field in GREEK_FIELDS}
+        underlying_greeks = Greeks(**totals)
+
+        # Last position with a market-data price wins, as in the per-position
+        # loop; scanning from the end usually stops at the first row
+        prices = columns["underlying_price"]
+        underlying_price = next(
+            (float(prices[row]) for row in reversed(rows) if not np.isnan(prices[row])), 0.0
+        )
+
+        return GreeksByUnderlying(
+            symbol=symbol,
+            underlying_price=underlying_price,
+            position_count=len(rows),
+            greeks=underlying_greeks,
+            stock_equivalent_shares=underlying_greeks.delta
+        )
+
+    @staticmethod
+    def iv_vega_sums(columns: Dict[str, np.ndarray]) -> Tuple[float, float]:
+        """
+        Sums behind the vega-weighted IV over rows with market IV
+
+        Returns:
+            (sum of IV * |vega dollars|, sum of |vega dollars|)
+        """
+        iv = columns["implied_volatility"]
+        abs_vega = np.where(iv > 0, np.abs(columns["vega_dollars"]), 0.0)
+        return float(iv @ abs_vega), float(abs_vega.sum())
+
+    def portfolio_metrics(self, columns: Dict[str, np.ndarray]) -> Dict[str, Any]:
+        """
+        Portfolio-weighted option metrics of a set of Greeks columns
+
+        Returns:
+            weighted_average_iv (vega-weighted over options with market IV),
+            weighted_dte (value-weighted) and days_to_nearest_expiry, as
+            PortfolioGreeks fields
+        """
+        metrics: Dict[str, Any] = {}
+
+        iv_vega, total_vega = self.iv_vega_sums(columns)
+        if total_vega > 0:
+            metrics["weighted_average_iv"] = iv_vega / total_vega
+
+        dte = columns["days_to_expiry"]
+        is_option = dte >= 0
+        if is_option.any():
+            option_value = columns["option_value"][is_option]
+            total_option_value = float(option_value.sum())
+            if total_option_value > 0:
+                metrics["weighted_dte"] = (
+                    float(np.sum(dte[is_option] * option_value)) / total_option_value
+                )
+            metrics["days_to_nearest_expiry"] = int(dte[is_option].min())
+
+        return metrics
+
+    def assemble_portfolio_greeks(
+        self,
+        by_underlying: Dict[str, GreeksByUnderlying],
+        metrics: Dict[str, Any]
+    ) -> PortfolioGreeks:
+        """
+        Combine underlying summaries and portfolio metrics into PortfolioGreeks
+
+        Args:
+            by_underlying: Summaries from summarize_underlying
+            metrics: Output of portfolio_metrics
 
+        Returns:
+            PortfolioGreeks with totals summed over the underlyings
+        """
+        portfolio_greeks = PortfolioGreeks(**metrics)
+
+        for symbol, underlying_summary in by_underlying.items():
             portfolio_greeks.add_underlying_greeks(symbol, underlying_summary)
 
+        return portfolio_greeks
+
+    def calculate_portfolio_greeks(
+        self,
+        positions: List[Position],
+        market_data: Optional[Dict[int, MarketData]] = None
+    ) -> PortfolioGreeks:
+        """
+        Calculate aggregated Greeks for the entire portfolio
+
+        Per-position Greeks are computed as columns (see
+        calculate_greeks_columns) and summed per underlying with bincount,
+        so no intermediate Greeks objects are created per position.
+
+        Args:
+            positions: List of Position objects
+            market_data: Dictionary mapping conId to MarketData
+
+        Returns:
+            PortfolioGreeks object with totals and breakdown by underlying
+        """
+        logger.info(f"Calculating portfolio Greeks for {len(positions)} positions")
+
+        columns = self.calculate_greeks_columns(positions, market_data)
+
+        # Group rows by underlying symbol (first-seen order)
+        symbol_index: Dict[str, int] = {}
+        group_ids = np.array(
+            [symbol_index.setdefault(position.symbol, len(symbol_index)) for position in positions],
+            dtype=int
+        )
+        num_groups = len(symbol_index)
+        sums = {
+            field: np.bincount(group_ids, weights=columns[field], minlength=num_groups)
+            for field in GREEK_FIELDS
+        }
+
+        # One stable sort puts each group's rows together in position order
+        order = np.argsort(group_ids, kind="stable")
+        group_rows = np.split(order, np.cumsum(np.bincount(group_ids, minlength=num_groups))[:-1])
+
+        by_underlying: Dict[str, GreeksByUnderlying] = {}
+        for symbol, group in symbol_index.items():
+            rows = group_rows[group]
+            totals = {field: float(sums[field][group]) for field in GREEK_FIELDS}
+            underlying_summary = self.summarize_underlying(symbol, rows, columns, totals)
+            by_underlying[symbol] = underlying_summary
+
             logger.info(
-                f"Underlying {symbol}: {position_count} positions, "
-                f"Δ={underlying_greeks.delta:.2f}, Θ=${underlying_greeks.theta_dollars:.2f}/day"
+                f"Underlying {symbol}: {underlying_summary.position_count} positions, "
+                f"Δ={underlying_summary.greeks.delta:.2f}, "
+                f"Θ=${underlying_summary.greeks.theta_dollars:.2f}/day"
             )
 
-        # Calculate weighted metrics
-        if total_vega > 0:
-            portfolio_greeks.weighted_average_iv = total_vega_weighted_iv / total_vega
-
-        if total_option_value > 0:
-            portfolio_greeks.weighted_dte = total_value_weighted_dte / total_option_value
+        portfolio_greeks = self.assemble_portfolio_greeks(
+            by_underlying, self.portfolio_metrics(columns)
+        )
+        self._log_portfolio_summary(portfolio_greeks)
 
-        portfolio_greeks.days_to_nearest_expiry = min_dte
+        return portfolio_greeks
 
+    def _log_portfolio_summary(self, portfolio_greeks: PortfolioGreeks) -> None:
+        """Log the portfolio Greeks summary block"""
         logger.info("=" * 60)
         logger.info("Portfolio Greeks Summary:")
         logger.info(f"  Total Delta: {portfolio_greeks.total_delta:.2f} shares equivalent")
@@ -588,12 +875,10 @@ class GreeksCalculator:
         logger.info(f"  Total Vega: ${portfolio_greeks.total_vega_dollars:,.2f} per 1% IV")
         logger.info(f"  Weighted Avg IV: {portfolio_greeks.weighted_average_iv * 100:.1f}%")
         logger.info(f"  Weighted DTE: {portfolio_greeks.weighted_dte:.1f} days")
-        if min_dte is not None:
-            logger.info(f"  Nearest Expiry: {min_dte} days")
+        if portfolio_greeks.days_to_nearest_expiry is not None:
+            logger.info(f"  Nearest Expiry: {portfolio_greeks.days_to_nearest_expiry} days")
         logger.info("=" * 60)
 
-        return portfolio_greeks
-
     def calculate_delta_hedge(
         self,
         portfolio_greeks: PortfolioGreeks,
@@ -626,34 +911,155 @@ class GreeksCalculator:
 
         return hedge_trades
 
+    def scenario_grid(
+        self,
+        positions: List[Position],
+        market_data: Optional[Dict[int, MarketData]] = None,
+        spot_changes: Optional[Sequence[float]] = None,
+        iv_changes: Optional[Sequence[float]] = None,
+        days_forward: Optional[Sequence[int]] = None
+    ) -> np.ndarray:
+        """
+        Full-revaluation P&L on a spot x IV x time grid
+
+        Every option-like leg is repriced with Black-Scholes at every grid
+        point (one batch_price_grid call per time step) and compared with its
+        model value today; linear and bond exposures move with their delta
+        dollars. Spot and IV changes are relative, e.g. iv +10% turns 25% IV
+        into 27.5%. Legs with identical contract terms are netted first.
+
+        Args:
+            positions: List of positions
+            market_data: Market data dictionary
+            spot_changes: Spot price change percentages
+            iv_changes: Implied volatility change percentages
+            days_forward: Days elapsed before the shock (default [0])
+
+        Returns:
+            P&L array of shape (len(spot_changes), len(iv_changes), len(days_forward))
+        """
+        spot_changes = DEFAULT_SPOT_CHANGES if spot_changes is None else spot_changes
+        iv_changes = DEFAULT_IV_CHANGES if iv_changes is None else iv_changes
+        days_forward = (0,) if days_forward is None else days_forward
+
+        spot_shocks = np.asarray(spot_changes, dtype=float) / 100
+        iv_multipliers = np.maximum(
+            1.0 + np.asarray(iv_changes, dtype=float) / 100, MIN_IV_MULTIPLIER
+        )
+        days = np.asarray(days_forward, dtype=float)
+
+        columns = self.calculate_greeks_columns(positions, market_data)
+
+        is_option = np.zeros(len(positions), dtype=bool)
+        option_spec: List[tuple] = []
+        option_quantities: List[float] = []
+        for i, position in enumerate(positions):
+            if self._position_kind(position) != "option":
+                continue
+            md = market_data.get(position.con_id) if market_data else None
+            is_option[i] = True
+            option_spec.append(
+                self._option_leg_spec(position, md, self._get_spot_price(position, md))
+            )
+            option_quantities.append(position.position * position.multiplier)
+
+        linear_exposure = float(columns["delta_dollars"][~is_option].sum())
+        grid = np.empty((len(spot_shocks), len(iv_multipliers), len(days)))
+        grid[:] = (linear_exposure * spot_shocks)[:, None, None]
+
+        if not option_spec:
+            return grid
+
+        # Net legs with the same (spot, strike, dte, volatility, is_call)
+        legs, leg_index = np.unique(np.array(option_spec, dtype=float), axis=0, return_inverse=True)
+        quantity = np.bincount(leg_index.ravel(), weights=option_quantities, minlength=len(legs))
+        spot, strike, dte, volatility, is_call = legs.T
+        is_call = is_call.astype(bool)
+        volatility = np.where(volatility > 0, volatility, self.default_volatility)
+
+        base_value = self.bs_model.batch_price(
+            spot, strike, dte / 365.0, self.risk_free_rate, volatility, is_call,
+            self.default_dividend_yield
+        ) @ quantity
+
+        for k, day in enumerate(days):
+            prices = self.bs_model.batch_price_grid(
+                spot,
+                strike,
+                np.maximum(dte - day, 0.0) / 365.0,
+                self.risk_free_rate,
+                volatility,
+                is_call,
+                self.default_dividend_yield,
+                spot_multipliers=1.0 + spot_shocks,
+                volatility_multipliers=iv_multipliers
+            )
+            grid[:, :, k] += prices @ quantity - base_value
+
+        logger.info(
+            f"Scenario grid: {len(legs)} option legs x {grid.size:,} grid points "
+            f"(full revaluation)"
+        )
+
+        return grid
+
     def scenario_analysis(
         self,
         positions: List[Position],
         market_data: Optional[Dict[int, MarketData]] = None,
         spot_changes: List[float] = None,
-        iv_changes: List[float] = None
+        iv_changes: List[float] = None,
+        full_revaluation: bool = False,
+        days_forward: int = 0
     ) -> Dict[str, Dict[str, float]]:
         """
         Run scenario analysis on portfolio
 
+        Both modes use the same shock convention as scenario_grid: spot and
+        IV changes are relative, so iv +10% moves a leg priced at 25% IV to
+        27.5%. The delta-gamma-vega approximation scales each leg's vega
+        dollars (per vol point) by the vol points its own IV moves.
+
         Args:
             positions: List of positions
             market_data: Market data dictionary
             spot_changes: List of spot price change percentages (e.g., [-10, -5, 0, 5, 10])
-            iv_changes: List of IV change percentages (e.g., [-20, -10, 0, 10, 20])
+            iv_changes: List of relative IV change percentages (e.g., [-20, -10, 0, 10, 20])
+            full_revaluation: Reprice every option at every grid point (see
+                scenario_grid) instead of the delta-gamma-vega approximation
+            days_forward: Days elapsed before the shock
 
         Returns:
             Nested dictionary of scenario results
         """
         if spot_changes is None:
-            spot_changes = [-10, -5, -2, 0, 2, 5, 10]
+            spot_changes = list(DEFAULT_SPOT_CHANGES)
         if iv_changes is None:
-            iv_changes = [-20, -10, 0, 10, 20]
+            iv_changes = list(DEFAULT_IV_CHANGES)
+
+        if full_revaluation:
+            grid = self.scenario_grid(
+                positions, market_data, spot_changes, iv_changes, [days_forward]
+            )
+            return {
+                f"spot_{spot_pct:+d}%": {
+                    f"iv_{iv_pct:+d}%": round(float(grid[i, j, 0]), 2)
+                    for j, iv_pct in enumerate(iv_changes)
+                }
+                for i, spot_pct in enumerate(spot_changes)
+            }
 
         results = {}
 
-        # Get base portfolio greeks for comparison
-        base_greeks = self.calculate_portfolio_greeks(positions, market_data)
+        # Base portfolio dollar Greeks; vega is weighted by each leg's IV so
+        # a relative IV shock of iv_pct% is iv_pct * vol_weighted_vega dollars
+        columns = self.calculate_greeks_columns(positions, market_data)
+        delta_dollars = float(columns["delta_dollars"].sum())
+        gamma_dollars = float(columns["gamma_dollars"].sum())
+        theta_dollars = float(columns["theta_dollars"].sum())
+        vol_weighted_vega = float(
+            columns["vega_dollars"] @ self._pricing_volatilities(positions, market_data)
+        )
 
         for spot_pct in spot_changes:
             spot_key = f"spot_{spot_pct:+d}%"
@@ -664,11 +1070,12 @@ class GreeksCalculator:
 
                 # Estimate P&L using Greeks
                 # P&L ≈ delta * dS + 0.5 * gamma * dS^2 + vega * dIV
-                delta_pnl = base_greeks.total_delta_dollars * (spot_pct / 100)
-                gamma_pnl = 0.5 * base_greeks.total_gamma_dollars * (spot_pct ** 2)
-                vega_pnl = base_greeks.total_vega_dollars * (iv_pct / 100)
+                delta_pnl = delta_dollars * (spot_pct / 100)
+                gamma_pnl = 0.5 * gamma_dollars * (spot_pct ** 2)
+                vega_pnl = vol_weighted_vega * iv_pct
+                theta_pnl = theta_dollars * days_forward
 
-                total_pnl = delta_pnl + gamma_pnl + vega_pnl
+                total_pnl = delta_pnl + gamma_pnl + vega_pnl + theta_pnl
 
                 results[spot_key][iv_key] = round(total_pnl, 2)
 
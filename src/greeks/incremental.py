@@ -0,0 +1,203 @@
+"""
+Incremental Greeks Engine - keeps portfolio Greeks warm between quote updates
+
+A full calculate_portfolio_greeks call reprices every position. The engine
+keeps the per-position Greeks columns, running per-underlying sums and the
+running sums behind the portfolio metrics in memory, so a refresh in which
+only a few quotes changed reprices just those positions, adds the change of
+their rows to the sums and rebuilds only the GreeksByUnderlying summaries
+they belong to; no pass over all positions is made.
+"""
+
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+from loguru import logger
+
+from ..ib_client.models import MarketData, Position
+from .calculator import GREEK_FIELDS, GreeksCalculator
+from .models import Greeks, GreeksByUnderlying, PortfolioGreeks
+
+# Running |vega| sums below this (in dollars) are rounding residue, not exposure
+VEGA_EPSILON = 1e-9
+
+
+class IncrementalGreeksEngine:
+    """
+    Incremental portfolio Greeks
+
+    Usage:
+        engine = IncrementalGreeksEngine(calculator)
+        engine.load(positions, market_data)       # full computation
+        engine.update({con_id: new_market_data})  # only affected rows
+
+    A position's Greeks depend only on its own MarketData entry (spot,
+    underlying price and IV all come from it), so a changed conId affects
+    exactly the positions with that conId and the underlying they roll up to.
+    """
+
+    def __init__(self, calculator: Optional[GreeksCalculator] = None):
+        """
+        Initialize the engine
+
+        Args:
+            calculator: GreeksCalculator providing rates and defaults
+        """
+        self.calculator = calculator or GreeksCalculator()
+
+        self._positions: List[Position] = []
+        self._market_data: Dict[int, MarketData] = {}
+        self._columns: Dict[str, np.ndarray] = {}
+        self._rows_by_con_id: Dict[int, List[int]] = {}
+        self._rows_by_symbol: Dict[str, np.ndarray] = {}
+        self._sums: Dict[str, Dict[str, float]] = {}
+        self._metrics: Dict[str, Any] = {}
+        self._iv_vega = 0.0
+        self._abs_vega = 0.0
+        self._by_underlying: Dict[str, GreeksByUnderlying] = {}
+        self._portfolio_greeks: Optional[PortfolioGreeks] = None
+
+    @property
+    def portfolio_greeks(self) -> Optional[PortfolioGreeks]:
+        """Latest portfolio Greeks (None before load)"""
+        return self._portfolio_greeks
+
+    @property
+    def positions(self) -> List[Position]:
+        """Positions currently tracked"""
+        return self._positions
+
+    def load(
+        self,
+        positions: List[Position],
+        market_data: Optional[Dict[int, MarketData]] = None
+    ) -> PortfolioGreeks:
+        """
+        Compute Greeks for a full position set and keep the state
+
+        Args:
+            positions: List of Position objects
+            market_data: Dictionary mapping conId to MarketData
+
+        Returns:
+            PortfolioGreeks for the whole portfolio
+        """
+        self._positions = list(positions)
+        self._market_data = dict(market_data or {})
+        self._columns = self.calculator.calculate_greeks_columns(
+            self._positions, self._market_data
+        )
+
+        self._rows_by_con_id = {}
+        rows_by_symbol: Dict[str, List[int]] = {}
+        for row, position in enumerate(self._positions):
+            self._rows_by_con_id.setdefault(position.con_id, []).append(row)
+            rows_by_symbol.setdefault(position.symbol, []).append(row)
+        self._rows_by_symbol = {
+            symbol: np.array(rows, dtype=int) for symbol, rows in rows_by_symbol.items()
+        }
+
+        self._sums = {
+            symbol: {field: float(np.sum(self._columns[field][rows])) for field in GREEK_FIELDS}
+            for symbol, rows in self._rows_by_symbol.items()
+        }
+        self._by_underlying = {
+            symbol: self.calculator.summarize_underlying(
+                symbol, rows, self._columns, dict(self._sums[symbol])
+            )
+            for symbol, rows in self._rows_by_symbol.items()
+        }
+        # DTE and option value do not depend on quotes; only the IV weighting
+        # has to follow updates
+        self._metrics = self.calculator.portfolio_metrics(self._columns)
+        self._iv_vega, self._abs_vega = self.calculator.iv_vega_sums(self._columns)
+        self._portfolio_greeks = self.calculator.assemble_portfolio_greeks(
+            self._by_underlying, self._metrics
+        )
+
+        logger.info(
+            f"IncrementalGreeksEngine loaded {len(self._positions)} positions "
+            f"across {len(self._by_underlying)} underlyings"
+        )
+        return self._portfolio_greeks
+
+    def update(self, changed: Dict[int, MarketData]) -> PortfolioGreeks:
+        """
+        Apply changed quotes and recompute only the affected positions
+
+        Args:
+            changed: Dictionary mapping conId to its new MarketData
+
+        Returns:
+            Updated PortfolioGreeks
+        """
+        if self._portfolio_greeks is None:
+            raise RuntimeError("IncrementalGreeksEngine.load() must be called before update()")
+
+        rows: List[int] = []
+        for con_id, md in changed.items():
+            con_rows = self._rows_by_con_id.get(con_id)
+            if not con_rows:
+                logger.debug(f"Ignoring market data for untracked conId {con_id}")
+                continue
+            self._market_data[con_id] = md
+            rows.extend(con_rows)
+
+        if not rows:
+            return self._portfolio_greeks
+
+        rows_array = np.array(sorted(rows), dtype=int)
+        subset = [self._positions[row] for row in rows_array]
+        subset_columns = self.calculator.calculate_greeks_columns(subset, self._market_data)
+        old_columns = {name: self._columns[name][rows_array] for name in subset_columns}
+        for name, values in subset_columns.items():
+            self._columns[name][rows_array] = values
+
+        # Move the running sums by the change of the repriced rows
+        for i, position in enumerate(subset):
+            sums = self._sums[position.symbol]
+            for field in GREEK_FIELDS:
+                sums[field] += float(subset_columns[field][i] - old_columns[field][i])
+
+        new_iv_vega, new_abs_vega = self.calculator.iv_vega_sums(subset_columns)
+        old_iv_vega, old_abs_vega = self.calculator.iv_vega_sums(old_columns)
+        self._iv_vega += new_iv_vega - old_iv_vega
+        self._abs_vega += new_abs_vega - old_abs_vega
+        self._metrics.pop("weighted_average_iv", None)
+        if self._abs_vega > VEGA_EPSILON:
+            self._metrics["weighted_average_iv"] = self._iv_vega / self._abs_vega
+
+        affected_symbols = {position.symbol for position in subset}
+        for symbol in affected_symbols:
+            self._by_underlying[symbol] = self.calculator.summarize_underlying(
+                symbol, self._rows_by_symbol[symbol], self._columns, dict(self._sums[symbol])
+            )
+
+        self._portfolio_greeks = self.calculator.assemble_portfolio_greeks(
+            self._by_underlying, self._metrics
+        )
+
+        logger.debug(
+            f"Incremental Greeks update: {len(rows_array)} positions, "
+            f"{len(affected_symbols)} underlyings"
+        )
+        return self._portfolio_greeks
+
+    def position_greeks(self, con_id: int) -> Optional[Greeks]:
+        """
+        Get the current Greeks of a tracked position
+
+        Args:
+            con_id: Contract ID of the position
+
+        Returns:
+            Greeks object, or None if the conId is not tracked
+        """
+        con_rows = self._rows_by_con_id.get(con_id)
+        if not con_rows:
+            return None
+
+        totals = {
+            field: float(np.sum(self._columns[field][con_rows])) for field in GREEK_FIELDS
+        }
+        return Greeks(**totals)
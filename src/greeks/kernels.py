@@ -0,0 +1,68 @@
+"""
+Normal distribution kernels for pricing hot paths
+
+scipy.stats.norm.cdf/pdf route every call, scalar or not, through the
+generic rv_continuous machinery (argument checking, array wrapping,
+support masks), which costs tens of microseconds per scalar call. The
+scalar kernels here go straight to math.erfc / math.exp on Python floats;
+the batch kernels call the scipy.special ufunc directly and accept out=
+so callers can reuse buffers.
+"""
+
+import math
+from typing import Optional
+
+import numpy as np
+from scipy import special
+
+SQRT_2 = math.sqrt(2.0)
+INV_SQRT_2PI = 1.0 / math.sqrt(2.0 * math.pi)
+
+
+def norm_cdf(x: float) -> float:
+    """
+    Standard normal CDF of a scalar
+
+    Uses erfc rather than 1 + erf so the lower tail keeps full relative
+    precision (N(-10) ~ 7.6e-24 instead of 0).
+    """
+    return 0.5 * math.erfc(-x / SQRT_2)
+
+
+def norm_pdf(x: float) -> float:
+    """Standard normal PDF of a scalar"""
+    return INV_SQRT_2PI * math.exp(-0.5 * x * x)
+
+
+def batch_norm_cdf(x: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Standard normal CDF of an array
+
+    Args:
+        x: Input array
+        out: Optional output array (may be x itself)
+
+    Returns:
+        N(x) with the shape of x
+    """
+    cdf: np.ndarray = special.ndtr(x, out=out)
+    return cdf
+
+
+def batch_norm_pdf(x: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Standard normal PDF of an array
+
+    Args:
+        x: Input array
+        out: Optional output array (may be x itself)
+
+    Returns:
+        n(x) with the shape of x
+    """
+    x = np.asarray(x, dtype=float)
+    out = np.multiply(x, x, out=out)
+    out *= -0.5
+    np.exp(out, out=out)
+    out *= INV_SQRT_2PI
+    return out
@@ -3,7 +3,8 @@ Data models for Greeks calculation
 """
 
 from typing import Dict, Optional
-from pydantic import BaseModel, Field
+import numpy as np
+from pydantic import BaseModel, Field, ConfigDict
 
 
 class Greeks(BaseModel):
@@ -62,6 +63,67 @@ class Greeks(BaseModel):
         }
 
 
+class BatchGreeks(BaseModel):
+    """Per-share prices and Greeks for a batch of options (one array per output)"""
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    price: np.ndarray = Field(description="Option prices")
+    delta: np.ndarray = Field(description="Delta per share")
+    gamma: np.ndarray = Field(description="Gamma per share")
+    theta: np.ndarray = Field(description="Daily theta per share")
+    vega: np.ndarray = Field(description="Vega per share per 1% IV change")
+    rho: np.ndarray = Field(description="Rho per share per 1% rate change")
+
+    def __len__(self) -> int:
+        return self.price.size
+
+    def greeks_at(self, index: int, quantity: float = 1.0, spot: float = 0.0) -> Greeks:
+        """
+        Build a Greeks object for one element, scaled by quantity
+
+        Args:
+            index: Flat index into the batch
+            quantity: Position size times contract multiplier
+            spot: Spot price used for dollar-denominated Greeks
+
+        Returns:
+            Greeks object matching BlackScholesModel.calculate_all_greeks
+        """
+        delta = float(self.delta.flat[index])
+        gamma = float(self.gamma.flat[index])
+        theta = float(self.theta.flat[index])
+        vega = float(self.vega.flat[index])
+        rho = float(self.rho.flat[index])
+
+        return Greeks(
+            delta=delta * quantity,
+            gamma=gamma * quantity,
+            theta=theta * quantity,
+            vega=vega * quantity,
+            rho=rho * quantity,
+            delta_dollars=delta * quantity * spot,
+            gamma_dollars=gamma * quantity * spot * 0.01,
+            theta_dollars=theta * quantity,
+            vega_dollars=vega * quantity
+        )
+
+
+class ImpliedVolatilityResult(BaseModel):
+    """Result of a batched implied volatility solve"""
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    implied_volatility: np.ndarray = Field(description="Implied volatility per quote")
+    converged: np.ndarray = Field(description="True where the solver met the precision target")
+    iterations: np.ndarray = Field(description="Iterations used per quote")
+
+    @property
+    def convergence_rate(self) -> float:
+        """Fraction of quotes that converged"""
+        if self.converged.size == 0:
+            return 0.0
+        return float(np.mean(self.converged))
+
+
 class GreeksByUnderlying(BaseModel):
     """Greeks grouped by underlying symbol"""
     symbol: str
@@ -9,6 +9,7 @@ from .client import (
     AuthenticationError,
     TimeoutError,
 )
+from .async_client import AsyncIBClient
 from .models import (
     SecType,
     Position,
@@ -25,6 +26,7 @@ from .models import (
 __all__ = [
     # Client
     "IBClient",
+    "AsyncIBClient",
     "ConnectionState",
     "ConnectionError",
     "AuthenticationError",
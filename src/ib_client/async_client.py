@@ -0,0 +1,320 @@
+"""
+Async IB Client - asyncio-native counterpart of IBClient
+
+AsyncIBClient is a full IBClient. Its blocking I/O methods also have awaitable
+*_async versions built on ib_insync's *Async APIs, so positions, account
+summary and market data can be fetched concurrently and overlapped with
+other work (e.g. Greeks computation) instead of blocking the caller on
+time.sleep / ib.sleep.
+"""
+
+import asyncio
+import time
+from types import TracebackType
+from typing import Dict, List, Optional, Tuple, Type
+
+from loguru import logger
+
+from .client import IB_INSYNC_AVAILABLE, ConnectionState, IBClient
+from .models import AccountSummary, MarketData, Position
+
+if IB_INSYNC_AVAILABLE:
+    from ib_insync import IB
+
+
+class AsyncIBClient(IBClient):
+    """
+    Asyncio Interactive Brokers API Client
+
+    The IBClient methods keep their blocking behaviour, so the client can be
+    passed anywhere an IBClient is expected. Each I/O method also has an
+    awaitable *_async version that shares state handling, contract conversion,
+    the snapshot window and simulation data with IBClient.
+
+    Example:
+        async with AsyncIBClient() as client:
+            await client.connect_async(port=7497)
+            positions, account, market_data = await client.fetch_portfolio_async()
+    """
+
+    async def connect_async(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 7497,
+        client_id: int = 1,
+        timeout: int = 30,
+        readonly: bool = True,
+        account: str = ""
+    ) -> bool:
+        """
+        Connect to IB TWS or Gateway without blocking the event loop
+
+        Args:
+            host: IB host address
+            port: IB port (7497=TWS Paper, 7496=TWS Live, 4001=Gateway Paper, 4002=Gateway Live)
+            client_id: Client ID for connection
+            timeout: Connection timeout in seconds
+            readonly: If True, connect in read-only mode
+            account: Account ID to use (empty for default)
+
+        Returns:
+            True if connected successfully
+        """
+        self._cache_connection_params(host, port, client_id, timeout, readonly, account)
+
+        if self._simulation_mode:
+            return self._connect_simulated(host, port, account)
+
+        self._set_state(ConnectionState.CONNECTING)
+
+        try:
+            logger.info(f"Connecting to IB at {host}:{port} with client_id={client_id}")
+
+            self._ib = IB()
+            await self._ib.connectAsync(
+                host=host,
+                port=port,
+                clientId=client_id,
+                timeout=timeout,
+                readonly=readonly,
+                account=account
+            )
+
+            self._on_connected(account)
+            return True
+
+        except Exception as e:
+            self._on_connect_failed(e)
+            return False
+
+    async def reconnect_async(self) -> bool:
+        """
+        尝试重新连接到 IB (指数退避, 不阻塞事件循环)
+
+        Returns:
+            True if reconnected successfully
+        """
+        delay = self._next_reconnect_delay()
+        if delay is None:
+            return False
+
+        await asyncio.sleep(delay)
+
+        return await self.connect_async(**self._connection_params)
+
+    async def ensure_connected_async(self) -> bool:
+        """
+        确保已连接，如果断开则尝试重连
+
+        Returns:
+            True if connected (or reconnected successfully)
+        """
+        if self.is_connected:
+            return True
+
+        if self._reconnect_needed():
+            return await self.reconnect_async()
+
+        return False
+
+    async def check_connection_async(self) -> bool:
+        """
+        检查连接状态（心跳检测）
+
+        Returns:
+            True if connection is healthy
+        """
+        if self._simulation_mode:
+            return self._state == ConnectionState.CONNECTED
+
+        if not self._ib:
+            return False
+
+        try:
+            if self._ib.isConnected():
+                await self._ib.reqCurrentTimeAsync()
+                return True
+            else:
+                self._set_state(ConnectionState.DISCONNECTED)
+                return False
+        except Exception as e:
+            logger.warning(f"Connection check failed: {e}")
+            self._set_state(ConnectionState.ERROR, str(e))
+            return False
+
+    async def get_positions_async(self) -> List[Position]:
+        """
+        Get all portfolio positions
+
+        Returns:
+            List of Position objects
+        """
+        if not self.is_connected:
+            logger.error("Not connected to IB. Cannot get positions.")
+            return []
+
+        if self._simulation_mode:
+            return self._get_simulated_positions()
+
+        try:
+            logger.info("Fetching positions from IB...")
+            ib_positions = await self._ib.reqPositionsAsync()
+            if self._account_id:
+                ib_positions = [p for p in ib_positions if p.account == self._account_id]
+            return self._convert_ib_positions(ib_positions)
+
+        except Exception as e:
+            logger.error(f"Error fetching positions: {e}")
+            return []
+
+    async def get_account_summary_async(self) -> Optional[AccountSummary]:
+        """
+        Get account summary information
+
+        Returns:
+            AccountSummary object or None
+        """
+        if not self.is_connected:
+            logger.error("Not connected to IB. Cannot get account summary.")
+            return None
+
+        if self._simulation_mode:
+            return self._get_simulated_account_summary()
+
+        try:
+            logger.info("Fetching account summary...")
+            account_values = await self._ib.accountSummaryAsync(self._account_id)
+            return self._build_account_summary(account_values)
+
+        except Exception as e:
+            logger.error(f"Error fetching account summary: {e}")
+            return None
+
+    async def get_market_data_async(
+        self,
+        positions: Optional[List[Position]] = None,
+        timeout: int = 10,
+        batched: bool = True,
+        max_concurrent_lines: int = 90
+    ) -> Dict[int, MarketData]:
+        """
+        Get market data snapshots for positions concurrently
+
+        Same streamed/snapshot split and sliding window as
+        IBClient.get_market_data, but waiting yields to the event loop instead
+        of blocking in ib.sleep.
+
+        Args:
+            positions: List of positions (uses cache if None)
+            timeout: Global deadline for all snapshots in seconds
+            batched: Run max_concurrent_lines snapshots at once (False requests
+                one snapshot at a time)
+            max_concurrent_lines: Maximum simultaneous market data lines
+
+        Returns:
+            Dictionary mapping conId to MarketData
+        """
+        if not self.is_connected:
+            logger.error("Not connected to IB. Cannot get market data.")
+            return {}
+
+        if positions is None:
+            positions = self._positions_cache
+
+        streamed, pending = self._split_streamed(positions)
+        if not pending:
+            return streamed
+
+        if self._simulation_mode:
+            streamed.update(self._get_simulated_market_data(pending))
+            return streamed
+
+        market_data: Dict[int, MarketData] = {}
+        try:
+            logger.info(f"Fetching market data for {len(pending)} positions...")
+
+            deadline = time.monotonic() + timeout
+            contracts = [self._create_contract_from_position(pos) for pos in pending]
+            await self._ib.qualifyContractsAsync(*contracts)
+
+            window = self._snapshot_window(
+                pending, contracts, deadline,
+                max_concurrent_lines if batched else 1, market_data
+            )
+            try:
+                while window.advance():
+                    await asyncio.sleep(0.05)
+            finally:
+                window.close()
+
+        except Exception as e:
+            logger.error(f"Error fetching market data: {e}")
+
+        return self._merge_snapshots(streamed, pending, market_data)
+
+    async def subscribe_market_data_async(
+        self,
+        positions: Optional[List[Position]] = None
+    ) -> int:
+        """
+        Keep streaming market data lines open for a position set
+
+        Args:
+            positions: Positions to stream (uses cache if None)
+
+        Returns:
+            Number of open subscriptions
+        """
+        if not self.is_connected:
+            logger.error("Not connected to IB. Cannot subscribe to market data.")
+            return 0
+
+        if positions is None:
+            positions = self._positions_cache
+
+        if self._simulation_mode:
+            return self._subscribe_simulated(positions)
+
+        new_positions = self._prune_subscriptions(positions)
+        contracts = [self._create_contract_from_position(pos) for pos in new_positions]
+        if contracts:
+            try:
+                await self._ib.qualifyContractsAsync(*contracts)
+            except Exception as e:
+                logger.error(f"Error qualifying contracts for streaming: {e}")
+                return len(self._subscriptions)
+
+        self._open_stream_lines(self._qualified_requests(new_positions, contracts))
+        return len(self._subscriptions)
+
+    async def fetch_portfolio_async(
+        self,
+        timeout: int = 10
+    ) -> Tuple[List[Position], Optional[AccountSummary], Dict[int, MarketData]]:
+        """
+        Fetch positions and account summary concurrently, then market data
+
+        Args:
+            timeout: Market data deadline in seconds
+
+        Returns:
+            Tuple of (positions, account summary, market data)
+        """
+        positions, account = await asyncio.gather(
+            self.get_positions_async(),
+            self.get_account_summary_async()
+        )
+        market_data = await self.get_market_data_async(positions, timeout=timeout)
+        return positions, account, market_data
+
+    async def __aenter__(self) -> "AsyncIBClient":
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_val: Optional[BaseException],
+        exc_tb: Optional[TracebackType]
+    ) -> bool:
+        self.disconnect()
+        return False
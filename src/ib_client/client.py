@@ -3,10 +3,12 @@ IB Client - Main client class for Interactive Brokers API
 """
 
 import asyncio
+import math
 import time
+from collections import deque
 from datetime import date, datetime
 from enum import Enum
-from typing import Dict, List, Optional, Any, Callable
+from typing import Dict, List, Optional, Any, Callable, Tuple
 from loguru import logger
 
 try:
@@ -69,12 +71,18 @@ class IBClient:
             max_reconnect_attempts: Maximum number of reconnection attempts
             reconnect_delay: Base delay between reconnection attempts (exponential backoff)
         """
-        self._ib: Optional[Any] = None
+        self._ib: Any = None
         self._simulation_mode = simulation_mode or not IB_INSYNC_AVAILABLE
         self._account_id: str = ""
         self._positions_cache: List[Position] = []
         self._market_data_cache: Dict[int, MarketData] = {}
 
+        # 流式行情订阅: conId -> (position, contract, ticker), 以及每个 conId 的更新版本号
+        self._subscriptions: Dict[int, tuple] = {}
+        self._stream_con_ids: Dict[int, int] = {}
+        self._market_data_versions: Dict[int, int] = {}
+        self._streaming_handler_attached: bool = False
+
         # 连接状态管理
         self._state: ConnectionState = ConnectionState.DISCONNECTED
         self._last_error: Optional[str] = None
@@ -128,6 +136,11 @@ class IBClient:
         """设置错误回调"""
         self._on_error = callback
 
+    @property
+    def simulation_mode(self) -> bool:
+        """Check if the client serves simulated data instead of a real IB connection"""
+        return self._simulation_mode
+
     @property
     def is_connected(self) -> bool:
         """Check if connected to IB"""
@@ -159,21 +172,10 @@ class IBClient:
             True if connected successfully
         """
         # 缓存连接参数用于重连
-        self._connection_params = {
-            "host": host,
-            "port": port,
-            "client_id": client_id,
-            "timeout": timeout,
-            "readonly": readonly,
-            "account": account
-        }
+        self._cache_connection_params(host, port, client_id, timeout, readonly, account)
 
         if self._simulation_mode:
-            logger.info(f"Simulation mode: Simulating connection to {host}:{port}")
-            self._set_state(ConnectionState.CONNECTED)
-            self._account_id = account or "DU1234567"
-            logger.info(f"Connected to simulated account: {self._account_id}")
-            return True
+            return self._connect_simulated(host, port, account)
 
         self._set_state(ConnectionState.CONNECTING)
 
@@ -190,56 +192,101 @@ class IBClient:
                 account=account
             )
 
-            accounts = self._ib.managedAccounts()
-            self._account_id = account if account else accounts[0] if accounts else ""
-
-            self._set_state(ConnectionState.CONNECTED)
-            self._reconnect_attempts = 0  # 重置重连计数
-            logger.info(f"Successfully connected to IB. Account: {self._account_id}")
-            logger.debug(f"Available accounts: {accounts}")
-
+            self._on_connected(account)
             return True
 
         except Exception as e:
-            error_msg = f"Failed to connect to IB: {e}"
-            self._set_state(ConnectionState.ERROR, error_msg)
+            self._on_connect_failed(e)
+            return False
 
-            # 触发错误回调
-            if self._on_error:
-                try:
-                    self._on_error(error_msg)
-                except Exception as cb_error:
-                    logger.warning(f"Error in error callback: {cb_error}")
+    def _cache_connection_params(
+        self,
+        host: str,
+        port: int,
+        client_id: int,
+        timeout: int,
+        readonly: bool,
+        account: str
+    ) -> None:
+        """缓存连接参数用于重连"""
+        self._connection_params = {
+            "host": host,
+            "port": port,
+            "client_id": client_id,
+            "timeout": timeout,
+            "readonly": readonly,
+            "account": account
+        }
 
-            return False
+    def _on_connected(self, account: str) -> None:
+        """连接成功后的账户选择与状态更新"""
+        accounts = self._ib.managedAccounts()
+        self._account_id = account if account else accounts[0] if accounts else ""
 
-    def reconnect(self) -> bool:
-        """
-        尝试重新连接到 IB
+        self._set_state(ConnectionState.CONNECTED)
+        self._reconnect_attempts = 0  # 重置重连计数
+        logger.info(f"Successfully connected to IB. Account: {self._account_id}")
+        logger.debug(f"Available accounts: {accounts}")
 
-        使用缓存的连接参数和指数退避策略进行重连
+    def _on_connect_failed(self, error: Exception) -> None:
+        """连接失败时更新状态并触发错误回调"""
+        error_msg = f"Failed to connect to IB: {error}"
+        self._set_state(ConnectionState.ERROR, error_msg)
+
+        # 触发错误回调
+        if self._on_error:
+            try:
+                self._on_error(error_msg)
+            except Exception as cb_error:
+                logger.warning(f"Error in error callback: {cb_error}")
+
+    def _connect_simulated(self, host: str, port: int, account: str) -> bool:
+        """模拟模式下的连接"""
+        logger.info(f"Simulation mode: Simulating connection to {host}:{port}")
+        self._set_state(ConnectionState.CONNECTED)
+        self._account_id = account or "DU1234567"
+        logger.info(f"Connected to simulated account: {self._account_id}")
+        return True
+
+    def _next_reconnect_delay(self) -> Optional[float]:
+        """
+        检查重连条件并返回本次重连前的退避延迟
 
         Returns:
-            True if reconnected successfully
+            Delay in seconds, or None if reconnection should not be attempted
         """
         if not self._connection_params:
             logger.error("No cached connection parameters. Call connect() first.")
-            return False
+            return None
 
         if self._reconnect_attempts >= self._max_reconnect_attempts:
             error_msg = f"Max reconnection attempts ({self._max_reconnect_attempts}) reached"
             self._set_state(ConnectionState.ERROR, error_msg)
             logger.error(error_msg)
-            return False
+            return None
 
         self._reconnect_attempts += 1
-        delay = self._reconnect_delay * (2 ** (self._reconnect_attempts - 1))
+        delay = self._reconnect_delay * 2.0 ** (self._reconnect_attempts - 1)
 
         logger.info(
             f"Reconnection attempt {self._reconnect_attempts}/{self._max_reconnect_attempts} "
             f"in {delay:.1f}s..."
         )
         self._set_state(ConnectionState.RECONNECTING)
+        return delay
+
+    def reconnect(self) -> bool:
+        """
+        尝试重新连接到 IB
+
+        使用缓存的连接参数和指数退避策略进行重连
+
+        Returns:
+            True if reconnected successfully
+        """
+        delay = self._next_reconnect_delay()
+        if delay is None:
+            return False
 
         # 等待后重试
         time.sleep(delay)
@@ -249,6 +296,9 @@ class IBClient:
 
     def disconnect(self) -> None:
         """Disconnect from IB"""
+        if self._subscriptions:
+            self.unsubscribe_market_data()
+
         if self._simulation_mode:
             logger.info("Simulation mode: Disconnecting")
             self._set_state(ConnectionState.DISCONNECTED)
@@ -273,14 +323,21 @@ class IBClient:
         if self.is_connected:
             return True
 
+        if self._reconnect_needed():
+            return self.reconnect()
+
+        return False
+
+    def _reconnect_needed(self) -> bool:
+        """判断断开后是否需要重连 (出错时重置重连计数)"""
         if self._state == ConnectionState.DISCONNECTED:
             logger.warning("Connection lost. Attempting to reconnect...")
-            return self.reconnect()
+            return True
 
         if self._state == ConnectionState.ERROR:
             # 如果之前出错，重置重连计数后重试
             self._reconnect_attempts = 0
-            return self.reconnect()
+            return True
 
         return False
 
@@ -328,23 +385,27 @@ class IBClient:
         try:
             logger.info("Fetching positions from IB...")
             ib_positions = self._ib.positions(self._account_id)
-            positions = []
-
-            for pos in ib_positions:
-                contract = pos.contract
-                position = self._convert_ib_position(pos, contract)
-                if position:
-                    positions.append(position)
-                    position.log_details()
-
-            logger.info(f"Retrieved {len(positions)} positions")
-            self._positions_cache = positions
-            return positions
+            return self._convert_ib_positions(ib_positions)
 
         except Exception as e:
             logger.error(f"Error fetching positions: {e}")
             return []
 
+    def _convert_ib_positions(self, ib_positions: List[Any]) -> List[Position]:
+        """Convert IB positions, update the positions cache and return them"""
+        positions = []
+
+        for pos in ib_positions:
+            contract = pos.contract
+            position = self._convert_ib_position(pos, contract)
+            if position:
+                positions.append(position)
+                position.log_details()
+
+        logger.info(f"Retrieved {len(positions)} positions")
+        self._positions_cache = positions
+        return positions
+
     def _convert_ib_position(self, pos: Any, contract: Any) -> Optional[Position]:
         """
         Convert IB position to our Position model
@@ -552,39 +613,44 @@ class IBClient:
         try:
             logger.info("Fetching account summary...")
             account_values = self._ib.accountSummary(self._account_id)
-
-            summary_dict = {}
-            for av in account_values:
-                summary_dict[av.tag] = float(av.value) if av.value else 0.0
-
-            summary = AccountSummary(
-                account_id=self._account_id,
-                net_liquidation=summary_dict.get("NetLiquidation", 0),
-                total_cash=summary_dict.get("TotalCashValue", 0),
-                settled_cash=summary_dict.get("SettledCash", 0),
-                buying_power=summary_dict.get("BuyingPower", 0),
-                equity_with_loan=summary_dict.get("EquityWithLoanValue", 0),
-                gross_position_value=summary_dict.get("GrossPositionValue", 0),
-                maintenance_margin=summary_dict.get("MaintMarginReq", 0),
-                initial_margin=summary_dict.get("InitMarginReq", 0),
-                available_funds=summary_dict.get("AvailableFunds", 0),
-                excess_liquidity=summary_dict.get("ExcessLiquidity", 0),
-                sma=summary_dict.get("SMA", 0),
-                unrealized_pnl=summary_dict.get("UnrealizedPnL", 0),
-                realized_pnl=summary_dict.get("RealizedPnL", 0)
-            )
-
-            summary.log_summary()
-            return summary
+            return self._build_account_summary(account_values)
 
         except Exception as e:
             logger.error(f"Error fetching account summary: {e}")
             return None
 
+    def _build_account_summary(self, account_values: List[Any]) -> AccountSummary:
+        """Build AccountSummary from IB account values"""
+        summary_dict = {}
+        for av in account_values:
+            summary_dict[av.tag] = float(av.value) if av.value else 0.0
+
+        summary = AccountSummary(
+            account_id=self._account_id,
+            net_liquidation=summary_dict.get("NetLiquidation", 0),
+            total_cash=summary_dict.get("TotalCashValue", 0),
+            settled_cash=summary_dict.get("SettledCash", 0),
+            buying_power=summary_dict.get("BuyingPower", 0),
+            equity_with_loan=summary_dict.get("EquityWithLoanValue", 0),
+            gross_position_value=summary_dict.get("GrossPositionValue", 0),
+            maintenance_margin=summary_dict.get("MaintMarginReq", 0),
+            initial_margin=summary_dict.get("InitMarginReq", 0),
+            available_funds=summary_dict.get("AvailableFunds", 0),
+            excess_liquidity=summary_dict.get("ExcessLiquidity", 0),
+            sma=summary_dict.get("SMA", 0),
+            unrealized_pnl=summary_dict.get("UnrealizedPnL", 0),
+            realized_pnl=summary_dict.get("RealizedPnL", 0)
+        )
+
+        summary.log_summary()
+        return summary
+
     def get_market_data(
         self,
         positions: Optional[List[Position]] = None,
-        timeout: int = 10
+        timeout: int = 10,
+        batched: bool = True,
+        max_concurrent_lines: int = 90
     ) -> Dict[int, MarketData]:
         """
         Get market data for positions
@@ -592,6 +658,15 @@ class IBClient:
         Args:
             positions: List of positions (uses cache if None)
             timeout: Timeout for data request
+            batched: Qualify all contracts at once and request snapshots
+                concurrently (False uses the one-at-a-time loop)
+            max_concurrent_lines: Maximum simultaneous market data lines
+                (IB's default allowance is 100)
+
+        Positions covered by a streaming subscription are served from the
+        live cache; snapshots are only requested for the rest, so their
+        streaming lines are never cancelled. Snapshot results are merged
+        into the cache, keeping the streamed quotes of other positions.
 
         Returns:
             Dictionary mapping conId to MarketData
@@ -603,53 +678,219 @@ class IBClient:
         if positions is None:
             positions = self._positions_cache
 
+        self._process_stream_updates()
+        streamed, pending = self._split_streamed(positions)
+        if not pending:
+            return streamed
+
         if self._simulation_mode:
-            return self._get_simulated_market_data(positions)
+            streamed.update(self._get_simulated_market_data(pending))
+            return streamed
 
+        market_data: Dict[int, MarketData] = {}
         try:
-            logger.info(f"Fetching market data for {len(positions)} positions...")
-            market_data = {}
-
-            for pos in positions:
-                contract = self._create_contract_from_position(pos)
-
-                try:
-                    self._ib.qualifyContracts(contract)
-                    ticker = self._ib.reqMktData(contract, snapshot=True)
-                    self._ib.sleep(timeout / len(positions) if positions else 1)
-
-                    md = MarketData(
-                        symbol=pos.symbol,
-                        con_id=pos.con_id,
-                        bid=ticker.bid if ticker.bid > 0 else 0,
-                        ask=ticker.ask if ticker.ask > 0 else 0,
-                        last=ticker.last if ticker.last > 0 else 0,
-                        close=ticker.close if ticker.close > 0 else 0,
-                        high=ticker.high if ticker.high > 0 else 0,
-                        low=ticker.low if ticker.low > 0 else 0,
-                        volume=int(ticker.volume) if ticker.volume else 0
-                    )
-
-                    # Get option-specific data
-                    if pos.is_option and hasattr(ticker, 'modelGreeks'):
-                        if ticker.modelGreeks:
-                            md.implied_volatility = ticker.modelGreeks.impliedVol
-                            md.underlying_price = ticker.modelGreeks.undPrice
-
-                    market_data[pos.con_id] = md
-                    logger.debug(f"Got market data for {pos.symbol}: mid={md.mid:.2f}")
-
-                    self._ib.cancelMktData(contract)
-
-                except Exception as e:
-                    logger.warning(f"Error getting market data for {pos.symbol}: {e}")
-
-            self._market_data_cache = market_data
-            return market_data
+            logger.info(f"Fetching market data for {len(pending)} positions...")
+
+            if batched:
+                self._get_market_data_batched(
+                    pending, timeout, max_concurrent_lines, market_data
+                )
+            else:
+                self._get_market_data_sequential(pending, timeout, market_data)
 
         except Exception as e:
             logger.error(f"Error fetching market data: {e}")
-            return {}
+
+        return self._merge_snapshots(streamed, pending, market_data)
+
+    def _split_streamed(
+        self,
+        positions: List[Position]
+    ) -> Tuple[Dict[int, MarketData], List[Position]]:
+        """Split positions into streamed quotes and the positions that need a snapshot"""
+        streamed = self._streamed_market_data(positions)
+        pending = [pos for pos in positions if pos.con_id not in streamed]
+        return streamed, pending
+
+    def _merge_snapshots(
+        self,
+        streamed: Dict[int, MarketData],
+        pending: List[Position],
+        market_data: Dict[int, MarketData]
+    ) -> Dict[int, MarketData]:
+        """Cache the snapshots that arrived, report the rest and add them to streamed"""
+        self._log_missing_market_data(pending, market_data)
+        self._market_data_cache.update(market_data)
+        streamed.update(market_data)
+        return streamed
+
+    def _get_market_data_sequential(
+        self,
+        positions: List[Position],
+        timeout: int,
+        market_data: Dict[int, MarketData]
+    ) -> None:
+        """Request one snapshot at a time, giving each an equal slice of the timeout"""
+        for pos in positions:
+            contract = self._create_contract_from_position(pos)
+
+            try:
+                self._ib.qualifyContracts(contract)
+                ticker = self._ib.reqMktData(contract, snapshot=True)
+                self._ib.sleep(timeout / len(positions) if positions else 1)
+            except Exception as e:
+                logger.warning(f"Error getting market data for {pos.symbol}: {e}")
+                continue
+
+            self._collect_snapshot(pos, contract, ticker, market_data)
+
+    def _get_market_data_batched(
+        self,
+        positions: List[Position],
+        timeout: int,
+        max_concurrent_lines: int,
+        market_data: Dict[int, MarketData]
+    ) -> None:
+        """
+        Qualify every contract in one call and request snapshots concurrently
+
+        Requests run through a sliding window of max_concurrent_lines lines
+        (see _SnapshotWindow), so the whole call is bounded by timeout rather
+        than timeout per position. Snapshots are written into market_data as
+        they arrive, so a failure part way keeps what was already received.
+        """
+        if not positions:
+            return
+
+        deadline = time.monotonic() + timeout
+        contracts = [self._create_contract_from_position(pos) for pos in positions]
+        self._ib.qualifyContracts(*contracts)
+
+        window = self._snapshot_window(
+            positions, contracts, deadline, max_concurrent_lines, market_data
+        )
+        try:
+            while window.advance():
+                self._ib.sleep(0.05)
+        finally:
+            window.close()
+
+    def _snapshot_window(
+        self,
+        positions: List[Position],
+        contracts: List[Any],
+        deadline: float,
+        max_concurrent_lines: int,
+        market_data: Dict[int, MarketData]
+    ) -> "_SnapshotWindow":
+        """Build the snapshot window for positions whose contracts were just qualified"""
+        return _SnapshotWindow(
+            self,
+            self._qualified_requests(positions, contracts),
+            deadline,
+            max_concurrent_lines,
+            market_data
+        )
+
+    @staticmethod
+    def _qualified_requests(
+        positions: List[Position],
+        contracts: List[Any]
+    ) -> List[tuple]:
+        """
+        Pair positions with their contracts, dropping ones that failed qualification
+
+        contracts is the list passed to qualifyContracts (qualified in place),
+        not its return value, so it always lines up with positions.
+        """
+        requests = []
+        for pos, contract in zip(positions, contracts, strict=True):
+            if not getattr(contract, "conId", 0):
+                logger.warning(f"Could not qualify contract for {pos.symbol}, skipping market data")
+                continue
+            requests.append((pos, contract))
+        return requests
+
+    def _collect_snapshot(
+        self,
+        pos: Position,
+        contract: Any,
+        ticker: Any,
+        market_data: Dict[int, MarketData]
+    ) -> None:
+        """
+        Store a snapshot ticker in market_data and release its line
+
+        Tickers that never received a price are left out, so they show up as
+        missing instead of as zero-priced quotes. Options priced without
+        modelGreeks are kept with a warning, their IV stays unset.
+        """
+        try:
+            if not self._ticker_has_price(ticker):
+                logger.debug(f"No quote received for {pos.symbol}")
+            else:
+                if not self._ticker_ready(pos, ticker):
+                    logger.warning(f"No model greeks received for {pos.symbol}, IV unavailable")
+                md = self._ticker_to_market_data(pos, ticker)
+                market_data[pos.con_id] = md
+                logger.debug(f"Got market data for {pos.symbol}: mid={md.mid:.2f}")
+        except Exception as e:
+            logger.warning(f"Error getting market data for {pos.symbol}: {e}")
+        finally:
+            try:
+                self._ib.cancelMktData(contract)
+            except Exception as e:
+                logger.debug(f"Error cancelling market data for {pos.symbol}: {e}")
+
+    @staticmethod
+    def _log_missing_market_data(
+        positions: List[Position],
+        market_data: Dict[int, MarketData]
+    ) -> None:
+        missing = [pos.symbol for pos in positions if pos.con_id not in market_data]
+        if missing:
+            logger.warning(
+                f"No market data for {len(missing)} of {len(positions)} positions: "
+                f"{', '.join(missing)}"
+            )
+
+    @staticmethod
+    def _ticker_has_price(ticker: Any) -> bool:
+        """Check whether a ticker has received any usable price"""
+        return bool((ticker.bid > 0 and ticker.ask > 0) or ticker.last > 0 or ticker.close > 0)
+
+    @classmethod
+    def _ticker_ready(cls, pos: Position, ticker: Any) -> bool:
+        """Check whether a snapshot ticker is complete (options also need modelGreeks)"""
+        if pos.is_option:
+            return (
+                cls._ticker_has_price(ticker)
+                and getattr(ticker, "modelGreeks", None) is not None
+            )
+        return cls._ticker_has_price(ticker)
+
+    @staticmethod
+    def _ticker_to_market_data(pos: Position, ticker: Any) -> MarketData:
+        """Convert an ib_insync Ticker to our MarketData model (NaN fields become 0)"""
+        md = MarketData(
+            symbol=pos.symbol,
+            con_id=pos.con_id,
+            bid=ticker.bid if ticker.bid > 0 else 0,
+            ask=ticker.ask if ticker.ask > 0 else 0,
+            last=ticker.last if ticker.last > 0 else 0,
+            close=ticker.close if ticker.close > 0 else 0,
+            high=ticker.high if ticker.high > 0 else 0,
+            low=ticker.low if ticker.low > 0 else 0,
+            volume=int(ticker.volume) if ticker.volume and ticker.volume > 0 else 0
+        )
+
+        # Get option-specific data
+        if pos.is_option and hasattr(ticker, 'modelGreeks'):
+            if ticker.modelGreeks:
+                md.implied_volatility = ticker.modelGreeks.impliedVol
+                md.underlying_price = ticker.modelGreeks.undPrice
+
+        return md
 
     def _create_contract_from_position(self, pos: Position) -> Any:
         """Create IB contract from Position"""
@@ -674,6 +915,208 @@ class IBClient:
             contract.conId = pos.con_id
             return contract
 
+    # ========== Streaming Methods ==========
+
+    @property
+    def is_streaming(self) -> bool:
+        """Check if any streaming market data lines are open"""
+        return bool(self._subscriptions)
+
+    def subscribe_market_data(self, positions: Optional[List[Position]] = None) -> int:
+        """
+        Keep streaming market data lines open for a position set
+
+        Lines for positions no longer in the set are cancelled, new positions
+        get a line, and existing lines are left untouched. Ticker updates are
+        written into the market data cache as they arrive.
+
+        Args:
+            positions: Positions to stream (uses cache if None)
+
+        Returns:
+            Number of open subscriptions
+        """
+        if not self.is_connected:
+            logger.error("Not connected to IB. Cannot subscribe to market data.")
+            return 0
+
+        if positions is None:
+            positions = self._positions_cache
+
+        if self._simulation_mode:
+            return self._subscribe_simulated(positions)
+
+        new_positions = self._prune_subscriptions(positions)
+        contracts = [self._create_contract_from_position(pos) for pos in new_positions]
+        if contracts:
+            try:
+                self._ib.qualifyContracts(*contracts)
+            except Exception as e:
+                logger.error(f"Error qualifying contracts for streaming: {e}")
+                return len(self._subscriptions)
+
+        self._open_stream_lines(self._qualified_requests(new_positions, contracts))
+        return len(self._subscriptions)
+
+    def unsubscribe_market_data(self, con_ids: Optional[List[int]] = None) -> None:
+        """
+        Cancel streaming market data lines
+
+        The last cached quote of a cancelled line stays in the cache.
+
+        Args:
+            con_ids: Contract IDs to cancel (all subscriptions if None)
+        """
+        if con_ids is None:
+            con_ids = list(self._subscriptions)
+
+        for con_id in con_ids:
+            subscription = self._subscriptions.pop(con_id, None)
+            if subscription is None:
+                continue
+            pos, contract, _ = subscription
+            self._stream_con_ids.pop(getattr(contract, "conId", 0), None)
+            if self._simulation_mode or self._ib is None:
+                continue
+            try:
+                self._ib.cancelMktData(contract)
+            except Exception as e:
+                logger.debug(f"Error cancelling market data for {pos.symbol}: {e}")
+
+        if not self._subscriptions and self._streaming_handler_attached:
+            if self._ib is not None:
+                self._ib.pendingTickersEvent -= self._on_pending_tickers
+            self._streaming_handler_attached = False
+
+        logger.info(f"Streaming market data: {len(self._subscriptions)} lines open")
+
+    def get_cached_market_data(self, con_id: int) -> Optional[MarketData]:
+        """
+        Get the latest cached quote for a contract
+
+        Args:
+            con_id: Contract ID
+
+        Returns:
+            MarketData or None if nothing has been received yet
+        """
+        return self._market_data_cache.get(con_id)
+
+    def market_data_version(self, con_id: int) -> int:
+        """
+        Get the update counter for a contract's cached quote
+
+        Args:
+            con_id: Contract ID
+
+        Returns:
+            Number of updates received (0 if none)
+        """
+        return self._market_data_versions.get(con_id, 0)
+
+    def get_market_data_updates(self, since: Dict[int, int]) -> Dict[int, MarketData]:
+        """
+        Get cached quotes that changed after the given versions
+
+        Typical use is feeding IncrementalGreeksEngine.update() with only the
+        quotes that moved since the previous refresh.
+
+        Args:
+            since: Dictionary mapping conId to the version last seen
+
+        Returns:
+            Dictionary mapping conId to MarketData for updated contracts
+        """
+        return {
+            con_id: self._market_data_cache[con_id]
+            for con_id, version in self._market_data_versions.items()
+            if version > since.get(con_id, 0) and con_id in self._market_data_cache
+        }
+
+    def _streamed_market_data(self, positions: List[Position]) -> Dict[int, MarketData]:
+        """Cached quotes of the positions that have a streaming subscription"""
+        return {
+            pos.con_id: self._market_data_cache[pos.con_id]
+            for pos in positions
+            if pos.con_id in self._subscriptions and pos.con_id in self._market_data_cache
+        }
+
+    def _process_stream_updates(self) -> None:
+        """
+        Dispatch ticker updates that arrived while the event loop was idle
+
+        A blocking caller only runs ib_insync's loop while it waits on IB, so
+        streamed quotes are refreshed before they are read from the cache.
+        """
+        if not self._subscriptions or self._simulation_mode or self._ib is None:
+            return
+        try:
+            self._ib.sleep(0)
+        except Exception as e:
+            logger.debug(f"Error processing streamed market data: {e}")
+
+    def _prune_subscriptions(self, positions: List[Position]) -> List[Position]:
+        """Cancel lines outside the position set; return positions not yet subscribed"""
+        wanted = {pos.con_id for pos in positions}
+        stale = [con_id for con_id in self._subscriptions if con_id not in wanted]
+        if stale:
+            self.unsubscribe_market_data(stale)
+        return [pos for pos in positions if pos.con_id not in self._subscriptions]
+
+    def _open_stream_lines(self, requests: List[tuple]) -> None:
+        """Open streaming lines for qualified (position, contract) pairs"""
+        if requests and not self._streaming_handler_attached:
+            self._ib.pendingTickersEvent += self._on_pending_tickers
+            self._streaming_handler_attached = True
+
+        for pos, contract in requests:
+            try:
+                ticker = self._ib.reqMktData(contract, snapshot=False)
+            except Exception as e:
+                logger.warning(f"Error subscribing to market data for {pos.symbol}: {e}")
+                continue
+            self._subscriptions[pos.con_id] = (pos, contract, ticker)
+            self._stream_con_ids[contract.conId] = pos.con_id
+
+        logger.info(f"Streaming market data: {len(self._subscriptions)} lines open")
+
+    def _on_pending_tickers(self, tickers: Any) -> None:
+        """pendingTickersEvent handler: write updated tickers into the cache"""
+        for ticker in tickers:
+            con_id = self._stream_con_ids.get(getattr(ticker.contract, "conId", 0))
+            if con_id is None:
+                continue
+            pos = self._subscriptions[con_id][0]
+            try:
+                self._update_cached_quote(pos, ticker)
+            except Exception as e:
+                logger.debug(f"Error updating streamed market data for {pos.symbol}: {e}")
+
+    def _update_cached_quote(self, pos: Position, ticker: Any) -> None:
+        """Convert a streamed ticker and bump the conId's version"""
+        md = self._ticker_to_market_data(pos, ticker)
+
+        # 期权的 modelGreeks 可能晚于价格到达, 保留上一次的 IV/标的价格
+        previous = self._market_data_cache.get(pos.con_id)
+        if previous is not None and pos.is_option:
+            if md.implied_volatility is None:
+                md.implied_volatility = previous.implied_volatility
+            if md.underlying_price is None:
+                md.underlying_price = previous.underlying_price
+
+        self._market_data_cache[pos.con_id] = md
+        self._market_data_versions[pos.con_id] = self._market_data_versions.get(pos.con_id, 0) + 1
+
+    def _subscribe_simulated(self, positions: List[Position]) -> int:
+        """Simulation mode: seed the cache once per new position"""
+        new_positions = self._prune_subscriptions(positions)
+        simulated = self._get_simulated_market_data(new_positions)
+        for pos in new_positions:
+            self._subscriptions[pos.con_id] = (pos, None, None)
+            self._market_data_cache[pos.con_id] = simulated[pos.con_id]
+            self._market_data_versions[pos.con_id] = self._market_data_versions.get(pos.con_id, 0) + 1
+        return len(self._subscriptions)
+
     # ========== Simulation Methods ==========
 
     def _get_simulated_positions(self) -> List[Position]:
@@ -853,3 +1296,68 @@ class IBClient:
     def __exit__(self, exc_type, exc_val, exc_tb):
         self.disconnect()
         return False
+
+
+class _SnapshotWindow:
+    """
+    Sliding window of snapshot requests over a fixed number of market data lines
+
+    A line is handed to the next queued request as soon as its ticker is
+    ready or its share of the time runs out, so one illiquid contract only
+    costs its own share instead of holding back every request queued behind
+    it. The share is the time left divided by the number of line rounds the
+    requests need, which keeps the worst case (every ticker timing out)
+    within the deadline. Requests still queued at the deadline are not sent.
+    """
+
+    def __init__(
+        self,
+        client: IBClient,
+        requests: List[tuple],
+        deadline: float,
+        max_lines: int,
+        market_data: Dict[int, MarketData]
+    ):
+        self._client = client
+        self._queue = deque(requests)
+        self._max_lines = max(1, max_lines)
+        self._deadline = deadline
+        rounds = max(1, math.ceil(len(requests) / self._max_lines))
+        self._line_timeout = max(0.0, deadline - time.monotonic()) / rounds
+        self._open: List[tuple] = []
+        self.market_data = market_data
+
+    def advance(self) -> bool:
+        """
+        Collect ready or expired lines and refill them from the queue
+
+        Returns:
+            True while any line is still open
+        """
+        now = time.monotonic()
+        still_open = []
+        for pos, contract, ticker, expires in self._open:
+            if now >= expires or self._client._ticker_ready(pos, ticker):
+                self._client._collect_snapshot(pos, contract, ticker, self.market_data)
+            else:
+                still_open.append((pos, contract, ticker, expires))
+        self._open = still_open
+
+        while self._queue and len(self._open) < self._max_lines and now < self._deadline:
+            pos, contract = self._queue.popleft()
+            try:
+                ticker = self._client._ib.reqMktData(contract, snapshot=True)
+            except Exception as e:
+                logger.warning(f"Error requesting market data for {pos.symbol}: {e}")
+                continue
+            expires = min(now + self._line_timeout, self._deadline)
+            self._open.append((pos, contract, ticker, expires))
+
+        return bool(self._open)
+
+    def close(self) -> None:
+        """Collect whatever the open lines hold and release them"""
+        for pos, contract, ticker, _ in self._open:
+            self._client._collect_snapshot(pos, contract, ticker, self.market_data)
+        self._open = []
+        self._queue.clear()
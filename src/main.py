@@ -146,14 +146,27 @@ def run_analysis(
         num_paths=mc_config.get("num_paths", num_paths),
         num_days=mc_config.get("num_days", num_days),
         random_seed=mc_config.get("random_seed"),
-        risk_free_rate=greeks_config.get("risk_free_rate", 0.05)
+        risk_free_rate=greeks_config.get("risk_free_rate", 0.05),
+        storage_dir=mc_config.get("storage_dir"),
+        chunk_size=mc_config.get("chunk_size"),
+        parallel_workers=mc_config.get("parallel_workers", 1),
+        sampler=mc_config.get("sampler", "pseudo"),
+        use_control_variate=mc_config.get("use_control_variate", False),
+        importance_sampling=mc_config.get("importance_sampling", False),
+        dtype=mc_config.get("dtype", "float64"),
+        repricing=mc_config.get("repricing", "exact"),
+        backend=mc_config.get("backend", "numpy")
     )
 
     simulation = simulator.simulate_portfolio(positions, market_data)
     results["simulation"] = simulation
 
     # Run scenario analysis
-    scenario_results = greeks_calc.scenario_analysis(positions, market_data)
+    scenario_results = greeks_calc.scenario_analysis(
+        positions,
+        market_data,
+        full_revaluation=greeks_config.get("full_revaluation_scenarios", False)
+    )
     results["scenarios"] = scenario_results
 
     # Step 4: Generate Visualizations
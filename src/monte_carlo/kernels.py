@@ -0,0 +1,226 @@
+"""
+Path kernels - inner loops of the simulator with NumPy and Numba backends
+
+Three loops dominate a simulation: turning normal draws into GBM price
+paths, Black-Scholes repricing of option legs at every (path, day), and the
+running-maximum scan behind per-path drawdowns. Each has a NumPy
+implementation (whole-array passes with reused buffers) and, when numba is
+importable, a JIT-compiled one that fuses the passes into a single loop per
+path, so no (paths x days) temporaries are created. Random draws always
+come from NumPy, so both backends consume the same stream and agree to
+floating point rounding.
+
+Backends are selected by name: "numpy" (the default), "numba", or "auto"
+(numba when available), so numba is only used when asked for. Requesting
+"numba" without numba installed falls back to NumPy with a warning.
+"""
+
+import math
+
+import numpy as np
+from loguru import logger
+
+from ..greeks.black_scholes import BlackScholesModel
+
+try:
+    import numba
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+BACKENDS = ("auto", "numpy", "numba")
+
+
+def resolve_backend(backend: str = "numpy") -> str:
+    """
+    Concrete backend for a backend setting
+
+    Args:
+        backend: "auto", "numpy" or "numba"
+
+    Returns:
+        "numba" or "numpy"
+    """
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown backend '{backend}', expected one of {BACKENDS}")
+    if backend == "auto":
+        return "numba" if NUMBA_AVAILABLE else "numpy"
+    if backend == "numba" and not NUMBA_AVAILABLE:
+        logger.warning("numba not installed, using the NumPy backend")
+        return "numpy"
+    return backend
+
+
+def gbm_paths(
+    z: np.ndarray,
+    daily_drift: float,
+    daily_vol: float,
+    spot: float,
+    out: np.ndarray,
+    backend: str = "numpy"
+) -> np.ndarray:
+    """
+    Fill GBM price paths from standard normal draws
+
+    out[:, 0] = spot and out[:, t + 1] = spot * exp(sum of
+    daily_drift + daily_vol * z[:, :t + 1]). Pre-scaled log returns can be
+    passed as z with daily_vol = 1.
+
+    Args:
+        z: Draws of shape (num_paths, num_days)
+        daily_drift: Per-step log drift
+        daily_vol: Per-step volatility
+        spot: Initial price
+        out: Output of shape (num_paths, num_days + 1), e.g. a row block of
+            a memory-mapped path array
+        backend: "numpy" or "numba" (see resolve_backend)
+
+    Returns:
+        out
+    """
+    if backend == "numba":
+        _gbm_paths_numba(z, out.dtype.type(daily_drift), out.dtype.type(daily_vol),
+                         out.dtype.type(spot), out)
+        return out
+
+    out[:, 0] = spot
+    log_prices = out[:, 1:]
+    np.multiply(z, out.dtype.type(daily_vol), out=log_prices)
+    log_prices += out.dtype.type(daily_drift)
+    np.cumsum(log_prices, axis=1, out=log_prices)
+    np.exp(log_prices, out=log_prices)
+    log_prices *= out.dtype.type(spot)
+    return out
+
+
+def option_prices(
+    price_paths: np.ndarray,
+    strike: float,
+    time_to_expiry: np.ndarray,
+    rate: float,
+    volatility: float,
+    is_call: bool,
+    backend: str = "numpy"
+) -> np.ndarray:
+    """
+    Per-share Black-Scholes value of one option leg along price paths
+
+    Matches BlackScholesModel.batch_price (no dividend yield), including its
+    rules for expired legs and degenerate inputs.
+
+    Args:
+        price_paths: Underlying prices of shape (num_paths, num_steps)
+        strike: Strike price
+        time_to_expiry: Time to expiry in years per step, shape (num_steps,)
+        rate: Risk-free rate
+        volatility: Implied volatility
+        is_call: True for a call, False for a put
+        backend: "numpy" or "numba" (see resolve_backend)
+
+    Returns:
+        float64 array of shape (num_paths, num_steps)
+    """
+    time_to_expiry = np.asarray(time_to_expiry, dtype=np.float64)
+    if backend == "numba":
+        prices: np.ndarray = _option_prices_numba(
+            price_paths, float(strike), time_to_expiry, float(rate), float(volatility),
+            bool(is_call)
+        )
+        return prices
+
+    return BlackScholesModel.batch_price(
+        price_paths, strike, time_to_expiry[np.newaxis, :], rate, volatility, is_call
+    )
+
+
+def max_drawdowns(paths: np.ndarray, backend: str = "numpy") -> np.ndarray:
+    """
+    Maximum drawdown of every row of a (num_paths, num_steps) block
+
+    The NumPy backend takes the row-wise running maximum on the whole 2-D
+    block, then the largest relative drop below it, reusing the running-max
+    buffer for the ratio. The Numba backend tracks both in one scan per row.
+    """
+    drawdowns: np.ndarray
+    if backend == "numba":
+        drawdowns = _max_drawdowns_numba(paths)
+        return drawdowns
+
+    ratio = np.maximum.accumulate(paths, axis=1)
+    np.divide(paths, ratio, out=ratio)
+    drawdowns = 1.0 - ratio.min(axis=1)
+    return drawdowns
+
+
+if NUMBA_AVAILABLE:
+    _SQRT_2 = math.sqrt(2.0)
+
+    @numba.njit(cache=True, parallel=True)
+    def _gbm_paths_numba(
+        z: np.ndarray,
+        daily_drift: float,
+        daily_vol: float,
+        spot: float,
+        out: np.ndarray
+    ) -> None:
+        num_paths, num_days = z.shape
+        for i in numba.prange(num_paths):
+            out[i, 0] = spot
+            log_price = daily_drift - daily_drift
+            for t in range(num_days):
+                log_price += daily_vol * z[i, t] + daily_drift
+                out[i, t + 1] = spot * math.exp(log_price)
+
+    @numba.njit(cache=True, parallel=True)
+    def _option_prices_numba(
+        price_paths: np.ndarray,
+        strike: float,
+        time_to_expiry: np.ndarray,
+        rate: float,
+        volatility: float,
+        is_call: bool
+    ) -> np.ndarray:
+        num_paths, num_steps = price_paths.shape
+        sign = 1.0 if is_call else -1.0
+
+        # Per-step terms shared by every path
+        live = time_to_expiry > 0
+        sqrt_t = np.sqrt(np.maximum(time_to_expiry, 0.0))
+        sigma_sqrt_t = volatility * sqrt_t
+        drift = (rate + 0.5 * volatility ** 2) * time_to_expiry
+        strike_r = strike * np.exp(-rate * np.where(live, time_to_expiry, 0.0))
+
+        out = np.empty((num_paths, num_steps))
+        for i in numba.prange(num_paths):
+            for t in range(num_steps):
+                spot = float(price_paths[i, t])
+                if not live[t]:
+                    price = sign * (spot - strike)
+                else:
+                    d1 = 0.0
+                    if volatility > 0 and spot > 0 and strike > 0:
+                        d1 = (math.log(spot / strike) + drift[t]) / sigma_sqrt_t[t]
+                    d2 = d1 - sigma_sqrt_t[t] if volatility > 0 else 0.0
+                    price = sign * (
+                        spot * 0.5 * math.erfc(-sign * d1 / _SQRT_2) -
+                        strike_r[t] * 0.5 * math.erfc(-sign * d2 / _SQRT_2)
+                    )
+                out[i, t] = max(price, 0.0)
+        return out
+
+    @numba.njit(cache=True, parallel=True)
+    def _max_drawdowns_numba(paths: np.ndarray) -> np.ndarray:
+        num_paths, num_steps = paths.shape
+        out = np.empty(num_paths)
+        for i in numba.prange(num_paths):
+            running_max = paths[i, 0]
+            lowest_ratio = 1.0
+            for t in range(1, num_steps):
+                value = paths[i, t]
+                if value > running_max:
+                    running_max = value
+                ratio = value / running_max
+                if ratio < lowest_ratio:
+                    lowest_ratio = ratio
+            out[i] = 1.0 - lowest_ratio
+        return out
@@ -2,19 +2,88 @@
 Data models for Monte Carlo simulation
 """
 
-from typing import Dict, List, Optional
+import json
+from pathlib import Path
+from typing import Any, Dict, List, Literal, Optional, Sequence, Union
 import numpy as np
-from pydantic import BaseModel, Field, ConfigDict
+from pydantic import BaseModel, Field, ConfigDict, field_validator, field_serializer
+
+from .storage import column_percentiles, partition_percentiles, store_array
+
+# Levels reported by PercentileResults (field p<level>)
+PERCENTILE_LEVELS = (1, 5, 10, 25, 50, 75, 90, 95, 99)
+
+# Normal draw generators of SimulationConfig.sampler
+Sampler = Literal["pseudo", "sobol"]
+
+# Path and draw precisions of SimulationConfig.dtype
+PathDType = Literal["float64", "float32"]
+
+# Option valuation modes of SimulationConfig.repricing
+Repricing = Literal["exact", "surface"]
+
+# Path kernel backends of SimulationConfig.backend
+Backend = Literal["auto", "numpy", "numba"]
+
+# 1-D / 2-D array fields of SimulationResult stored as individual .npy files
+_ARRAY_FIELDS = ("portfolio_value_paths", "final_values", "pnl_distribution", "return_distribution")
+
+
+def _as_float_array(value: Any) -> np.ndarray:
+    """Convert to a floating point ndarray, reusing float32/float64 arrays as-is"""
+    if isinstance(value, np.ndarray) and value.dtype in (np.float32, np.float64):
+        return value
+    return np.asarray(value, dtype=np.float64)
 
 
 class SimulationConfig(BaseModel):
     """Configuration for Monte Carlo simulation"""
-    num_paths: int = Field(default=10000, ge=100, le=1000000)
+    num_paths: int = Field(default=10000, ge=100, le=100_000_000)
     num_days: int = Field(default=30, ge=1, le=365)
     random_seed: Optional[int] = Field(default=None)
     risk_free_rate: float = Field(default=0.05)
     use_antithetic: bool = Field(default=True, description="Use antithetic variates for variance reduction")
     use_control_variate: bool = Field(default=False)
+    importance_sampling: bool = Field(
+        default=False,
+        description="Re-estimate tail VaR/CVaR with drift-shifted, likelihood-weighted draws"
+    )
+    importance_tail: float = Field(
+        default=0.01, gt=0.0, lt=0.5,
+        description="Tail probability the importance sampling shift is aimed at"
+    )
+    dtype: PathDType = Field(
+        default="float64",
+        description="Precision of random draws, log returns and price/portfolio path storage"
+    )
+    sampler: Sampler = Field(
+        default="pseudo",
+        description="Normal draws: pseudo-random, or scrambled Sobol with Brownian bridge"
+    )
+    repricing: Repricing = Field(
+        default="exact",
+        description="Option values along paths: exact Black-Scholes, or interpolated price surfaces"
+    )
+    repricing_tolerance: float = Field(
+        default=1e-3, gt=0.0,
+        description="Maximum absolute per-share price error of a repricing surface"
+    )
+    backend: Backend = Field(
+        default="numpy",
+        description="Path kernels: NumPy, Numba JIT (opt-in), or auto (Numba when installed)"
+    )
+    storage_dir: Optional[str] = Field(
+        default=None,
+        description="Directory for memory-mapped path arrays (None keeps paths in RAM)"
+    )
+    chunk_size: Optional[int] = Field(
+        default=None, ge=100,
+        description="Paths per chunk for streaming simulation (None simulates all paths at once)"
+    )
+    parallel_workers: int = Field(
+        default=1, ge=-1,
+        description="Worker processes for large runs (1 runs in-process, -1 uses all cores)"
+    )
 
 
 class PercentileResults(BaseModel):
@@ -31,18 +100,16 @@ class PercentileResults(BaseModel):
 
     @classmethod
     def from_array(cls, values: np.ndarray) -> "PercentileResults":
-        """Create from numpy array"""
-        return cls(
-            p1=float(np.percentile(values, 1)),
-            p5=float(np.percentile(values, 5)),
-            p10=float(np.percentile(values, 10)),
-            p25=float(np.percentile(values, 25)),
-            p50=float(np.percentile(values, 50)),
-            p75=float(np.percentile(values, 75)),
-            p90=float(np.percentile(values, 90)),
-            p95=float(np.percentile(values, 95)),
-            p99=float(np.percentile(values, 99))
-        )
+        """Create from numpy array (one partition pass for all levels)"""
+        return cls.from_values(partition_percentiles(values, PERCENTILE_LEVELS))
+
+    @classmethod
+    def from_values(cls, values: Union[Sequence[float], np.ndarray]) -> "PercentileResults":
+        """Create from values at PERCENTILE_LEVELS, in order"""
+        return cls(**{
+            f"p{level}": float(value)
+            for level, value in zip(PERCENTILE_LEVELS, values, strict=True)
+        })
 
     def to_dict(self) -> Dict[int, float]:
         return {
@@ -70,6 +137,12 @@ class SimulationStatistics(BaseModel):
     var_99: float = Field(description="99% Value at Risk (loss at 1st percentile)")
     cvar_95: float = Field(description="95% Conditional VaR (Expected Shortfall)")
     cvar_99: float = Field(description="99% Conditional VaR")
+    var_999: Optional[float] = Field(
+        default=None, description="99.9% Value at Risk (importance sampling runs only)"
+    )
+    cvar_999: Optional[float] = Field(
+        default=None, description="99.9% Conditional VaR (importance sampling runs only)"
+    )
     max_drawdown: float = Field(description="Maximum drawdown observed")
     avg_drawdown: float = Field(description="Average drawdown")
     probability_loss: float = Field(description="Probability of loss (0-1)")
@@ -92,33 +165,34 @@ class SimulationResult(BaseModel):
     initial_portfolio_value: float = Field(default=0.0)
     initial_prices: Dict[str, float] = Field(default_factory=dict)
 
-    # Price paths (stored as list for JSON serialization, convert to numpy for computation)
-    price_paths_by_symbol: Dict[str, List[List[float]]] = Field(
+    # Path arrays are kept as contiguous ndarrays (float64, or float32 when the
+    # simulation ran in reduced precision); lists are only produced on JSON dump
+    price_paths_by_symbol: Dict[str, np.ndarray] = Field(
         default_factory=dict,
-        description="Price paths by symbol: symbol -> [num_paths][num_days]"
+        description="Price paths by symbol: symbol -> (num_paths, num_days + 1)"
     )
 
     # Portfolio value paths
-    portfolio_value_paths: List[List[float]] = Field(
-        default_factory=list,
-        description="Portfolio value paths: [num_paths][num_days]"
+    portfolio_value_paths: np.ndarray = Field(
+        default_factory=lambda: np.empty((0, 0)),
+        description="Portfolio value paths: (num_paths, num_days + 1)"
     )
 
     # Final values distribution
-    final_values: List[float] = Field(
-        default_factory=list,
+    final_values: np.ndarray = Field(
+        default_factory=lambda: np.empty(0),
         description="Final portfolio values across all paths"
     )
 
     # P&L distribution
-    pnl_distribution: List[float] = Field(
-        default_factory=list,
+    pnl_distribution: np.ndarray = Field(
+        default_factory=lambda: np.empty(0),
         description="P&L for each path"
     )
 
     # Return distribution
-    return_distribution: List[float] = Field(
-        default_factory=list,
+    return_distribution: np.ndarray = Field(
+        default_factory=lambda: np.empty(0),
         description="Percentage return for each path"
     )
 
@@ -133,23 +207,135 @@ class SimulationResult(BaseModel):
     daily_std: List[float] = Field(default_factory=list)
     daily_var_95: List[float] = Field(default_factory=list)
 
+    @field_validator(
+        "portfolio_value_paths", "final_values", "pnl_distribution", "return_distribution",
+        mode="before"
+    )
+    @classmethod
+    def _as_array(cls, value: Any) -> np.ndarray:
+        """Accept lists (e.g. from JSON) and keep existing float arrays without copying"""
+        return _as_float_array(value)
+
+    @field_validator("price_paths_by_symbol", mode="before")
+    @classmethod
+    def _as_array_dict(cls, value: Any) -> Dict[str, np.ndarray]:
+        return {symbol: _as_float_array(paths) for symbol, paths in value.items()}
+
+    @field_serializer(
+        "portfolio_value_paths", "final_values", "pnl_distribution", "return_distribution",
+        when_used="json"
+    )
+    def _serialize_array(self, value: np.ndarray) -> list:
+        values: list = value.tolist()
+        return values
+
+    @field_serializer("price_paths_by_symbol", when_used="json")
+    def _serialize_array_dict(self, value: Dict[str, np.ndarray]) -> Dict[str, list]:
+        return {symbol: paths.tolist() for symbol, paths in value.items()}
+
     def get_price_paths_array(self, symbol: str) -> np.ndarray:
-        """Get price paths as numpy array"""
+        """Get price paths as numpy array (no copy)"""
         if symbol in self.price_paths_by_symbol:
-            return np.array(self.price_paths_by_symbol[symbol])
+            return self.price_paths_by_symbol[symbol]
         return np.array([])
 
     def get_portfolio_paths_array(self) -> np.ndarray:
-        """Get portfolio value paths as numpy array"""
-        return np.array(self.portfolio_value_paths)
+        """Get portfolio value paths as numpy array (no copy)"""
+        return self.portfolio_value_paths
 
     def get_final_values_array(self) -> np.ndarray:
-        """Get final values as numpy array"""
-        return np.array(self.final_values)
+        """Get final values as numpy array (no copy)"""
+        return self.final_values
 
     def get_pnl_array(self) -> np.ndarray:
-        """Get P&L as numpy array"""
-        return np.array(self.pnl_distribution)
+        """Get P&L as numpy array (no copy)"""
+        return self.pnl_distribution
+
+    def get_returns_array(self) -> np.ndarray:
+        """Get returns as numpy array (no copy)"""
+        return self.return_distribution
+
+    def path_percentiles(
+        self,
+        q: Union[float, Sequence[float]],
+        symbol: Optional[str] = None
+    ) -> np.ndarray:
+        """
+        Per-day percentiles across paths, computed in column blocks
+
+        Args:
+            q: Percentile or sequence of percentiles in [0, 100]
+            symbol: Underlying symbol (None for portfolio value paths)
+
+        Returns:
+            Array of shape (num_days + 1,) for scalar q, else (len(q), num_days + 1)
+        """
+        paths = self.portfolio_value_paths if symbol is None else self.price_paths_by_symbol[symbol]
+        return column_percentiles(paths, q)
+
+    def save(self, directory: Union[str, Path]) -> Path:
+        """
+        Save the result as .npy arrays plus a JSON metadata file
+
+        Arrays already memory-mapped into the directory are flushed in place
+        rather than copied.
+
+        Args:
+            directory: Target directory (created if missing)
+
+        Returns:
+            Path of the metadata file
+        """
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+
+        for field in _ARRAY_FIELDS:
+            store_array(directory / f"{field}.npy", getattr(self, field))
+
+        price_path_files = {}
+        for i, (symbol, paths) in enumerate(self.price_paths_by_symbol.items()):
+            price_path_files[symbol] = f"price_paths_{i}.npy"
+            store_array(directory / price_path_files[symbol], paths)
+
+        metadata = self.model_dump(
+            mode="json", exclude={*_ARRAY_FIELDS, "price_paths_by_symbol"}
+        )
+        metadata["price_path_files"] = price_path_files
+
+        metadata_path = directory / "result.json"
+        metadata_path.write_text(json.dumps(metadata, indent=2))
+        return metadata_path
+
+    @classmethod
+    def load(
+        cls,
+        directory: Union[str, Path],
+        mmap_mode: Optional[Literal["r", "r+", "c"]] = "r"
+    ) -> "SimulationResult":
+        """
+        Reopen a result saved with save() without rerunning the simulation
+
+        Args:
+            directory: Directory written by save()
+            mmap_mode: np.load mmap mode ("r" maps arrays lazily, None reads them into RAM)
+
+        Returns:
+            SimulationResult backed by the saved arrays
+        """
+        directory = Path(directory)
+        metadata = json.loads((directory / "result.json").read_text())
+        price_path_files = metadata.pop("price_path_files", {})
+
+        arrays = {
+            field: np.load(directory / f"{field}.npy", mmap_mode=mmap_mode)
+            for field in _ARRAY_FIELDS
+        }
+        price_paths = {
+            symbol: np.load(directory / filename, mmap_mode=mmap_mode)
+            for symbol, filename in price_path_files.items()
+        }
+
+        return cls(**metadata, **arrays, price_paths_by_symbol=price_paths)
 
     def summary(self) -> Dict:
         """Get summary dictionary"""
@@ -166,6 +352,7 @@ class SimulationResult(BaseModel):
             "var_95": round(stats.var_95, 2),
             "var_99": round(stats.var_99, 2),
             "cvar_95": round(stats.cvar_95, 2),
+            "var_999": round(stats.var_999, 2) if stats.var_999 is not None else None,
             "max_drawdown_pct": round(stats.max_drawdown * 100, 2),
             "prob_loss_pct": round(stats.probability_loss * 100, 1),
             "prob_gain_pct": round(stats.probability_gain * 100, 1),
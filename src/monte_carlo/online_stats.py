@@ -0,0 +1,346 @@
+"""
+Online statistics - mergeable accumulators for block-wise and chunked simulation
+
+All accumulators support update() with a block of data and merge() with
+another accumulator, so statistics can be built over path blocks that are
+discarded after use, or combined from independent workers.
+"""
+
+import math
+from typing import Optional, Sequence, Union
+
+import numpy as np
+
+from .kernels import max_drawdowns
+
+
+class RunningMoments:
+    """
+    Running count / mean / variance / min / max (optionally skewness and kurtosis)
+
+    Blocks are combined with the parallel update of Chan et al. (extended to
+    third and fourth moments by Pébay), so the result does not depend on block
+    size beyond floating point rounding. With axis=0 updates every column is
+    tracked separately and mean/variance become arrays.
+    """
+
+    def __init__(self, higher_moments: bool = False):
+        """
+        Args:
+            higher_moments: Also track third and fourth central moments
+        """
+        self.higher_moments = higher_moments
+        self.count: int = 0
+        self.mean: Union[float, np.ndarray] = 0.0
+        self.m2: Union[float, np.ndarray] = 0.0
+        self.m3: Union[float, np.ndarray] = 0.0
+        self.m4: Union[float, np.ndarray] = 0.0
+        self.min: Union[float, np.ndarray] = math.inf
+        self.max: Union[float, np.ndarray] = -math.inf
+
+    def update(self, values: np.ndarray, axis: Optional[int] = None) -> "RunningMoments":
+        """
+        Add a block of values
+
+        Args:
+            values: Array of values
+            axis: None to pool all values, 0 to track each column separately
+
+        Returns:
+            self, for chaining
+        """
+        values = np.asarray(values, dtype=np.float64)
+        if axis is None:
+            values = values.ravel()
+        if values.shape[0] == 0:
+            return self
+
+        block = RunningMoments(self.higher_moments)
+        block.count = values.shape[0]
+        block.mean = values.mean(axis=0)
+        deviations = values - block.mean
+        squared = deviations ** 2
+        block.m2 = squared.sum(axis=0)
+        if self.higher_moments:
+            block.m3 = (squared * deviations).sum(axis=0)
+            block.m4 = (squared ** 2).sum(axis=0)
+        block.min = values.min(axis=0)
+        block.max = values.max(axis=0)
+        return self.merge(block)
+
+    def merge(self, other: "RunningMoments") -> "RunningMoments":
+        """
+        Merge another accumulator into this one
+
+        Args:
+            other: Accumulator to merge
+
+        Returns:
+            self, for chaining
+        """
+        if other.count == 0:
+            return self
+        if self.count == 0:
+            self.count, self.mean, self.m2 = other.count, other.mean, other.m2
+            self.m3, self.m4 = other.m3, other.m4
+            self.min, self.max = other.min, other.max
+            return self
+
+        n_a, n_b = self.count, other.count
+        n = n_a + n_b
+        delta = other.mean - self.mean
+        m2 = self.m2 + other.m2 + delta ** 2 * n_a * n_b / n
+
+        if self.higher_moments:
+            m3 = (
+                self.m3 + other.m3
+                + delta ** 3 * n_a * n_b * (n_a - n_b) / n ** 2
+                + 3 * delta * (n_a * other.m2 - n_b * self.m2) / n
+            )
+            self.m4 = (
+                self.m4 + other.m4
+                + delta ** 4 * n_a * n_b * (n_a ** 2 - n_a * n_b + n_b ** 2) / n ** 3
+                + 6 * delta ** 2 * (n_a ** 2 * other.m2 + n_b ** 2 * self.m2) / n ** 2
+                + 4 * delta * (n_a * other.m3 - n_b * self.m3) / n
+            )
+            self.m3 = m3
+
+        self.mean = self.mean + delta * n_b / n
+        self.m2 = m2
+        self.count = n
+        self.min = np.minimum(self.min, other.min)
+        self.max = np.maximum(self.max, other.max)
+        return self
+
+    @property
+    def variance(self) -> Union[float, np.ndarray]:
+        """Population variance (ddof=0, as np.var)"""
+        return self.m2 / self.count if self.count else 0.0
+
+    @property
+    def std(self) -> Union[float, np.ndarray]:
+        """Population standard deviation (ddof=0, as np.std)"""
+        return np.sqrt(self.variance)
+
+    @property
+    def skewness(self) -> float:
+        """Biased sample skewness (as scipy.stats.skew)"""
+        if not self.count or not self.m2:
+            return 0.0
+        return float(math.sqrt(self.count) * self.m3 / self.m2 ** 1.5)
+
+    @property
+    def kurtosis(self) -> float:
+        """Biased excess kurtosis (as scipy.stats.kurtosis)"""
+        if not self.count or not self.m2:
+            return 0.0
+        return float(self.count * self.m4 / self.m2 ** 2 - 3.0)
+
+
+def tail_dense_levels(num_levels: int) -> np.ndarray:
+    """Quantile levels uniformly spaced on the t-digest k1 scale (dense near 0 and 1)"""
+    return (1.0 - np.cos(np.pi * np.arange(num_levels) / (num_levels - 1))) / 2.0
+
+
+class QuantileSketch:
+    """
+    Mergeable quantile sketch for one or more columns
+
+    Each column's distribution is summarized by its quantiles at a fixed grid
+    of levels spaced like t-digest centroids, so resolution is highest in the
+    tails where VaR and CVaR are read. A block is summarized exactly with
+    np.quantile; two sketches merge by inverting the count-weighted mixture of
+    their piecewise-linear CDFs on the same grid. Level 0 and 1 stay the exact
+    minimum and maximum.
+    """
+
+    def __init__(self, num_levels: int = 1001):
+        """
+        Args:
+            num_levels: Number of quantile levels kept per column
+        """
+        self.levels = tail_dense_levels(num_levels)
+        self.count: int = 0
+        # Empty until the first update
+        self.values: np.ndarray = np.empty(0)
+
+    def update(self, values: np.ndarray) -> "QuantileSketch":
+        """
+        Add a block of observations
+
+        Args:
+            values: Array of shape (n,) or (n, num_columns)
+
+        Returns:
+            self, for chaining
+        """
+        values = np.asarray(values, dtype=np.float64)
+        if values.shape[0] == 0:
+            return self
+
+        block = QuantileSketch(len(self.levels))
+        block.count = values.shape[0]
+        block.values = np.quantile(values, block.levels, axis=0)
+        return self.merge(block)
+
+    def merge(self, other: "QuantileSketch") -> "QuantileSketch":
+        """
+        Merge another sketch with the same level grid into this one
+
+        Args:
+            other: Sketch to merge
+
+        Returns:
+            self, for chaining
+        """
+        if other.count == 0:
+            return self
+        if self.count == 0:
+            self.count = other.count
+            self.values = other.values.copy()
+            return self
+
+        total = self.count + other.count
+        weight_a, weight_b = self.count / total, other.count / total
+        shape = self.values.shape
+        a = self.values.reshape(len(self.levels), -1)
+        b = other.values.reshape(len(self.levels), -1)
+        merged = np.empty_like(a)
+
+        for col in range(a.shape[1]):
+            grid = np.union1d(a[:, col], b[:, col])
+            cdf = (
+                weight_a * np.interp(grid, a[:, col], self.levels)
+                + weight_b * np.interp(grid, b[:, col], self.levels)
+            )
+            merged[:, col] = np.interp(self.levels, cdf, grid)
+
+        self.values = merged.reshape(shape)
+        self.count = total
+        return self
+
+    def quantile(
+        self,
+        q: Union[float, Sequence[float], np.ndarray]
+    ) -> Union[float, np.ndarray]:
+        """
+        Estimate quantiles
+
+        Args:
+            q: Quantile level(s) in [0, 1]
+
+        Returns:
+            Estimates with shape q.shape (+ (num_columns,) for 2-D sketches)
+        """
+        levels = np.asarray(q, dtype=np.float64)
+        index = np.clip(
+            np.searchsorted(self.levels, levels, side="right") - 1, 0, len(self.levels) - 2
+        )
+        lower, upper = self.levels[index], self.levels[index + 1]
+        fraction = (levels - lower) / (upper - lower)
+        fraction = fraction.reshape(fraction.shape + (1,) * (self.values.ndim - 1))
+        estimates: Union[float, np.ndarray] = (
+            self.values[index] + fraction * (self.values[index + 1] - self.values[index])
+        )
+        return estimates
+
+    def tail_mean(self, alpha: float) -> float:
+        """
+        Mean of the lowest alpha fraction of a 1-D sketch (the CVaR integral)
+
+        Args:
+            alpha: Tail probability, e.g. 0.05
+
+        Returns:
+            (1 / alpha) * integral of the quantile function over [0, alpha]
+        """
+        levels = np.append(self.levels[self.levels < alpha], alpha)
+        values = np.asarray(self.quantile(levels))
+        return float(np.sum((values[1:] + values[:-1]) / 2.0 * np.diff(levels)) / alpha)
+
+
+class PortfolioStatsAccumulator:
+    """
+    Online statistics over portfolio value path blocks
+
+    Tracks everything SimulationStatistics, PercentileResults and the daily
+    series need, so paths can be discarded after each block: final value and
+    P&L moments, final value and per-day quantile sketches, per-day moments,
+    per-path drawdowns, and pooled daily return moments for Sharpe/Sortino.
+    """
+
+    def __init__(self, initial_value: float, num_levels: int = 1001, backend: str = "numpy"):
+        """
+        Args:
+            initial_value: Initial portfolio value (for P&L and returns)
+            num_levels: Quantile sketch resolution
+            backend: Drawdown kernel backend, "numpy" or "numba" (see kernels)
+        """
+        self.initial_value = initial_value
+        self.backend = backend
+        self.final_values = RunningMoments()
+        self.pnl = RunningMoments(higher_moments=True)
+        self.final_quantiles = QuantileSketch(num_levels)
+        self.daily = RunningMoments()
+        self.daily_quantiles = QuantileSketch(num_levels)
+        self.drawdowns = RunningMoments()
+        self.daily_returns = RunningMoments()
+        self.downside_returns = RunningMoments()
+        self.losses = 0
+        self.gains = 0
+
+    @property
+    def count(self) -> int:
+        """Number of paths accumulated"""
+        return self.final_values.count
+
+    def update(self, portfolio_paths: np.ndarray) -> "PortfolioStatsAccumulator":
+        """
+        Add a block of portfolio value paths
+
+        Args:
+            portfolio_paths: Array of shape (block_paths, num_days + 1)
+
+        Returns:
+            self, for chaining
+        """
+        paths = np.asarray(portfolio_paths, dtype=np.float64)
+        final_values = paths[:, -1]
+        pnl = final_values - self.initial_value
+
+        self.final_values.update(final_values)
+        self.pnl.update(pnl)
+        self.final_quantiles.update(final_values)
+        self.daily.update(paths, axis=0)
+        self.daily_quantiles.update(paths)
+        self.losses += int(np.count_nonzero(pnl < 0))
+        self.gains += int(np.count_nonzero(pnl > 0))
+
+        self.drawdowns.update(max_drawdowns(paths, self.backend))
+
+        returns = np.diff(paths, axis=1) / paths[:, :-1]
+        self.daily_returns.update(returns)
+        self.downside_returns.update(returns[returns < 0])
+        return self
+
+    def merge(self, other: "PortfolioStatsAccumulator") -> "PortfolioStatsAccumulator":
+        """
+        Merge another accumulator over the same portfolio into this one
+
+        Args:
+            other: Accumulator to merge
+
+        Returns:
+            self, for chaining
+        """
+        self.final_values.merge(other.final_values)
+        self.pnl.merge(other.pnl)
+        self.final_quantiles.merge(other.final_quantiles)
+        self.daily.merge(other.daily)
+        self.daily_quantiles.merge(other.daily_quantiles)
+        self.drawdowns.merge(other.drawdowns)
+        self.daily_returns.merge(other.daily_returns)
+        self.downside_returns.merge(other.downside_returns)
+        self.losses += other.losses
+        self.gains += other.gains
+        return self
@@ -0,0 +1,210 @@
+"""
+Normal samplers - pseudo-random and quasi-random (scrambled Sobol) draws
+
+Both samplers return standard normal increments of shape
+(num_paths, num_days, num_assets) that feed the GBM / Cholesky code
+unchanged. The Sobol sampler builds each path with a Brownian bridge, so the
+first (best distributed) Sobol dimensions decide the terminal value and the
+coarse shape of the path, which is what VaR and CVaR depend on.
+"""
+
+import warnings
+from functools import lru_cache
+from typing import Iterator, List, Tuple
+
+import numpy as np
+from numpy.typing import DTypeLike
+from scipy.special import ndtri
+from scipy.stats import qmc
+
+from .storage import DEFAULT_BLOCK_ELEMENTS, row_blocks
+
+SAMPLERS = ("pseudo", "sobol")
+
+# Highest dimension supported by scipy's Sobol direction numbers
+SOBOL_MAX_DIM = 21201
+
+
+def standard_normals(
+    rng: np.random.Generator,
+    num_paths: int,
+    num_days: int,
+    num_assets: int,
+    sampler: str = "pseudo",
+    dtype: DTypeLike = np.float64
+) -> np.ndarray:
+    """
+    Draw standard normal increments
+
+    Args:
+        rng: Random generator (also seeds the Sobol scrambling)
+        num_paths: Number of paths
+        num_days: Number of time steps
+        num_assets: Number of assets
+        sampler: "pseudo" for rng.standard_normal, "sobol" for scrambled
+            Sobol points with Brownian-bridge construction
+        dtype: Output dtype; float32 output holds the same draws as float64,
+            rounded, so both precisions follow one random stream
+
+    Returns:
+        Array of shape (num_paths, num_days, num_assets)
+    """
+    dtype = np.dtype(dtype)
+    if sampler == "pseudo" and dtype == np.float64:
+        return rng.standard_normal((num_paths, num_days, num_assets))
+
+    out = np.empty((num_paths, num_days, num_assets), dtype=dtype)
+    for rows, block in normal_blocks(rng, num_paths, num_days, num_assets, sampler, dtype):
+        out[rows] = block
+    return out
+
+
+def normal_blocks(
+    rng: np.random.Generator,
+    num_paths: int,
+    num_days: int,
+    num_assets: int,
+    sampler: str = "pseudo",
+    dtype: DTypeLike = np.float64,
+    block_elements: int = DEFAULT_BLOCK_ELEMENTS
+) -> Iterator[Tuple[slice, np.ndarray]]:
+    """
+    Draw standard normal increments one row block at a time
+
+    Consecutive blocks continue the same pseudo-random stream / Sobol
+    sequence, so concatenating them gives exactly standard_normals() for the
+    same generator state while only one block is ever resident.
+
+    Args:
+        rng: Random generator (also seeds the Sobol scrambling)
+        num_paths: Number of paths
+        num_days: Number of time steps
+        num_assets: Number of assets
+        sampler: "pseudo" or "sobol"
+        dtype: Output dtype (draws are made in float64 and rounded)
+        block_elements: Approximate number of normals per block
+
+    Yields:
+        (row slice, array of shape (block_rows, num_days, num_assets))
+    """
+    if sampler not in SAMPLERS:
+        raise ValueError(f"Unknown sampler '{sampler}', expected one of {SAMPLERS}")
+
+    engine = None
+    if sampler == "sobol":
+        engine = qmc.Sobol(d=min(num_days * num_assets, SOBOL_MAX_DIM), scramble=True, seed=rng)
+
+    for rows in row_blocks(num_paths, num_days * num_assets, block_elements):
+        block_rows = rows.stop - rows.start
+        if engine is None:
+            block = rng.standard_normal((block_rows, num_days, num_assets))
+        else:
+            block = _sobol_block(engine, rng, block_rows, num_days, num_assets)
+        yield rows, block.astype(dtype, copy=False)
+
+
+def sobol_normals(
+    rng: np.random.Generator,
+    num_paths: int,
+    num_days: int,
+    num_assets: int
+) -> np.ndarray:
+    """
+    Scrambled Sobol normals mapped to path increments with a Brownian bridge
+
+    Sobol dimensions are assigned in bridge order: dimensions
+    [0, num_assets) give every asset's terminal value, the next num_assets
+    the midpoints, and so on. Dimensions beyond SOBOL_MAX_DIM (only reached
+    by very long multi-asset horizons) are padded with pseudo-random normals
+    for the finest bridge levels. Power-of-two path counts give the best
+    balance properties.
+
+    Args:
+        rng: Random generator seeding the scrambling
+        num_paths: Number of paths
+        num_days: Number of time steps
+        num_assets: Number of assets
+
+    Returns:
+        Array of shape (num_paths, num_days, num_assets)
+    """
+    return standard_normals(rng, num_paths, num_days, num_assets, sampler="sobol")
+
+
+def _sobol_block(
+    engine: qmc.Sobol,
+    rng: np.random.Generator,
+    num_paths: int,
+    num_days: int,
+    num_assets: int
+) -> np.ndarray:
+    """Next num_paths Sobol points of engine as bridge-constructed normal increments"""
+    dims = num_days * num_assets
+    sobol_dims = engine.d
+
+    with warnings.catch_warnings():
+        # Non power-of-two counts are valid, just less balanced
+        warnings.simplefilter("ignore", UserWarning)
+        points = engine.random(num_paths)
+
+    eps = np.finfo(np.float64).eps
+    bridge_order = np.empty((num_paths, dims))
+    bridge_order[:, :sobol_dims] = ndtri(np.clip(points, eps, 1.0 - eps))
+    if dims > sobol_dims:
+        bridge_order[:, sobol_dims:] = rng.standard_normal((num_paths, dims - sobol_dims))
+
+    return brownian_bridge(bridge_order.reshape(num_paths, num_days, num_assets))
+
+
+@lru_cache(maxsize=32)
+def _bridge_schedule(num_steps: int) -> List[Tuple[int, int, int, float, float, float]]:
+    """
+    Fill order for a Brownian bridge on times 0..num_steps (W(0) = 0)
+
+    Returns (target, left, right, left_weight, right_weight, sigma) tuples in
+    breadth-first order, after the terminal point; each W(target) is
+    left_weight * W(left) + right_weight * W(right) + sigma * Z.
+    """
+    schedule = []
+    intervals = [(0, num_steps)]
+    while intervals:
+        next_intervals = []
+        for left, right in intervals:
+            if right - left < 2:
+                continue
+            mid = (left + right) // 2
+            span = right - left
+            schedule.append((
+                mid, left, right,
+                (right - mid) / span, (mid - left) / span,
+                float(np.sqrt((mid - left) * (right - mid) / span))
+            ))
+            next_intervals.extend([(left, mid), (mid, right)])
+        intervals = next_intervals
+    return schedule
+
+
+def brownian_bridge(z: np.ndarray) -> np.ndarray:
+    """
+    Turn bridge-ordered normals into unit-variance Brownian increments
+
+    Args:
+        z: Array of shape (num_paths, num_steps, ...) where z[:, 0] sets the
+            terminal value and later columns fill in midpoints breadth first
+
+    Returns:
+        Increments W(t+1) - W(t) with the same shape, i.i.d. N(0, 1)
+    """
+    num_steps = z.shape[1]
+    # brownian[:, t] holds W(t) for t = 0..num_steps
+    brownian = np.zeros((z.shape[0], num_steps + 1) + z.shape[2:])
+    brownian[:, num_steps] = np.sqrt(num_steps) * z[:, 0]
+
+    for k, (target, left, right, w_left, w_right, sigma) in enumerate(
+        _bridge_schedule(num_steps), start=1
+    ):
+        brownian[:, target] = (
+            w_left * brownian[:, left] + w_right * brownian[:, right] + sigma * z[:, k]
+        )
+
+    return np.diff(brownian, axis=1)
@@ -2,17 +2,30 @@
 Monte Carlo Simulator - Main simulation engine
 """
 
+import multiprocessing
+import os
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from datetime import date
+from itertools import repeat
 from typing import Dict, List, Optional, Tuple
 import numpy as np
-from scipy import stats as scipy_stats
+from scipy.special import ndtri
 from loguru import logger
 
-from ..ib_client.models import Position, MarketData
+from ..ib_client.models import Position, MarketData, OptionDetails
 from ..greeks.black_scholes import BlackScholesModel
 from .models import (
     SimulationConfig, SimulationResult, SimulationStatistics,
-    PercentileResults
+    PercentileResults, PERCENTILE_LEVELS, Backend, PathDType, Repricing, Sampler
+)
+from .samplers import standard_normals, normal_blocks
+from .repricing import OptionPriceSurface, DEFAULT_SURFACE_TOLERANCE
+from .variance_reduction import control_variate_weights, WeightedSample
+from .kernels import resolve_backend, gbm_paths, option_prices, max_drawdowns
+from .online_stats import RunningMoments, PortfolioStatsAccumulator
+from .storage import (
+    DEFAULT_BLOCK_ELEMENTS, allocate_paths, row_blocks, column_blocks, column_percentiles
 )
 
 
@@ -24,12 +37,29 @@ class MonteCarloSimulator:
     and calculates portfolio values over time.
     """
 
+    # Below this many paths a process pool costs more to start than it saves
+    PARALLEL_MIN_PATHS = 50_000
+
+    # Repricing surfaces kept for reuse; spot and volatility move between
+    # runs, so older surfaces are evicted least recently used first
+    MAX_CACHED_SURFACES = 32
+
     def __init__(
         self,
         num_paths: int = 10000,
         num_days: int = 30,
         random_seed: Optional[int] = None,
-        risk_free_rate: float = 0.05
+        risk_free_rate: float = 0.05,
+        storage_dir: Optional[str] = None,
+        chunk_size: Optional[int] = None,
+        parallel_workers: int = 1,
+        sampler: Sampler = "pseudo",
+        use_control_variate: bool = False,
+        importance_sampling: bool = False,
+        dtype: PathDType = "float64",
+        repricing: Repricing = "exact",
+        repricing_tolerance: float = DEFAULT_SURFACE_TOLERANCE,
+        backend: Backend = "numpy"
     ):
         """
         Initialize Monte Carlo Simulator
@@ -39,24 +69,83 @@ class MonteCarloSimulator:
             num_days: Number of days to simulate
             random_seed: Random seed for reproducibility
             risk_free_rate: Annual risk-free rate
+            storage_dir: Directory for memory-mapped path arrays
+                (None keeps all paths in RAM)
+            chunk_size: Paths per chunk for streaming simulation with online
+                statistics (None simulates all paths at once)
+            parallel_workers: Worker processes for runs of at least
+                PARALLEL_MIN_PATHS paths (1 runs in-process, -1 uses all cores)
+            sampler: "pseudo" for pseudo-random normals, "sobol" for scrambled
+                Sobol points with Brownian-bridge path construction
+            use_control_variate: Correct mean, percentiles, VaR and CVaR with
+                terminal underlying prices and option payoffs as controls
+            importance_sampling: Re-estimate the tail (VaR/CVaR 95/99/99.9)
+                with draws shifted toward the portfolio's loss direction
+            dtype: "float64", or "float32" to halve the memory and bandwidth
+                of random draws, log returns and path arrays
+            repricing: "exact" prices options with Black-Scholes at every
+                (path, day), "surface" interpolates precomputed per-leg price
+                surfaces (see OptionPriceSurface)
+            repricing_tolerance: Maximum absolute per-share error of a surface
+            backend: Path kernels (GBM stepping, option repricing, drawdowns):
+                "numpy" (default), "numba" (JIT-compiled, falls back to NumPy
+                if numba is not installed) or "auto" (numba when available)
         """
         self.config = SimulationConfig(
             num_paths=num_paths,
             num_days=num_days,
             random_seed=random_seed,
-            risk_free_rate=risk_free_rate
+            risk_free_rate=risk_free_rate,
+            storage_dir=storage_dir,
+            chunk_size=chunk_size,
+            parallel_workers=parallel_workers,
+            sampler=sampler,
+            use_control_variate=use_control_variate,
+            importance_sampling=importance_sampling,
+            dtype=dtype,
+            repricing=repricing,
+            repricing_tolerance=repricing_tolerance,
+            backend=backend
         )
-
-        # Use local random generator for reproducibility
-        self.rng = np.random.default_rng(random_seed)
-
-        self.bs_model = BlackScholesModel()
+        self._init_state(np.random.SeedSequence(random_seed))
 
         logger.info(
             f"MonteCarloSimulator initialized: "
             f"{num_paths} paths, {num_days} days, seed={random_seed}"
         )
 
+    @classmethod
+    def from_config(
+        cls,
+        config: SimulationConfig,
+        seed: np.random.SeedSequence
+    ) -> "MonteCarloSimulator":
+        """
+        Simulator for an existing config drawing from seed
+
+        Used to rebuild a simulator inside a worker process from its config
+        and a spawned SeedSequence instead of pickling the parent simulator.
+        """
+        simulator = cls.__new__(cls)
+        simulator.config = config
+        simulator._init_state(seed)
+        return simulator
+
+    def _init_state(self, seed: np.random.SeedSequence) -> None:
+        """Set up dtype, backend, caches and the random generator from self.config"""
+        self.dtype = np.dtype(self.config.dtype)
+        self.backend = resolve_backend(self.config.backend)
+
+        # Repricing surfaces by (spot, volatility, option legs), LRU-bounded
+        self._surfaces: OrderedDict[tuple, OptionPriceSurface] = OrderedDict()
+
+        # Use local random generator for reproducibility; worker streams are
+        # spawned from the same seed sequence
+        self._seed_sequence = seed
+        self.rng = np.random.default_rng(seed)
+
+        self.bs_model = BlackScholesModel()
+
     def simulate_price_paths(
         self,
         current_price: float,
@@ -93,32 +182,30 @@ class MonteCarloSimulator:
         )
 
         # Generate random numbers using local RNG for reproducibility
-        if self.config.use_antithetic:
+        def draw(rows: int, sampler: Sampler = "pseudo") -> np.ndarray:
+            return standard_normals(self.rng, rows, num_days, 1, sampler, self.dtype)[:, :, 0]
+
+        if self.config.sampler != "pseudo":
+            # Low-discrepancy draws already balance the sample; antithetic
+            # pairs would break their structure
+            z = draw(num_paths, self.config.sampler)
+        elif self.config.use_antithetic:
             # Antithetic variates for variance reduction
             half_paths = num_paths // 2
-            z_half = self.rng.standard_normal((half_paths, num_days))
+            z_half = draw(half_paths)
             z = np.concatenate([z_half, -z_half], axis=0)
             if num_paths % 2 == 1:
-                z = np.concatenate([z, self.rng.standard_normal((1, num_days))], axis=0)
+                z = np.concatenate([z, draw(1)], axis=0)
         else:
-            z = self.rng.standard_normal((num_paths, num_days))
+            z = draw(num_paths)
 
-        # Calculate daily returns
-        # ln(S(t+1)/S(t)) = (μ - 0.5σ²)dt + σ√dt * Z
+        # Daily log returns ln(S(t+1)/S(t)) = (μ - 0.5σ²)dt + σ√dt * Z,
+        # accumulated into prices with current price at day 0
         daily_drift = (drift - 0.5 * volatility ** 2) * dt
         daily_vol = volatility * np.sqrt(dt)
 
-        log_returns = daily_drift + daily_vol * z
-
-        # Cumulative returns
-        cumulative_returns = np.cumsum(log_returns, axis=1)
-
-        # Initialize price paths with current price at day 0
-        paths = np.zeros((num_paths, num_days + 1))
-        paths[:, 0] = current_price
-        paths[:, 1:] = current_price * np.exp(cumulative_returns)
-
-        return paths
+        paths = np.empty((num_paths, num_days + 1), dtype=self.dtype)
+        return gbm_paths(z, daily_drift, daily_vol, current_price, paths, self.backend)
 
     def simulate_correlated_prices(
         self,
@@ -139,50 +226,122 @@ class MonteCarloSimulator:
         Returns:
             Dictionary of symbol -> price paths array
         """
+        return self._correlated_paths(
+            prices, volatilities, self._cholesky_factor(correlation_matrix), dividend_yields,
+            num_paths=self.config.num_paths,
+            storage_dir=self.config.storage_dir
+        )
+
+    def _correlated_paths(
+        self,
+        prices: Dict[str, float],
+        volatilities: Dict[str, float],
+        cholesky: Optional[np.ndarray],
+        dividend_yields: Optional[Dict[str, float]],
+        num_paths: int,
+        storage_dir: Optional[str] = None
+    ) -> Dict[str, np.ndarray]:
+        """
+        Generate num_paths correlated paths per symbol (storage_dir=None keeps them in RAM)
+
+        Works one row block at a time: a block of independent normals is
+        turned into scaled, correlated log returns with a single matmul
+        against diag(daily_vol) @ L, and each asset's cumsum / exp / scale
+        is written in place into its preallocated output buffer. Peak
+        memory is the outputs plus about two blocks, instead of two full
+        (paths x days x assets) tensors plus per-asset temporaries.
+        """
         symbols = list(prices.keys())
-        n_assets = len(symbols)
+        num_days = self.config.num_days
+        num_steps = num_days + 1
 
         if dividend_yields is None:
             dividend_yields = {s: 0.0 for s in symbols}
 
-        # Generate correlated random numbers if correlation matrix provided
-        if correlation_matrix is not None:
-            # Cholesky decomposition for correlated sampling
-            cholesky = np.linalg.cholesky(correlation_matrix)
-            z_independent = self.rng.standard_normal(
-                (self.config.num_paths, self.config.num_days, n_assets)
+        dt = 1 / 252
+        spots = np.array([prices[s] for s in symbols], dtype=self.dtype)
+        vols = np.array([volatilities[s] for s in symbols])
+        drifts = np.array([self.config.risk_free_rate - dividend_yields.get(s, 0.0) for s in symbols])
+        daily_drifts = ((drifts - 0.5 * vols ** 2) * dt).astype(self.dtype)
+        daily_vols = (vols * np.sqrt(dt)).astype(self.dtype)
+
+        # Correlated shocks: daily_vol_i * sum_k L_ik z_k = z @ (diag(daily_vol) L).T
+        shock_matrix = None
+        if cholesky is not None:
+            shock_matrix = (daily_vols[:, np.newaxis] * cholesky).T.astype(self.dtype)
+
+        result = {
+            symbol: allocate_paths(
+                (num_paths, num_steps), storage_dir, f"price_paths_{i}", self.dtype
             )
-            z_correlated = np.einsum('ijk,lk->ijl', z_independent, cholesky)
-        else:
-            z_correlated = self.rng.standard_normal(
-                (self.config.num_paths, self.config.num_days, n_assets)
+            for i, symbol in enumerate(symbols)
+        }
+
+        for rows, z in normal_blocks(
+            self.rng, num_paths, num_days, len(symbols), self.config.sampler, self.dtype
+        ):
+            # Pre-scaled shocks go through the GBM kernel with unit volatility
+            shocks = z @ shock_matrix if shock_matrix is not None else z
+            scales = np.ones_like(daily_vols) if shock_matrix is not None else daily_vols
+
+            for i, symbol in enumerate(symbols):
+                gbm_paths(
+                    shocks[:, :, i], daily_drifts[i], scales[i], spots[i],
+                    result[symbol][rows], self.backend
+                )
+
+        for symbol, paths in result.items():
+            # Lazy so the column pass over (possibly memory-mapped) paths
+            # only runs when debug logging is enabled
+            logger.opt(lazy=True).debug(
+                "Simulated {}: initial=${:.2f}, final_mean=${:.2f}",
+                lambda symbol=symbol: symbol,
+                lambda symbol=symbol: prices[symbol],
+                lambda paths=paths: float(paths[:, -1].mean())
             )
 
-        # Simulate each asset
-        result = {}
-        dt = 1 / 252
-
-        for i, symbol in enumerate(symbols):
-            price = prices[symbol]
-            vol = volatilities[symbol]
-            div = dividend_yields.get(symbol, 0.0)
-            drift = self.config.risk_free_rate - div
-
-            daily_drift = (drift - 0.5 * vol ** 2) * dt
-            daily_vol = vol * np.sqrt(dt)
-
-            log_returns = daily_drift + daily_vol * z_correlated[:, :, i]
-            cumulative_returns = np.cumsum(log_returns, axis=1)
+        return result
 
-            paths = np.zeros((self.config.num_paths, self.config.num_days + 1))
-            paths[:, 0] = price
-            paths[:, 1:] = price * np.exp(cumulative_returns)
+    @staticmethod
+    def _cholesky_factor(correlation_matrix: Optional[np.ndarray]) -> Optional[np.ndarray]:
+        """Lower Cholesky factor of the correlation matrix (None for independent assets)"""
+        if correlation_matrix is None:
+            return None
+        return np.linalg.cholesky(correlation_matrix)
+
+    def _resolve_workers(self, num_paths: Optional[int] = None) -> int:
+        """Number of worker processes for num_paths of work (default config.num_paths)"""
+        if num_paths is None:
+            num_paths = self.config.num_paths
+        if num_paths < self.PARALLEL_MIN_PATHS:
+            return 1
+        workers = self.config.parallel_workers
+        return workers if workers > 0 else (os.cpu_count() or 1)
+
+    def _parallel_run(self) -> bool:
+        """
+        Whether simulate_portfolio runs seeded path blocks for a process pool
 
-            result[symbol] = paths
+        Decided from the config alone, not from the core count, so a fixed
+        seed takes the same path on every machine.
+        """
+        return (
+            self.config.parallel_workers != 1
+            and self.config.num_paths >= self.PARALLEL_MIN_PATHS
+        )
 
-            logger.debug(f"Simulated {symbol}: initial=${price:.2f}, final_mean=${paths[:, -1].mean():.2f}")
+    def _process_pool(self, workers: int) -> ProcessPoolExecutor:
+        """
+        Process pool for workers
 
-        return result
+        numba's parallel threading layers are not fork-safe, so with the
+        numba backend workers are started from a clean forkserver process
+        instead of forked from this (possibly threaded) one.
+        """
+        context = None
+        if self.backend == "numba" and "forkserver" in multiprocessing.get_all_start_methods():
+            context = multiprocessing.get_context("forkserver")
+        return ProcessPoolExecutor(max_workers=workers, mp_context=context)
 
     def calculate_option_values(
         self,
@@ -209,37 +368,54 @@ class MonteCarloSimulator:
         Returns:
             Option value paths (num_paths, num_days + 1)
         """
-        num_paths, num_steps = price_paths.shape
-        option_values = np.zeros_like(price_paths)
+        if self.config.repricing == "surface":
+            # Column 0 of every path is the current spot
+            surface = self._option_surface(
+                float(price_paths[0, 0]),
+                ((strike, is_call, initial_dte, position_size * multiplier),),
+                volatility
+            )
+            return surface.evaluate(price_paths)
 
-        for day in range(num_steps):
-            dte = max(0, initial_dte - day)
-            time_to_expiry = dte / 365.0
+        num_steps = price_paths.shape[1]
 
-            if time_to_expiry <= 0:
-                # At expiry - intrinsic value only
-                if is_call:
-                    intrinsic = np.maximum(price_paths[:, day] - strike, 0)
-                else:
-                    intrinsic = np.maximum(strike - price_paths[:, day], 0)
-                option_values[:, day] = intrinsic * position_size * multiplier
-            else:
-                # Use Black-Scholes
-                for path in range(num_paths):
-                    spot = price_paths[path, day]
-                    if is_call:
-                        price = self.bs_model.call_price(
-                            spot, strike, time_to_expiry,
-                            self.config.risk_free_rate, volatility
-                        )
-                    else:
-                        price = self.bs_model.put_price(
-                            spot, strike, time_to_expiry,
-                            self.config.risk_free_rate, volatility
-                        )
-                    option_values[path, day] = price * position_size * multiplier
+        # Time to expiry per day; expired days fall back to intrinsic value
+        days_remaining = np.maximum(initial_dte - np.arange(num_steps), 0)
+        time_to_expiry = days_remaining / 365.0
 
-        return option_values
+        prices = option_prices(
+            price_paths, strike, time_to_expiry,
+            self.config.risk_free_rate, volatility, is_call, self.backend
+        )
+
+        return prices * position_size * multiplier
+
+    def _option_surface(
+        self,
+        spot: float,
+        legs: Tuple[Tuple[float, bool, int, float], ...],
+        volatility: float
+    ) -> OptionPriceSurface:
+        """Repricing surface for (strike, is_call, dte, shares) legs on one underlying, built once"""
+        key = (spot, volatility, legs)
+        surface = self._surfaces.get(key)
+        if surface is not None:
+            self._surfaces.move_to_end(key)
+        else:
+            strikes, is_call, initial_dte, quantities = zip(*legs, strict=True)
+            surface = OptionPriceSurface.build(
+                spot, strikes, is_call, initial_dte, quantities, volatility,
+                self.config.risk_free_rate, self.config.num_days,
+                self.config.repricing_tolerance
+            )
+            self._surfaces[key] = surface
+            if len(self._surfaces) > self.MAX_CACHED_SURFACES:
+                self._surfaces.popitem(last=False)
+            logger.debug(
+                f"Repricing surface for {len(legs)} legs: {surface.num_nodes} nodes, "
+                f"max error {surface.max_error:.2e}/share"
+            )
+        return surface
 
     def simulate_portfolio(
         self,
@@ -250,6 +426,14 @@ class MonteCarloSimulator:
         """
         Simulate portfolio value over time
 
+        When config.chunk_size is smaller than num_paths, paths are simulated
+        chunk by chunk and each chunk is discarded after updating online
+        statistics, so memory is bounded by the chunk size. When
+        parallel_workers is not 1 and the run has at least PARALLEL_MIN_PATHS
+        paths, paths are split into seeded blocks across a process pool and
+        the blocks' online statistics are merged. In both cases the result
+        carries statistics, percentiles and daily series but no path arrays.
+
         Args:
             positions: List of Position objects
             market_data: Dictionary of conId -> MarketData
@@ -260,7 +444,137 @@ class MonteCarloSimulator:
         """
         logger.info(f"Starting portfolio simulation with {len(positions)} positions")
 
-        # Group positions by underlying
+        underlying_positions, underlying_prices, underlying_vols, initial_value = \
+            self._prepare_portfolio(positions, market_data)
+
+        parallel = self._parallel_run()
+        chunk_size = self.config.chunk_size
+        if self.config.use_control_variate and (
+            parallel or (chunk_size and chunk_size < self.config.num_paths)
+        ):
+            logger.warning(
+                "Control variates need per-path controls; not applied in chunked/parallel mode"
+            )
+
+        if parallel:
+            result = self._simulate_portfolio_parallel(
+                underlying_positions, underlying_prices, underlying_vols,
+                initial_value, correlation_matrix, self._resolve_workers()
+            )
+        elif chunk_size and chunk_size < self.config.num_paths:
+            result = self._simulate_portfolio_chunked(
+                underlying_positions, underlying_prices, underlying_vols,
+                initial_value, correlation_matrix
+            )
+        else:
+            result = self._simulate_portfolio_full(
+                underlying_positions, underlying_prices, underlying_vols,
+                initial_value, correlation_matrix
+            )
+
+        if self.config.importance_sampling:
+            self._apply_importance_sampling(
+                result, underlying_positions, underlying_prices, underlying_vols,
+                correlation_matrix
+            )
+
+        self._log_result(result)
+        return result
+
+    def _simulate_portfolio_full(
+        self,
+        underlying_positions: Dict[str, List[Position]],
+        underlying_prices: Dict[str, float],
+        underlying_vols: Dict[str, float],
+        initial_value: float,
+        correlation_matrix: Optional[np.ndarray]
+    ) -> SimulationResult:
+        """Simulate all paths at once, keeping price and portfolio paths in the result"""
+        # Simulate underlying price paths
+        logger.info(f"Simulating price paths for {len(underlying_prices)} underlyings")
+        price_paths = self.simulate_correlated_prices(
+            underlying_prices,
+            underlying_vols,
+            correlation_matrix
+        )
+
+        return self._result_from_paths(
+            price_paths, underlying_positions, underlying_prices, underlying_vols, initial_value
+        )
+
+    def _result_from_paths(
+        self,
+        price_paths: Dict[str, np.ndarray],
+        underlying_positions: Dict[str, List[Position]],
+        underlying_prices: Dict[str, float],
+        underlying_vols: Dict[str, float],
+        initial_value: float,
+        storage_name: str = "portfolio_value_paths"
+    ) -> SimulationResult:
+        """Value the portfolio along price_paths and build a SimulationResult with all paths"""
+        # Initialize result arrays
+        num_paths = self.config.num_paths
+        num_steps = self.config.num_days + 1
+        portfolio_paths = allocate_paths(
+            (num_paths, num_steps), self.config.storage_dir, storage_name, self.dtype
+        )
+
+        # Calculate portfolio value for each path and day
+        logger.info("Calculating portfolio values along paths...")
+        self._portfolio_value_paths(
+            price_paths, underlying_positions, underlying_vols, portfolio_paths
+        )
+
+        # Calculate final values and P&L
+        # Statistics are always accumulated in float64
+        final_values = np.array(portfolio_paths[:, -1], dtype=np.float64)
+        pnl = final_values - initial_value
+        returns = pnl / initial_value if initial_value > 0 else np.zeros_like(pnl)
+
+        # Calculate percentiles (shared with VaR/CVaR) and statistics
+        percentiles = PercentileResults.from_array(final_values)
+        statistics = self._calculate_statistics(
+            portfolio_paths, initial_value, final_values, pnl, percentiles
+        )
+
+        if self.config.use_control_variate:
+            weights = self._control_variate_weights(
+                price_paths, underlying_positions, underlying_prices, underlying_vols,
+                final_values
+            )
+            statistics, percentiles = self._reweight_statistics(
+                statistics, WeightedSample(final_values, weights), initial_value
+            )
+
+        # Calculate daily statistics
+        daily_mean, daily_std = self._daily_moments(portfolio_paths)
+        daily_var_95 = column_percentiles(portfolio_paths, 5).tolist()
+
+        # Create result
+        result = SimulationResult(
+            config=self.config,
+            initial_portfolio_value=initial_value,
+            initial_prices=underlying_prices,
+            price_paths_by_symbol=price_paths,
+            portfolio_value_paths=portfolio_paths,
+            final_values=final_values,
+            pnl_distribution=pnl,
+            return_distribution=returns,
+            statistics=statistics,
+            percentiles=percentiles,
+            daily_mean=daily_mean,
+            daily_std=daily_std,
+            daily_var_95=daily_var_95
+        )
+
+        return result
+
+    def _prepare_portfolio(
+        self,
+        positions: List[Position],
+        market_data: Optional[Dict[int, MarketData]]
+    ) -> Tuple[Dict[str, List[Position]], Dict[str, float], Dict[str, float], float]:
+        """Group positions by underlying and resolve spot, volatility and initial value"""
         underlying_positions: Dict[str, List[Position]] = {}
         underlying_prices: Dict[str, float] = {}
         underlying_vols: Dict[str, float] = {}
@@ -293,82 +607,505 @@ class MonteCarloSimulator:
                 if md.implied_volatility:
                     underlying_vols[symbol] = max(underlying_vols[symbol], md.implied_volatility)
 
-        # Simulate underlying price paths
-        logger.info(f"Simulating price paths for {len(underlying_prices)} underlyings")
-        price_paths = self.simulate_correlated_prices(
-            underlying_prices,
-            underlying_vols,
-            correlation_matrix
-        )
-
         # Calculate initial portfolio value
         initial_value = sum(abs(pos.market_value) for pos in positions)
 
-        # Initialize result arrays
-        num_paths = self.config.num_paths
-        num_days = self.config.num_days
-        portfolio_paths = np.zeros((num_paths, num_days + 1))
+        return underlying_positions, underlying_prices, underlying_vols, initial_value
 
-        # Calculate portfolio value for each path and day
-        logger.info("Calculating portfolio values along paths...")
+    def _portfolio_value_paths(
+        self,
+        price_paths: Dict[str, np.ndarray],
+        underlying_positions: Dict[str, List[Position]],
+        underlying_vols: Dict[str, float],
+        out: np.ndarray
+    ) -> np.ndarray:
+        """
+        Value every position along the price paths into out, one row block at a time
 
-        for symbol, symbol_positions in underlying_positions.items():
-            symbol_paths = price_paths[symbol]
+        With surface repricing, all option legs on an underlying are valued
+        together through one OptionPriceSurface.
+        """
+        num_paths, num_steps = out.shape
+        use_surface = self.config.repricing == "surface"
 
-            for pos in symbol_positions:
-                if pos.is_stock:
-                    # Stock value = shares * price
-                    stock_values = pos.position * symbol_paths
-                    portfolio_paths += stock_values
+        for rows in row_blocks(num_paths, num_steps):
+            block = np.zeros((rows.stop - rows.start, num_steps))
 
-                elif pos.is_option and pos.option_details:
-                    opt = pos.option_details
-                    option_values = self.calculate_option_values(
-                        symbol_paths,
-                        strike=opt.strike,
-                        is_call=opt.is_call,
-                        initial_dte=opt.days_to_expiry,
-                        volatility=underlying_vols[symbol],
-                        position_size=pos.position,
-                        multiplier=opt.multiplier
+            for symbol, symbol_positions in underlying_positions.items():
+                symbol_paths = price_paths[symbol][rows]
+
+                if use_surface:
+                    legs = tuple(
+                        (pos.option_details.strike, pos.option_details.is_call,
+                         pos.option_details.days_to_expiry,
+                         pos.position * pos.option_details.multiplier)
+                        for pos in symbol_positions if pos.is_option and pos.option_details
                     )
-                    portfolio_paths += option_values
+                    if legs:
+                        block += self._option_surface(
+                            float(symbol_paths[0, 0]), legs, underlying_vols[symbol]
+                        ).evaluate(symbol_paths)
 
-        # Calculate final values and P&L
-        final_values = portfolio_paths[:, -1]
-        pnl = final_values - initial_value
-        returns = pnl / initial_value if initial_value > 0 else np.zeros_like(pnl)
+                for pos in symbol_positions:
+                    if pos.is_stock:
+                        # Stock value = shares * price
+                        block += pos.position * symbol_paths
+
+                    elif pos.is_option and pos.option_details and not use_surface:
+                        opt = pos.option_details
+                        block += self.calculate_option_values(
+                            symbol_paths,
+                            strike=opt.strike,
+                            is_call=opt.is_call,
+                            initial_dte=opt.days_to_expiry,
+                            volatility=underlying_vols[symbol],
+                            position_size=pos.position,
+                            multiplier=opt.multiplier
+                        )
 
-        # Calculate statistics
-        statistics = self._calculate_statistics(
-            portfolio_paths, initial_value, final_values, pnl, returns
+            out[rows] = block
+
+        return out
+
+    def _simulate_portfolio_chunked(
+        self,
+        underlying_positions: Dict[str, List[Position]],
+        underlying_prices: Dict[str, float],
+        underlying_vols: Dict[str, float],
+        initial_value: float,
+        correlation_matrix: Optional[np.ndarray]
+    ) -> SimulationResult:
+        """Simulate in chunks of config.chunk_size paths, keeping only online statistics"""
+        num_paths = self.config.num_paths
+        # Only called with chunk_size set (and below num_paths)
+        chunk_size = self.config.chunk_size or num_paths
+
+        logger.info(
+            f"Simulating {num_paths} paths in chunks of {chunk_size} "
+            f"for {len(underlying_prices)} underlyings"
         )
 
-        # Calculate percentiles
-        percentiles = PercentileResults.from_array(final_values)
+        # Chunks draw consecutively from self.rng, so they consume the same
+        # random stream as a single full-size run with the same seed
+        accumulator = self._accumulate_paths(
+            num_paths, chunk_size, underlying_positions, underlying_prices,
+            underlying_vols, initial_value, self._cholesky_factor(correlation_matrix)
+        )
 
-        # Calculate daily statistics
-        daily_mean = portfolio_paths.mean(axis=0).tolist()
-        daily_std = portfolio_paths.std(axis=0).tolist()
-        daily_var_95 = np.percentile(portfolio_paths, 5, axis=0).tolist()
+        return self._result_from_accumulator(accumulator, underlying_prices)
 
-        # Create result
-        result = SimulationResult(
+    def _simulate_portfolio_parallel(
+        self,
+        underlying_positions: Dict[str, List[Position]],
+        underlying_prices: Dict[str, float],
+        underlying_vols: Dict[str, float],
+        initial_value: float,
+        correlation_matrix: Optional[np.ndarray],
+        workers: int
+    ) -> SimulationResult:
+        """
+        Split paths into seeded blocks, run them on a process pool and merge them
+
+        Paths are cut into fixed-size blocks (config.chunk_size, or
+        DEFAULT_BLOCK_ELEMENTS worth of paths), each drawing from its own
+        stream spawned from the simulator's seed sequence. Blocks are handed
+        to the workers and merged in block order, so for a fixed random_seed
+        the result does not depend on the worker count (with one worker the
+        blocks run in-process), and repeated runs get fresh streams. The
+        Cholesky factor is computed once and shared.
+        """
+        num_paths = self.config.num_paths
+        num_steps = self.config.num_days + 1
+        cholesky = self._cholesky_factor(correlation_matrix)
+        block_size = self.config.chunk_size or max(1, DEFAULT_BLOCK_ELEMENTS // num_steps)
+
+        full_blocks, remainder = divmod(num_paths, block_size)
+        sizes = [block_size] * full_blocks + ([remainder] if remainder else [])
+        seeds = self._seed_sequence.spawn(len(sizes))
+        # Workers inherit the resolved backend instead of resolving (and warning) per block
+        config = self.config.model_copy(update={"backend": self.backend})
+        portfolio = (underlying_positions, underlying_prices, underlying_vols, initial_value, cholesky)
+
+        runner = f"{workers} worker processes" if workers > 1 else "in-process"
+        logger.info(
+            f"Simulating {num_paths} paths in {len(sizes)} seeded blocks ({runner}) "
+            f"for {len(underlying_prices)} underlyings"
+        )
+
+        accumulator = PortfolioStatsAccumulator(initial_value, backend=self.backend)
+        if workers == 1:
+            for seed, size in zip(seeds, sizes, strict=True):
+                accumulator.merge(_simulate_block(config, seed, size, *portfolio))
+        else:
+            with self._process_pool(workers) as pool:
+                # map yields in submission order, so the merge order is fixed
+                blocks = pool.map(
+                    _simulate_block, repeat(config), seeds, sizes,
+                    *(repeat(arg) for arg in portfolio)
+                )
+                for block in blocks:
+                    accumulator.merge(block)
+
+        return self._result_from_accumulator(accumulator, underlying_prices)
+
+    def _accumulate_paths(
+        self,
+        num_paths: int,
+        block_size: int,
+        underlying_positions: Dict[str, List[Position]],
+        underlying_prices: Dict[str, float],
+        underlying_vols: Dict[str, float],
+        initial_value: float,
+        cholesky: Optional[np.ndarray]
+    ) -> PortfolioStatsAccumulator:
+        """Simulate num_paths paths block_size at a time into a PortfolioStatsAccumulator"""
+        num_steps = self.config.num_days + 1
+        accumulator = PortfolioStatsAccumulator(initial_value, backend=self.backend)
+
+        for start in range(0, num_paths, block_size):
+            size = min(block_size, num_paths - start)
+            price_paths = self._correlated_paths(
+                underlying_prices, underlying_vols, cholesky, None, num_paths=size
+            )
+            portfolio_paths = self._portfolio_value_paths(
+                price_paths, underlying_positions, underlying_vols, np.zeros((size, num_steps))
+            )
+            accumulator.update(portfolio_paths)
+
+        return accumulator
+
+    def _result_from_accumulator(
+        self,
+        accumulator: PortfolioStatsAccumulator,
+        initial_prices: Dict[str, float]
+    ) -> SimulationResult:
+        """Build a path-free SimulationResult from online statistics"""
+        initial_value = accumulator.initial_value
+        final_values = accumulator.final_values
+        quantiles = accumulator.final_quantiles
+
+        sharpe_ratio, sortino_ratio = self._risk_adjusted_ratios(
+            accumulator.daily_returns, accumulator.downside_returns
+        )
+
+        statistics = SimulationStatistics(
+            mean=float(final_values.mean),
+            std=float(final_values.std),
+            min_value=float(final_values.min),
+            max_value=float(final_values.max),
+            var_95=float(initial_value - quantiles.quantile(0.05)),
+            var_99=float(initial_value - quantiles.quantile(0.01)),
+            cvar_95=initial_value - quantiles.tail_mean(0.05),
+            cvar_99=initial_value - quantiles.tail_mean(0.01),
+            max_drawdown=float(accumulator.drawdowns.max),
+            avg_drawdown=float(accumulator.drawdowns.mean),
+            probability_loss=accumulator.losses / accumulator.count,
+            probability_gain=accumulator.gains / accumulator.count,
+            expected_return=float(accumulator.pnl.mean / initial_value) if initial_value > 0 else 0.0,
+            sharpe_ratio=sharpe_ratio,
+            sortino_ratio=sortino_ratio,
+            skewness=accumulator.pnl.skewness,
+            kurtosis=accumulator.pnl.kurtosis
+        )
+
+        percentiles = PercentileResults.from_values(
+            np.asarray(quantiles.quantile(np.array(PERCENTILE_LEVELS) / 100))
+        )
+
+        return SimulationResult(
             config=self.config,
             initial_portfolio_value=initial_value,
-            initial_prices=underlying_prices,
-            price_paths_by_symbol={s: paths.tolist() for s, paths in price_paths.items()},
-            portfolio_value_paths=portfolio_paths.tolist(),
-            final_values=final_values.tolist(),
-            pnl_distribution=pnl.tolist(),
-            return_distribution=returns.tolist(),
+            initial_prices=initial_prices,
             statistics=statistics,
             percentiles=percentiles,
-            daily_mean=daily_mean,
-            daily_std=daily_std,
-            daily_var_95=daily_var_95
+            daily_mean=np.asarray(accumulator.daily.mean).tolist(),
+            daily_std=np.asarray(accumulator.daily.std).tolist(),
+            daily_var_95=np.asarray(accumulator.daily_quantiles.quantile(0.05)).tolist()
         )
 
+    def _control_variate_weights(
+        self,
+        price_paths: Dict[str, np.ndarray],
+        underlying_positions: Dict[str, List[Position]],
+        underlying_prices: Dict[str, float],
+        underlying_vols: Dict[str, float],
+        portfolio_final: np.ndarray
+    ) -> np.ndarray:
+        """
+        Control-variate path weights from terminal underlying prices and option payoffs
+
+        Controls with analytically known expectations under the simulated GBM
+        (drift r, horizon T = num_days / 252):
+        - terminal price of every underlying: E[S_T] = S0 * exp(r * T)
+        - indicators of the terminal price falling in its own 1% / 5% tail
+          (on the side correlated with portfolio losses): E = p exactly
+        - payoff at T of each distinct option leg (strike, right) on it:
+          E[payoff] = exp(r * T) * Black-Scholes price with maturity T
+
+        Terminal prices and payoffs mostly correct the mean; the tail
+        indicators carry most of the VaR / CVaR correction.
+        """
+        rate = self.config.risk_free_rate
+        horizon = self.config.num_days / 252
+        growth = np.exp(rate * horizon)
+
+        controls: List[np.ndarray] = []
+        expectations: List[float] = []
+
+        for symbol, symbol_positions in underlying_positions.items():
+            spot = underlying_prices[symbol]
+            volatility = underlying_vols[symbol]
+            terminal = np.asarray(price_paths[symbol][:, -1])
+            controls.append(terminal)
+            expectations.append(spot * growth)
+
+            legs = {
+                (pos.option_details.strike, pos.option_details.is_call)
+                for pos in symbol_positions
+                if pos.is_option and pos.option_details
+            }
+            # Tail indicators of the terminal price at the VaR levels, on the
+            # side that moves the portfolio down: P(S_T <= s_p) = p exactly
+            direction = np.sign(np.cov(terminal, portfolio_final)[0, 1]) or 1.0
+            drift = (rate - 0.5 * volatility ** 2) * horizon
+            for level in (0.01, 0.05):
+                z = ndtri(level) * direction
+                threshold = spot * np.exp(drift + volatility * np.sqrt(horizon) * z)
+                tail = terminal <= threshold if direction > 0 else terminal >= threshold
+                controls.append(tail.astype(np.float64))
+                expectations.append(level)
+
+            for strike, is_call in sorted(legs):
+                intrinsic = terminal - strike if is_call else strike - terminal
+                controls.append(np.maximum(intrinsic, 0.0))
+                expectations.append(growth * float(self.bs_model.batch_price(
+                    spot, strike, horizon, rate, volatility, is_call
+                )))
+
+        return control_variate_weights(np.column_stack(controls), np.array(expectations))
+
+    def _reweight_statistics(
+        self,
+        statistics: SimulationStatistics,
+        sample: WeightedSample,
+        initial_value: float
+    ) -> Tuple[SimulationStatistics, PercentileResults]:
+        """Replace mean, probabilities, percentiles, VaR and CVaR with weighted estimates"""
+        mean = sample.mean()
+        percentiles = PercentileResults.from_values(
+            np.asarray(sample.quantile(np.array(PERCENTILE_LEVELS) / 100))
+        )
+
+        statistics = statistics.model_copy(update={
+            "mean": mean,
+            "var_95": float(initial_value - percentiles.p5),
+            "var_99": float(initial_value - percentiles.p1),
+            "cvar_95": initial_value - sample.tail_mean(0.05),
+            "cvar_99": initial_value - sample.tail_mean(0.01),
+            "probability_loss": sample.probability_below(initial_value),
+            "probability_gain": sample.probability_above(initial_value),
+            "expected_return": (mean - initial_value) / initial_value if initial_value > 0 else 0.0,
+        })
+        return statistics, percentiles
+
+    def _apply_importance_sampling(
+        self,
+        result: SimulationResult,
+        underlying_positions: Dict[str, List[Position]],
+        underlying_prices: Dict[str, float],
+        underlying_vols: Dict[str, float],
+        correlation_matrix: Optional[np.ndarray]
+    ) -> None:
+        """
+        Re-estimate the loss tail of result with importance sampling
+
+        The final portfolio value depends on the paths only through the
+        terminal prices, so the tail pass draws num_paths terminal price
+        vectors in one step: x ~ N(mu, I) in independent-normal space,
+        S_T = S0 * exp((r - sigma^2 / 2) T + sigma sqrt(T) (L x)). The shift mu
+        is the delta-gamma design point for config.importance_tail and each
+        draw is weighted by its likelihood ratio exp(-mu . x + |mu|^2 / 2) / n.
+        VaR/CVaR at 95/99/99.9% and the p1/p5 percentiles are replaced.
+
+        Draws are made and valued one row block at a time (chunk_size rows
+        when set), so only the final values and weights are kept per path.
+        """
+        statistics, percentiles = result.statistics, result.percentiles
+        if statistics is None or percentiles is None:
+            return
+
+        symbols = list(underlying_prices)
+        num_paths = self.config.num_paths
+        rate = self.config.risk_free_rate
+        horizon = self.config.num_days / 252
+        initial_value = result.initial_portfolio_value
+
+        spots = np.array([underlying_prices[s] for s in symbols])
+        vols = np.array([underlying_vols[s] for s in symbols])
+        cholesky = self._cholesky_factor(correlation_matrix)
+        if cholesky is None:
+            cholesky = np.eye(len(symbols))
+
+        # Price move per unit of the aggregate horizon normals: dS = A x
+        move = (spots * vols * np.sqrt(horizon))[:, np.newaxis] * cholesky
+        deltas, gammas = self._delta_gamma(underlying_positions, underlying_prices, underlying_vols)
+        shift = self._importance_shift(
+            move, np.array([deltas[s] for s in symbols]),
+            np.array([gammas[s] for s in symbols]), self.config.importance_tail
+        )
+
+        block_elements = DEFAULT_BLOCK_ELEMENTS
+        if self.config.chunk_size:
+            block_elements = self.config.chunk_size * len(symbols)
+
+        final_values = np.empty(num_paths)
+        weights = np.empty(num_paths)
+        for rows, z in normal_blocks(
+            self.rng, num_paths, 1, len(symbols), self.config.sampler,
+            block_elements=block_elements
+        ):
+            x = z[:, 0, :] + shift
+            log_terminal = (
+                (rate - 0.5 * vols ** 2) * horizon + vols * np.sqrt(horizon) * (x @ cholesky.T)
+            )
+            terminal_prices = {
+                symbol: spots[i] * np.exp(log_terminal[:, i]) for i, symbol in enumerate(symbols)
+            }
+            final_values[rows] = self._terminal_portfolio_values(
+                terminal_prices, underlying_positions, underlying_vols
+            )
+            weights[rows] = np.exp(-(x @ shift) + 0.5 * (shift @ shift)) / num_paths
+
+        sample = WeightedSample(final_values, weights)
+        p01, p1, p5 = np.asarray(sample.quantile([0.001, 0.01, 0.05]))
+
+        result.statistics = statistics.model_copy(update={
+            "var_95": float(initial_value - p5),
+            "var_99": float(initial_value - p1),
+            "var_999": float(initial_value - p01),
+            "cvar_95": initial_value - sample.tail_mean(0.05),
+            "cvar_99": initial_value - sample.tail_mean(0.01),
+            "cvar_999": initial_value - sample.tail_mean(0.001),
+        })
+        result.percentiles = percentiles.model_copy(update={"p1": float(p1), "p5": float(p5)})
+
+        logger.info(
+            f"Importance sampling tail: shift |mu|={np.linalg.norm(shift):.2f}, "
+            f"effective sample size {1.0 / np.sum((weights / weights.sum()) ** 2):,.0f}"
+        )
+
+    def _delta_gamma(
+        self,
+        underlying_positions: Dict[str, List[Position]],
+        underlying_prices: Dict[str, float],
+        underlying_vols: Dict[str, float]
+    ) -> Tuple[Dict[str, float], Dict[str, float]]:
+        """Share-equivalent delta and gamma of the portfolio by underlying"""
+        deltas = dict.fromkeys(underlying_positions, 0.0)
+        gammas = dict.fromkeys(underlying_positions, 0.0)
+
+        options: List[Tuple[str, float, OptionDetails]] = []
+        for symbol, symbol_positions in underlying_positions.items():
+            for pos in symbol_positions:
+                if pos.is_stock:
+                    deltas[symbol] += pos.position
+                elif pos.is_option and pos.option_details:
+                    options.append((symbol, pos.position, pos.option_details))
+
+        if options:
+            # All option legs in one batch_greeks call
+            greeks = self.bs_model.batch_greeks(
+                np.array([underlying_prices[symbol] for symbol, _, _ in options]),
+                np.array([opt.strike for _, _, opt in options]),
+                np.array([opt.days_to_expiry / 365.0 for _, _, opt in options]),
+                self.config.risk_free_rate,
+                np.array([underlying_vols[symbol] for symbol, _, _ in options]),
+                np.array([opt.is_call for _, _, opt in options])
+            )
+            for i, (symbol, position, opt) in enumerate(options):
+                contracts = position * opt.multiplier
+                deltas[symbol] += float(greeks.delta[i]) * contracts
+                gammas[symbol] += float(greeks.gamma[i]) * contracts
+
+        return deltas, gammas
+
+    @staticmethod
+    def _importance_shift(
+        move: np.ndarray,
+        deltas: np.ndarray,
+        gammas: np.ndarray,
+        tail: float,
+        iterations: int = 20
+    ) -> np.ndarray:
+        """
+        Delta-gamma design point: most likely x on the tail radius in the loss direction
+
+        With dS = A x, the delta-gamma loss is -(delta . dS + dS . Gamma dS / 2).
+        Starting from the delta direction (or the most negative-gamma direction
+        for a delta-neutral book), x is moved along the loss gradient on the
+        sphere |x| = z_(1 - tail); the point with the largest loss is returned.
+        """
+        radius = float(ndtri(1.0 - tail))
+
+        def loss(x: np.ndarray) -> float:
+            ds = move @ x
+            return -float(deltas @ ds + 0.5 * ds @ (gammas * ds))
+
+        def loss_gradient(x: np.ndarray) -> np.ndarray:
+            gradient: np.ndarray = -(move.T @ (deltas + gammas * (move @ x)))
+            return gradient
+
+        direction = loss_gradient(np.zeros(len(deltas)))
+        if not np.any(direction):
+            # No first-order exposure: go where the gamma loss grows fastest
+            eigenvalues, eigenvectors = np.linalg.eigh(-(move.T * gammas) @ move)
+            direction = eigenvectors[:, -1]
+        if not np.any(direction):
+            return np.zeros(len(deltas))
+
+        x: np.ndarray = radius * direction / np.linalg.norm(direction)
+        best, best_loss = x, loss(x)
+        for _ in range(iterations):
+            gradient = loss_gradient(x)
+            if not np.any(gradient):
+                break
+            x = radius * gradient / np.linalg.norm(gradient)
+            if loss(x) > best_loss:
+                best, best_loss = x, loss(x)
+
+        return best
+
+    def _terminal_portfolio_values(
+        self,
+        terminal_prices: Dict[str, np.ndarray],
+        underlying_positions: Dict[str, List[Position]],
+        underlying_vols: Dict[str, float]
+    ) -> np.ndarray:
+        """Portfolio value at the horizon, valued as the last column of _portfolio_value_paths"""
+        num_days = self.config.num_days
+        values = np.zeros(len(next(iter(terminal_prices.values()))))
+
+        for symbol, symbol_positions in underlying_positions.items():
+            prices = terminal_prices[symbol]
+            for pos in symbol_positions:
+                if pos.is_stock:
+                    values += pos.position * prices
+                elif pos.is_option and pos.option_details:
+                    opt = pos.option_details
+                    time_to_expiry = max(opt.days_to_expiry - num_days, 0) / 365.0
+                    values += self.bs_model.batch_price(
+                        prices, opt.strike, time_to_expiry, self.config.risk_free_rate,
+                        underlying_vols[symbol], opt.is_call
+                    ) * pos.position * opt.multiplier
+
+        return values
+
+    def _log_result(self, result: SimulationResult) -> None:
+        statistics = result.statistics
+        initial_value = result.initial_portfolio_value
+        if statistics is None:
+            return
+
         logger.info("=" * 60)
         logger.info("Monte Carlo Simulation Complete:")
         logger.info(f"  Initial Value: ${initial_value:,.2f}")
@@ -382,56 +1119,86 @@ class MonteCarloSimulator:
         logger.info(f"  Sharpe Ratio: {statistics.sharpe_ratio:.2f}")
         logger.info("=" * 60)
 
-        return result
-
     def _calculate_statistics(
         self,
         portfolio_paths: np.ndarray,
         initial_value: float,
         final_values: np.ndarray,
         pnl: np.ndarray,
-        returns: np.ndarray
+        percentiles: PercentileResults
     ) -> SimulationStatistics:
-        """Calculate comprehensive statistics from simulation results"""
-
-        # Basic statistics
-        mean = float(np.mean(final_values))
-        std = float(np.std(final_values))
-
-        # VaR (Value at Risk) - loss at percentile
-        var_95 = float(initial_value - np.percentile(final_values, 5))
-        var_99 = float(initial_value - np.percentile(final_values, 1))
+        """
+        Calculate comprehensive statistics from simulation results
 
-        # CVaR (Conditional VaR / Expected Shortfall)
-        var_95_threshold = np.percentile(final_values, 5)
-        var_99_threshold = np.percentile(final_values, 1)
-        cvar_95 = float(initial_value - np.mean(final_values[final_values <= var_95_threshold]))
-        cvar_99 = float(initial_value - np.mean(final_values[final_values <= var_99_threshold]))
+        Quantiles come from the single partition pass behind percentiles, the
+        99% tail is taken from the 95% tail instead of rescanning all paths,
+        moments come from one RunningMoments pass, and drawdowns and daily
+        returns share one pass over the path blocks.
+        """
+        num_paths = final_values.shape[0]
 
-        # Drawdown analysis
-        drawdowns = []
-        for path in portfolio_paths:
-            running_max = np.maximum.accumulate(path)
-            dd = (running_max - path) / running_max
-            drawdowns.append(np.max(dd))
+        # Mean, std, skewness, kurtosis, min and max in one pass
+        moments = RunningMoments(higher_moments=True).update(pnl)
 
-        max_drawdown = float(np.max(drawdowns))
-        avg_drawdown = float(np.mean(drawdowns))
+        # VaR (Value at Risk) - loss at percentile
+        var_95 = float(initial_value - percentiles.p5)
+        var_99 = float(initial_value - percentiles.p1)
+
+        # CVaR (Conditional VaR / Expected Shortfall); p1 <= p5, so the 99%
+        # tail is a subset of the 95% tail
+        tail_95 = final_values[final_values <= percentiles.p5]
+        tail_99 = tail_95[tail_95 <= percentiles.p1]
+        cvar_95 = float(initial_value - np.mean(tail_95))
+        cvar_99 = float(initial_value - np.mean(tail_99))
+
+        # Drawdown and daily return analysis, one row block at a time so
+        # memory-mapped paths are never fully loaded
+        drawdowns = np.empty(num_paths)
+        daily_moments = RunningMoments()
+        downside_moments = RunningMoments()
+
+        for rows in row_blocks(*portfolio_paths.shape):
+            block = np.asarray(portfolio_paths[rows])
+            drawdowns[rows] = max_drawdowns(block, self.backend)
+
+            block_returns = np.diff(block, axis=1) / block[:, :-1]
+            daily_moments.update(block_returns)
+            downside_moments.update(block_returns[block_returns < 0])
 
-        # Probability metrics
-        prob_loss = float(np.mean(pnl < 0))
-        prob_gain = float(np.mean(pnl > 0))
+        # Risk-adjusted returns
+        sharpe_ratio, sortino_ratio = self._risk_adjusted_ratios(daily_moments, downside_moments)
 
-        # Expected return
-        expected_return = float(np.mean(returns))
+        return SimulationStatistics(
+            mean=float(initial_value + moments.mean),
+            std=float(moments.std),
+            min_value=float(initial_value + moments.min),
+            max_value=float(initial_value + moments.max),
+            var_95=var_95,
+            var_99=var_99,
+            cvar_95=cvar_95,
+            cvar_99=cvar_99,
+            max_drawdown=float(np.max(drawdowns)),
+            avg_drawdown=float(np.mean(drawdowns)),
+            probability_loss=np.count_nonzero(pnl < 0) / num_paths,
+            probability_gain=np.count_nonzero(pnl > 0) / num_paths,
+            expected_return=float(moments.mean / initial_value) if initial_value > 0 else 0.0,
+            sharpe_ratio=sharpe_ratio,
+            sortino_ratio=sortino_ratio,
+            skewness=moments.skewness,
+            kurtosis=moments.kurtosis
+        )
 
-        # Risk-adjusted returns
+    def _risk_adjusted_ratios(
+        self,
+        daily_moments: RunningMoments,
+        downside_moments: RunningMoments
+    ) -> Tuple[float, float]:
+        """Annualized Sharpe and Sortino ratios from pooled daily return moments"""
         # Sharpe Ratio (annualized)
         trading_days = self.config.num_days
         annualization_factor = np.sqrt(252 / trading_days)
-        daily_returns = np.diff(portfolio_paths, axis=1) / portfolio_paths[:, :-1]
-        avg_daily_return = np.mean(daily_returns)
-        std_daily_return = np.std(daily_returns)
+        avg_daily_return = daily_moments.mean
+        std_daily_return = daily_moments.std
 
         if std_daily_return > 0:
             sharpe_ratio = float(avg_daily_return / std_daily_return * annualization_factor)
@@ -439,9 +1206,8 @@ class MonteCarloSimulator:
             sharpe_ratio = 0.0
 
         # Sortino Ratio (downside risk only)
-        downside_returns = daily_returns[daily_returns < 0]
-        if len(downside_returns) > 0:
-            downside_std = np.std(downside_returns)
+        if downside_moments.count > 0:
+            downside_std = downside_moments.std
             if downside_std > 0:
                 sortino_ratio = float(avg_daily_return / downside_std * annualization_factor)
             else:
@@ -449,44 +1215,48 @@ class MonteCarloSimulator:
         else:
             sortino_ratio = float('inf') if avg_daily_return > 0 else 0.0
 
-        # Higher moments
-        skewness = float(scipy_stats.skew(pnl))
-        kurtosis = float(scipy_stats.kurtosis(pnl))
+        return sharpe_ratio, sortino_ratio
 
-        return SimulationStatistics(
-            mean=mean,
-            std=std,
-            min_value=float(np.min(final_values)),
-            max_value=float(np.max(final_values)),
-            var_95=var_95,
-            var_99=var_99,
-            cvar_95=cvar_95,
-            cvar_99=cvar_99,
-            max_drawdown=max_drawdown,
-            avg_drawdown=avg_drawdown,
-            probability_loss=prob_loss,
-            probability_gain=prob_gain,
-            expected_return=expected_return,
-            sharpe_ratio=sharpe_ratio,
-            sortino_ratio=sortino_ratio,
-            skewness=skewness,
-            kurtosis=kurtosis
-        )
+    def _daily_moments(self, portfolio_paths: np.ndarray) -> Tuple[List[float], List[float]]:
+        """Per-day mean and std across paths, one column block at a time"""
+        num_paths, num_steps = portfolio_paths.shape
+        daily_mean = np.empty(num_steps)
+        daily_std = np.empty(num_steps)
+
+        for cols in column_blocks(num_paths, num_steps):
+            block = np.asarray(portfolio_paths[:, cols])
+            daily_mean[cols] = block.mean(axis=0)
+            daily_std[cols] = block.std(axis=0)
+
+        return daily_mean.tolist(), daily_std.tolist()
 
     def stress_test(
         self,
         positions: List[Position],
         market_data: Optional[Dict[int, MarketData]] = None,
-        scenarios: Optional[Dict[str, Dict[str, float]]] = None
+        scenarios: Optional[Dict[str, Dict[str, float]]] = None,
+        correlation_matrix: Optional[np.ndarray] = None
     ) -> Dict[str, SimulationResult]:
         """
-        Run stress test scenarios
+        Run stress test scenarios on common random numbers
+
+        Base price paths are simulated once and every scenario is an array
+        transform of them (see _scenario_paths), so all scenarios see the same
+        random draws and their differences are not Monte Carlo noise. With
+        chunk_size set, base paths are drawn chunk by chunk and each scenario
+        keeps online statistics. Each call spawns one child of the
+        simulator's seed sequence and every scenario draws from it; when
+        parallel_workers allows it, scenarios are split across a process pool
+        whose workers all rebuild the simulator on that child seed, so
+        results do not depend on the worker count and repeated calls draw
+        fresh paths in both modes.
 
         Args:
             positions: List of positions
             market_data: Market data dictionary
             scenarios: Dictionary of scenario_name -> {symbol: price_shock}
                        e.g., {"market_crash": {"SPY": -0.20, "AAPL": -0.30}}
+            correlation_matrix: Correlation matrix for underlying assets
 
         Returns:
             Dictionary of scenario_name -> SimulationResult
@@ -501,22 +1271,147 @@ class MonteCarloSimulator:
                 "volatility_collapse": {"_vol_mult": 0.5},
             }
 
-        results = {}
+        names = list(scenarios)
+        workers = min(self._resolve_workers(self.config.num_paths * len(names)), len(names))
+        seed = self._seed_sequence.spawn(1)[0]
+
+        if workers > 1:
+            logger.info(f"Running {len(names)} stress scenarios on {workers} worker processes")
+            with self._process_pool(workers) as pool:
+                futures = [
+                    pool.submit(
+                        _stress_worker, self.config, seed, positions, market_data,
+                        {name: scenarios[name] for name in group}, correlation_matrix
+                    )
+                    for group in np.array_split(np.array(names, dtype=object), workers)
+                ]
+                results = {}
+                for future in futures:
+                    results.update(future.result())
+        else:
+            results = _stress_worker(
+                self.config, seed, positions, market_data, scenarios, correlation_matrix
+            )
 
-        for scenario_name, adjustments in scenarios.items():
-            logger.info(f"Running stress scenario: {scenario_name}")
+        for scenario_name, result in results.items():
+            if result.statistics is None:
+                continue
+            logger.info(
+                f"  Scenario {scenario_name}: "
+                f"E[P&L]=${result.statistics.mean - result.initial_portfolio_value:,.2f}"
+            )
 
-            # Apply adjustments to market data
-            adjusted_market_data = self._apply_scenario(market_data, adjustments)
+        return results
 
-            # Run simulation
-            result = self.simulate_portfolio(positions, adjusted_market_data)
-            results[scenario_name] = result
+    def _stress_scenarios(
+        self,
+        positions: List[Position],
+        market_data: Optional[Dict[int, MarketData]],
+        scenarios: Dict[str, Dict[str, float]],
+        correlation_matrix: Optional[np.ndarray]
+    ) -> Dict[str, SimulationResult]:
+        """Simulate every scenario in-process from one set of base paths"""
+        _, base_prices, base_vols, _ = self._prepare_portfolio(positions, market_data)
+        inputs = {
+            name: self._prepare_portfolio(positions, self._apply_scenario(market_data, adjustments))
+            for name, adjustments in scenarios.items()
+        }
+        cholesky = self._cholesky_factor(correlation_matrix)
+        num_paths = self.config.num_paths
+        num_steps = self.config.num_days + 1
+        chunk_size = self.config.chunk_size
+
+        logger.info(
+            f"Running {len(scenarios)} stress scenarios on common random numbers "
+            f"({num_paths} paths, {len(base_prices)} underlyings)"
+        )
+
+        if chunk_size and chunk_size < num_paths:
+            accumulators = {
+                name: PortfolioStatsAccumulator(initial_value, backend=self.backend)
+                for name, (_, _, _, initial_value) in inputs.items()
+            }
+            for start in range(0, num_paths, chunk_size):
+                size = min(chunk_size, num_paths - start)
+                base_paths = self._correlated_paths(
+                    base_prices, base_vols, cholesky, None, num_paths=size
+                )
+                for name, (underlying_positions, prices, vols, _) in inputs.items():
+                    price_paths = self._scenario_paths(
+                        base_paths, base_prices, base_vols, prices, vols
+                    )
+                    accumulators[name].update(self._portfolio_value_paths(
+                        price_paths, underlying_positions, vols, np.zeros((size, num_steps))
+                    ))
+            results = {
+                name: self._result_from_accumulator(accumulators[name], inputs[name][1])
+                for name in inputs
+            }
+        else:
+            base_paths = self._correlated_paths(
+                base_prices, base_vols, cholesky, None, num_paths=num_paths
+            )
+            results = {
+                name: self._result_from_paths(
+                    self._scenario_paths(base_paths, base_prices, base_vols, prices, vols),
+                    underlying_positions, prices, vols, initial_value,
+                    storage_name=f"stress_{i}_portfolio_value_paths"
+                )
+                for i, (name, (underlying_positions, prices, vols, initial_value))
+                in enumerate(inputs.items())
+            }
 
-            logger.info(f"  Scenario {scenario_name}: E[P&L]=${result.statistics.mean - result.initial_portfolio_value:,.2f}")
+        if self.config.importance_sampling:
+            # Tail draws are common across scenarios as well
+            tail_state = self.rng.bit_generator.state
+            for name, (underlying_positions, prices, vols, _) in inputs.items():
+                self.rng.bit_generator.state = tail_state
+                self._apply_importance_sampling(
+                    results[name], underlying_positions, prices, vols, correlation_matrix
+                )
 
         return results
 
+    def _scenario_paths(
+        self,
+        base_paths: Dict[str, np.ndarray],
+        base_prices: Dict[str, float],
+        base_vols: Dict[str, float],
+        prices: Dict[str, float],
+        vols: Dict[str, float]
+    ) -> Dict[str, np.ndarray]:
+        """
+        Re-express base GBM paths under another spot and volatility
+
+        With the same Brownian path W, ln(S_t / S_0) = (r - sigma^2 / 2) t + sigma W_t,
+        so paths for (S_0', sigma') are S_0' * (S_t / S_0)^k * exp(c t) with
+        k = sigma' / sigma and c = (r - sigma'^2 / 2) - k (r - sigma^2 / 2).
+        A pure spot shock (k = 1) is a rescaling of the base paths.
+        """
+        rate = self.config.risk_free_rate
+        dt = 1 / 252
+        steps = np.arange(self.config.num_days + 1)
+        scenario_paths = {}
+
+        for symbol, paths in base_paths.items():
+            spot_ratio = self.dtype.type(prices[symbol] / base_prices[symbol])
+            vol_ratio = vols[symbol] / base_vols[symbol]
+
+            if vol_ratio == 1.0:
+                scenario_paths[symbol] = paths * spot_ratio
+                continue
+
+            drift_shift = (
+                (rate - 0.5 * vols[symbol] ** 2) - vol_ratio * (rate - 0.5 * base_vols[symbol] ** 2)
+            ) * dt * steps
+            log_paths = np.log(paths / self.dtype.type(base_prices[symbol]))
+            log_paths *= self.dtype.type(vol_ratio)
+            log_paths += drift_shift.astype(self.dtype)
+            scenario_paths[symbol] = np.exp(log_paths, out=log_paths)
+            scenario_paths[symbol] *= self.dtype.type(prices[symbol])
+
+        return scenario_paths
+
     def _apply_scenario(
         self,
         market_data: Optional[Dict[int, MarketData]],
@@ -550,3 +1445,34 @@ class MonteCarloSimulator:
             adjusted[con_id] = new_md
 
         return adjusted
+
+
+def _simulate_block(
+    config: SimulationConfig,
+    seed: np.random.SeedSequence,
+    num_paths: int,
+    underlying_positions: Dict[str, List[Position]],
+    underlying_prices: Dict[str, float],
+    underlying_vols: Dict[str, float],
+    initial_value: float,
+    cholesky: Optional[np.ndarray]
+) -> PortfolioStatsAccumulator:
+    """Process pool entry point: simulate one block of paths on its own stream"""
+    simulator = MonteCarloSimulator.from_config(config, seed)
+    return simulator._accumulate_paths(
+        num_paths, num_paths, underlying_positions, underlying_prices,
+        underlying_vols, initial_value, cholesky
+    )
+
+
+def _stress_worker(
+    config: SimulationConfig,
+    seed: np.random.SeedSequence,
+    positions: List[Position],
+    market_data: Optional[Dict[int, MarketData]],
+    scenarios: Dict[str, Dict[str, float]],
+    correlation_matrix: Optional[np.ndarray]
+) -> Dict[str, SimulationResult]:
+    """Process pool entry point: a group of stress scenarios on the stress run's seed"""
+    simulator = MonteCarloSimulator.from_config(config, seed)
+    return simulator._stress_scenarios(positions, market_data, scenarios, correlation_matrix)
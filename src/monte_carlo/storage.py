@@ -0,0 +1,130 @@
+"""
+Path storage helpers - in-memory or memory-mapped path arrays and block iteration
+
+Large simulations (up to 1,000,000 paths x 365 days per symbol) do not fit in
+RAM. Path arrays can be backed by .npy files opened with np.memmap, and every
+pass over them is done in row or column blocks so only one block is resident
+at a time.
+"""
+
+from pathlib import Path
+from typing import Iterator, Optional, Sequence, Tuple, Union
+
+import numpy as np
+from numpy.typing import DTypeLike
+
+# Elements per block (64 MB of float64)
+DEFAULT_BLOCK_ELEMENTS = 8_000_000
+
+
+def allocate_paths(
+    shape: Tuple[int, ...],
+    storage_dir: Optional[Union[str, Path]] = None,
+    name: str = "paths",
+    dtype: DTypeLike = np.float64
+) -> np.ndarray:
+    """
+    Allocate a path array, memory-mapped when a storage directory is given
+
+    Args:
+        shape: Array shape
+        storage_dir: Directory for the .npy file (None allocates in RAM)
+        name: File name without extension
+        dtype: Array dtype
+
+    Returns:
+        Zero-initialized ndarray or np.memmap
+    """
+    if storage_dir is None:
+        return np.zeros(shape, dtype=dtype)
+
+    directory = Path(storage_dir)
+    directory.mkdir(parents=True, exist_ok=True)
+    return np.lib.format.open_memmap(
+        directory / f"{name}.npy", mode="w+", dtype=dtype, shape=shape
+    )
+
+
+def row_blocks(
+    num_rows: int,
+    num_cols: int,
+    block_elements: int = DEFAULT_BLOCK_ELEMENTS
+) -> Iterator[slice]:
+    """Yield row slices covering num_rows with about block_elements per block"""
+    step = max(1, block_elements // max(1, num_cols))
+    for start in range(0, num_rows, step):
+        yield slice(start, min(start + step, num_rows))
+
+
+def column_blocks(
+    num_rows: int,
+    num_cols: int,
+    block_elements: int = DEFAULT_BLOCK_ELEMENTS
+) -> Iterator[slice]:
+    """Yield column slices covering num_cols with about block_elements per block"""
+    return row_blocks(num_cols, num_rows, block_elements)
+
+
+def column_percentiles(
+    paths: np.ndarray,
+    q: Union[float, Sequence[float]],
+    block_elements: int = DEFAULT_BLOCK_ELEMENTS
+) -> np.ndarray:
+    """
+    Per-column percentiles of a (num_paths, num_steps) array, one column block at a time
+
+    Args:
+        paths: Path array (may be a memmap)
+        q: Percentile or sequence of percentiles in [0, 100]
+        block_elements: Elements per block
+
+    Returns:
+        Array of shape (num_steps,) for scalar q, else (len(q), num_steps)
+    """
+    num_rows, num_cols = paths.shape
+    q_array = np.asarray(q, dtype=np.float64)
+    result = np.empty(q_array.shape + (num_cols,))
+
+    for cols in column_blocks(num_rows, num_cols, block_elements):
+        result[..., cols] = np.percentile(paths[:, cols], q_array, axis=0)
+
+    return result
+
+
+def partition_percentiles(
+    values: np.ndarray,
+    q: Sequence[float]
+) -> np.ndarray:
+    """
+    Percentiles of a 1-D array from a single np.partition pass
+
+    Equivalent to np.percentile(values, q) with linear interpolation, but all
+    requested order statistics are selected together instead of one
+    selection per percentile.
+
+    Args:
+        values: 1-D array
+        q: Percentiles in [0, 100]
+
+    Returns:
+        Array of shape (len(q),)
+    """
+    values = np.asarray(values).ravel()
+    positions = np.asarray(q, dtype=np.float64) / 100.0 * (values.size - 1)
+    lower = np.floor(positions).astype(np.intp)
+    upper = np.minimum(lower + 1, values.size - 1)
+
+    partitioned = np.partition(values, np.union1d(lower, upper))
+    low_values, high_values = partitioned[lower], partitioned[upper]
+    percentiles: np.ndarray = low_values + (positions - lower) * (high_values - low_values)
+    return percentiles
+
+
+def store_array(path: Union[str, Path], array: np.ndarray) -> None:
+    """Write an array to a .npy file, or just flush it if it is already mapped there"""
+    path = Path(path)
+    filename = getattr(array, "filename", None)
+    if isinstance(array, np.memmap) and filename and Path(filename).resolve() == path.resolve():
+        array.flush()
+        return
+    np.save(path, array)
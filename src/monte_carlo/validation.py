@@ -0,0 +1,116 @@
+"""
+Precision validation - guardrails for float32 simulation
+
+Runs the same simulation (same seed, same random stream) in float64 and
+float32 and compares the key statistics. float32 draws are the float64 draws
+rounded, so the differences measure precision loss only, not Monte Carlo
+noise, and the tolerance can be tight.
+"""
+
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+from loguru import logger
+from pydantic import BaseModel, Field
+
+from ..ib_client.models import MarketData, Position
+from .models import PathDType
+from .simulator import MonteCarloSimulator
+
+# Default maximum relative error of float32 statistics against float64
+DEFAULT_FLOAT32_TOLERANCE = 1e-3
+
+# Statistics compared by the harness
+VALIDATED_METRICS = ("mean", "var_95", "var_99", "cvar_95", "cvar_99")
+
+
+class PrecisionError(Exception):
+    """float32 statistics deviate from float64 beyond the tolerance"""
+    pass
+
+
+class PrecisionReport(BaseModel):
+    """float32 vs float64 comparison of simulation statistics"""
+    tolerance: float = Field(description="Maximum allowed relative error")
+    reference: Dict[str, float] = Field(description="float64 statistics")
+    candidate: Dict[str, float] = Field(description="float32 statistics")
+    relative_errors: Dict[str, float] = Field(description="|float32 - float64| / |float64|")
+
+    @property
+    def failures(self) -> List[str]:
+        """Metrics whose relative error exceeds the tolerance"""
+        return [
+            metric for metric, error in self.relative_errors.items() if error > self.tolerance
+        ]
+
+    @property
+    def passed(self) -> bool:
+        """True if every metric is within tolerance"""
+        return not self.failures
+
+
+def validate_float32(
+    positions: List[Position],
+    market_data: Optional[Dict[int, MarketData]] = None,
+    correlation_matrix: Optional[np.ndarray] = None,
+    tolerance: float = DEFAULT_FLOAT32_TOLERANCE,
+    raise_on_failure: bool = True,
+    **simulator_kwargs: Any
+) -> PrecisionReport:
+    """
+    Compare float32 simulation statistics against float64
+
+    Args:
+        positions: List of Position objects
+        market_data: Dictionary of conId -> MarketData
+        correlation_matrix: Correlation matrix for underlying assets
+        tolerance: Maximum relative error per metric
+        raise_on_failure: Raise PrecisionError if any metric exceeds tolerance
+        **simulator_kwargs: MonteCarloSimulator arguments (num_paths,
+            num_days, sampler, ...); random_seed defaults to 0
+
+    Returns:
+        PrecisionReport with both sets of statistics and relative errors
+
+    Raises:
+        PrecisionError: If raise_on_failure and a metric is out of tolerance
+    """
+    simulator_kwargs.setdefault("random_seed", 0)
+    simulator_kwargs.pop("dtype", None)
+
+    dtypes: Tuple[PathDType, ...] = ("float64", "float32")
+    statistics = {}
+    for dtype in dtypes:
+        simulator = MonteCarloSimulator(dtype=dtype, **simulator_kwargs)
+        result = simulator.simulate_portfolio(positions, market_data, correlation_matrix)
+        statistics[dtype] = {
+            metric: float(getattr(result.statistics, metric)) for metric in VALIDATED_METRICS
+        }
+
+    reference, candidate = statistics["float64"], statistics["float32"]
+    relative_errors = {
+        metric: abs(candidate[metric] - reference[metric]) / max(abs(reference[metric]), 1e-12)
+        for metric in VALIDATED_METRICS
+    }
+
+    report = PrecisionReport(
+        tolerance=tolerance,
+        reference=reference,
+        candidate=candidate,
+        relative_errors=relative_errors
+    )
+
+    worst = max(relative_errors, key=lambda metric: relative_errors[metric])
+    logger.info(
+        f"float32 validation: worst relative error {relative_errors[worst]:.2e} ({worst}), "
+        f"tolerance {tolerance:.0e}"
+    )
+
+    if raise_on_failure and not report.passed:
+        raise PrecisionError(
+            "float32 statistics out of tolerance: " + ", ".join(
+                f"{metric} {relative_errors[metric]:.2e}" for metric in report.failures
+            )
+        )
+
+    return report
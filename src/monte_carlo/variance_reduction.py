@@ -0,0 +1,111 @@
+"""
+Variance reduction - control variate weights and weighted path statistics
+
+Variance reduction is expressed as per-path weights on the simulated sample:
+every estimate (mean, probabilities, quantiles, tail means) is read from the
+weighted empirical distribution. With equal weights 1/n this reduces to the
+ordinary Monte Carlo estimates.
+"""
+
+from typing import Sequence, Union
+
+import numpy as np
+
+
+def control_variate_weights(controls: np.ndarray, expectations: np.ndarray) -> np.ndarray:
+    """
+    Regression control-variate weights
+
+    w_i = (1 + (X_i - X_bar) . S^-1 (mu - X_bar)) / n, where S is the sample
+    covariance of the controls. The weights sum to 1 and reproduce the known
+    control expectations exactly; sum(w_i * Y_i) equals the optimal-beta
+    estimate Y_bar - beta . (X_bar - mu), and quantiles of the weighted
+    distribution are the control-variate quantile estimates.
+
+    Args:
+        controls: Control values of shape (num_paths, num_controls)
+        expectations: Known expectations of the controls, shape (num_controls,)
+
+    Returns:
+        Weights of shape (num_paths,)
+    """
+    controls = np.asarray(controls, dtype=np.float64)
+    num_paths = controls.shape[0]
+    control_means = controls.mean(axis=0)
+    centered = controls - control_means
+    covariance = centered.T @ centered / num_paths
+
+    # lstsq tolerates collinear or degenerate controls (e.g. options that
+    # never finish in the money on any path)
+    coefficients = np.linalg.lstsq(
+        covariance, np.asarray(expectations) - control_means, rcond=None
+    )[0]
+    weights: np.ndarray = (1.0 + centered @ coefficients) / num_paths
+    return weights
+
+
+class WeightedSample:
+    """
+    Weighted empirical distribution of a 1-D sample
+
+    Sorts once; quantile() and tail_mean() mirror QuantileSketch so the
+    same VaR / CVaR formulas apply. Weights should sum to 1; individual
+    control-variate weights may be negative, so the cumulative weight is
+    made monotone before it is inverted.
+    """
+
+    def __init__(self, values: np.ndarray, weights: np.ndarray):
+        """
+        Args:
+            values: Sample values, shape (n,)
+            weights: Weights, shape (n,)
+        """
+        order = np.argsort(values)
+        self.values = np.asarray(values)[order]
+        self.weights = np.asarray(weights, dtype=np.float64)[order]
+        self.cdf = np.maximum.accumulate(np.cumsum(self.weights))
+
+    def mean(self) -> float:
+        """Weighted mean"""
+        return float(np.dot(self.weights, self.values))
+
+    def probability_below(self, threshold: float) -> float:
+        """Weighted probability of values < threshold"""
+        index = int(np.searchsorted(self.values, threshold, side="left"))
+        return float(self.cdf[index - 1]) if index > 0 else 0.0
+
+    def probability_above(self, threshold: float) -> float:
+        """Weighted probability of values > threshold"""
+        index = int(np.searchsorted(self.values, threshold, side="right"))
+        return float(self.cdf[-1] - self.cdf[index - 1]) if index > 0 else float(self.cdf[-1])
+
+    def quantile(
+        self,
+        q: Union[float, Sequence[float], np.ndarray]
+    ) -> Union[float, np.ndarray]:
+        """
+        Estimate quantiles
+
+        Args:
+            q: Quantile level(s) in [0, 1]
+
+        Returns:
+            Smallest sample value whose cumulative weight reaches each level
+        """
+        index = np.minimum(np.searchsorted(self.cdf, q, side="left"), len(self.values) - 1)
+        return self.values[index]
+
+    def tail_mean(self, alpha: float) -> float:
+        """
+        Mean of the lowest alpha probability mass (the CVaR integral)
+
+        Args:
+            alpha: Tail probability, e.g. 0.05
+
+        Returns:
+            (1 / alpha) * integral of the weighted quantile function over [0, alpha]
+        """
+        last = min(int(np.searchsorted(self.cdf, alpha, side="left")), len(self.values) - 1)
+        mass_before = self.cdf[last - 1] if last > 0 else 0.0
+        tail_sum = np.dot(self.weights[:last], self.values[:last])
+        return float((tail_sum + (alpha - mass_before) * self.values[last]) / alpha)
@@ -65,6 +65,23 @@ class Visualizer:
 
         logger.info(f"Visualizer initialized. Output dir: {output_dir}")
 
+    @staticmethod
+    def _warn_no_paths(simulation: SimulationResult, chart: str) -> None:
+        """Log which monte_carlo setting left the simulation without path arrays"""
+        config = simulation.config
+        if config.chunk_size and config.chunk_size < config.num_paths:
+            cause = (
+                f"chunk_size={config.chunk_size} keeps only online statistics; "
+                "set monte_carlo.chunk_size: null to keep paths"
+            )
+        else:
+            cause = (
+                f"{config.num_paths:,} paths ran on a process pool "
+                f"(parallel_workers={config.parallel_workers}); "
+                "set monte_carlo.parallel_workers: 1 to keep paths"
+            )
+        logger.warning(f"Simulation result holds no paths: {cause}. Skipping {chart} chart")
+
     def plot_position_pie(
         self,
         positions: List[Position],
@@ -324,25 +341,24 @@ class Visualizer:
         logger.info(f"Generating price paths chart ({num_paths} paths)...")
 
         if symbol and symbol in simulation.price_paths_by_symbol:
-            paths = np.array(simulation.price_paths_by_symbol[symbol])[:num_paths]
+            paths = simulation.get_price_paths_array(symbol)[:num_paths]
             title = f"{symbol} Price Simulation ({simulation.config.num_days} Days)"
             ylabel = "Price ($)"
         else:
-            paths = np.array(simulation.portfolio_value_paths)[:num_paths]
+            paths = simulation.get_portfolio_paths_array()[:num_paths]
             title = f"Portfolio Value Simulation ({simulation.config.num_days} Days)"
             ylabel = "Portfolio Value ($)"
 
+        if paths.size == 0:
+            self._warn_no_paths(simulation, "price paths")
+            return None
+
         days = np.arange(paths.shape[1])
 
         # Calculate percentile bands
-        all_paths = np.array(simulation.portfolio_value_paths) if symbol is None else \
-                    np.array(simulation.price_paths_by_symbol.get(symbol, paths))
-
-        p5 = np.percentile(all_paths, 5, axis=0)
-        p25 = np.percentile(all_paths, 25, axis=0)
-        p50 = np.percentile(all_paths, 50, axis=0)
-        p75 = np.percentile(all_paths, 75, axis=0)
-        p95 = np.percentile(all_paths, 95, axis=0)
+        # Computed in column blocks so memory-mapped path sets are not loaded at once
+        band_symbol = symbol if symbol in simulation.price_paths_by_symbol else None
+        p5, p25, p50, p75, p95 = simulation.path_percentiles([5, 25, 50, 75, 95], band_symbol)
 
         if self.interactive:
             fig = go.Figure()
@@ -448,9 +464,13 @@ class Visualizer:
         """
         logger.info("Generating return distribution chart...")
 
-        returns = np.array(simulation.return_distribution) * 100  # Convert to percentage
+        returns = simulation.get_returns_array() * 100  # Convert to percentage
         stats = simulation.statistics
 
+        if returns.size == 0:
+            self._warn_no_paths(simulation, "return distribution")
+            return None
+
         if self.interactive:
             fig = go.Figure()
 
@@ -557,9 +577,13 @@ class Visualizer:
         """
         logger.info("Generating VaR analysis chart...")
 
-        pnl = np.array(simulation.pnl_distribution)
+        pnl = simulation.get_pnl_array()
         stats = simulation.statistics
 
+        if pnl.size == 0:
+            self._warn_no_paths(simulation, "VaR analysis")
+            return None
+
         if self.interactive:
             fig = make_subplots(rows=1, cols=2,
                                subplot_titles=("P&L Distribution with VaR", "Daily VaR Evolution"))
@@ -4,12 +4,18 @@ Tests for Greeks calculation module
 
 import pytest
 import math
+import numpy as np
 from datetime import date, timedelta
+from unittest.mock import Mock
 
 from src.greeks.black_scholes import BlackScholesModel
 from src.greeks.calculator import GreeksCalculator
-from src.greeks.models import Greeks, PortfolioGreeks
-from src.ib_client.models import Position, OptionDetails
+from src.greeks.incremental import IncrementalGreeksEngine
+from src.greeks.kernels import norm_cdf, norm_pdf, batch_norm_cdf, batch_norm_pdf
+from src.greeks.models import Greeks, BatchGreeks, PortfolioGreeks
+from src.ib_client.models import (
+    Position, OptionDetails, FuturesDetails, BondDetails, MarketData
+)
 
 
 class TestBlackScholesModel:
@@ -167,6 +173,148 @@ class TestBlackScholesModel:
         assert greeks.vega > 0
         assert greeks.delta_dollars != 0
 
+    def test_batch_price_matches_scalar(self):
+        """Test vectorized pricing matches call_price/put_price element-wise"""
+        spots = [80.0, 100.0, 120.0, 0.0]
+        strikes = [100.0, 100.0, 90.0, 100.0]
+        times = [0.5, 0.0, 0.1, 0.25]
+        vols = [0.25, 0.30, 0.0, 0.20]
+
+        for is_call in (True, False):
+            batch = BlackScholesModel.batch_price(
+                spots, strikes, times, 0.05, vols, is_call, 0.01
+            )
+            price_func = BlackScholesModel.call_price if is_call else BlackScholesModel.put_price
+            expected = [
+                price_func(s, k, t, 0.05, v, 0.01)
+                for s, k, t, v in zip(spots, strikes, times, vols, strict=True)
+            ]
+            np.testing.assert_allclose(batch, expected, rtol=1e-12, atol=1e-12)
+
+    def test_batch_price_broadcasts_grid(self):
+        """Test a (paths, days) spot grid broadcasts against a time row"""
+        spot_grid = np.full((3, 4), 100.0)
+        times = np.array([[0.3, 0.2, 0.1, 0.0]])
+
+        prices = BlackScholesModel.batch_price(spot_grid, 100.0, times, 0.05, 0.2, True)
+
+        assert prices.shape == (3, 4)
+        assert np.all(np.diff(prices[0]) < 0)  # Time decay along the row
+        assert prices[0, -1] == 0.0  # ATM at expiry has no intrinsic value
+
+    def test_batch_price_grid_matches_batch_price(self):
+        """Test the shock-grid kernel equals batch_price on the broadcast inputs"""
+        rng = np.random.default_rng(11)
+        n = 100
+        spots = rng.uniform(50, 150, n)
+        strikes = rng.uniform(50, 150, n)
+        times = rng.choice([0.0, 0.01, 0.25, 1.0], n)
+        vols = rng.uniform(0.05, 0.8, n)
+        is_call = rng.random(n) < 0.5
+        spot_multipliers = np.linspace(0.7, 1.3, 9)
+        vol_multipliers = np.linspace(0.5, 2.0, 4)
+
+        grid = BlackScholesModel.batch_price_grid(
+            spots, strikes, times, 0.04, vols, is_call, 0.015,
+            spot_multipliers=spot_multipliers, volatility_multipliers=vol_multipliers
+        )
+        expected = BlackScholesModel.batch_price(
+            spots * spot_multipliers[:, None, None], strikes, times, 0.04,
+            vols * vol_multipliers[None, :, None], is_call, 0.015
+        )
+
+        assert grid.shape == (9, 4, n)
+        np.testing.assert_allclose(grid, expected, rtol=1e-9, atol=1e-10)
+
+    def test_batch_greeks_match_scalar(self):
+        """Test batch_greeks reproduces every scalar method element-wise"""
+        rng = np.random.default_rng(7)
+        n = 200
+        spots = rng.uniform(50, 150, n)
+        strikes = rng.uniform(50, 150, n)
+        times = rng.choice([0.0, 0.01, 0.25, 1.0], n)
+        vols = rng.uniform(0.05, 0.8, n)
+        is_call = rng.random(n) < 0.5
+        rate, q = 0.04, 0.015
+
+        batch = BlackScholesModel.batch_greeks(spots, strikes, times, rate, vols, is_call, q)
+
+        assert isinstance(batch, BatchGreeks)
+        assert len(batch) == n
+
+        for i in range(n):
+            args = (spots[i], strikes[i], times[i], rate, vols[i])
+            call = bool(is_call[i])
+            price = (BlackScholesModel.call_price if call else BlackScholesModel.put_price)(*args, q)
+
+            assert batch.price[i] == pytest.approx(price, rel=1e-10, abs=1e-10)
+            assert batch.delta[i] == pytest.approx(BlackScholesModel.delta(*args, call, q), rel=1e-10, abs=1e-12)
+            assert batch.gamma[i] == pytest.approx(BlackScholesModel.gamma(*args, q), rel=1e-10, abs=1e-12)
+            assert batch.theta[i] == pytest.approx(BlackScholesModel.theta(*args, call, q), rel=1e-10, abs=1e-12)
+            assert batch.vega[i] == pytest.approx(BlackScholesModel.vega(*args, q), rel=1e-10, abs=1e-12)
+            assert batch.rho[i] == pytest.approx(BlackScholesModel.rho(*args, call, q), rel=1e-10, abs=1e-12)
+
+    def test_batch_greeks_scaled_element(self):
+        """Test greeks_at scales one element like calculate_all_greeks"""
+        batch = BlackScholesModel.batch_greeks(
+            [100.0, 95.0], [100.0, 100.0], [0.5, 0.5], 0.05, [0.25, 0.3], [True, False]
+        )
+        expected = BlackScholesModel.calculate_all_greeks(
+            spot=95.0, strike=100.0, time_to_expiry=0.5, rate=0.05,
+            volatility=0.3, is_call=False, position_size=-3, multiplier=100
+        )
+
+        greeks = batch.greeks_at(1, quantity=-300, spot=95.0)
+
+        for field, value in expected.model_dump().items():
+            assert getattr(greeks, field) == pytest.approx(value, rel=1e-10, abs=1e-10)
+
+    def test_batch_implied_volatility_round_trip(self):
+        """Test batched IV recovers the volatility used to price a chain"""
+        strikes = np.linspace(80, 120, 41)
+        true_vols = 0.20 + 0.002 * (strikes - 100) ** 2 / 10
+        is_call = strikes >= 100
+        prices = BlackScholesModel.batch_price(100.0, strikes, 0.25, 0.05, true_vols, is_call)
+
+        result = BlackScholesModel.batch_implied_volatility(
+            prices, 100.0, strikes, 0.25, 0.05, is_call, precision=1e-8
+        )
+
+        assert result.converged.all()
+        assert result.convergence_rate == 1.0
+        assert np.all(result.iterations >= 1)
+        np.testing.assert_allclose(result.implied_volatility, true_vols, atol=1e-6)
+
+    def test_batch_implied_volatility_agrees_with_scalar(self):
+        """Test batched IV agrees with the scalar Newton-Raphson solver"""
+        iv_scalar = BlackScholesModel.implied_volatility(
+            option_price=4.5, spot=100, strike=105, time_to_expiry=0.5,
+            rate=0.05, is_call=True
+        )
+        result = BlackScholesModel.batch_implied_volatility(
+            [4.5], 100, 105, 0.5, 0.05, True
+        )
+
+        assert result.converged[0]
+        assert result.implied_volatility[0] == pytest.approx(iv_scalar, abs=1e-3)
+
+    def test_batch_implied_volatility_invalid_quotes(self):
+        """Test expired, zero and arbitrage-violating quotes are flagged"""
+        result = BlackScholesModel.batch_implied_volatility(
+            option_price=[5.0, 0.0, 150.0, 1.0],
+            spot=100.0,
+            strike=100.0,
+            time_to_expiry=[0.0, 0.5, 0.5, 0.5],
+            rate=0.05,
+            is_call=True
+        )
+
+        assert result.implied_volatility[0] == 0.0  # Expired
+        assert result.implied_volatility[1] == 0.0  # Zero price
+        assert np.isnan(result.implied_volatility[2])  # Above spot
+        assert list(result.converged) == [False, False, False, False]
+        assert result.iterations[:3].tolist() == [0, 0, 0]
+
 
 class TestGreeksCalculator:
     """Test Greeks calculator"""
@@ -267,6 +415,153 @@ class TestGreeksCalculator:
         assert len(portfolio_greeks.by_underlying) == 1  # Both are AAPL
         assert portfolio_greeks.total_delta != 0
 
+    @pytest.fixture
+    def mixed_book(self):
+        """Positions across asset types with partial market data"""
+        today = date.today()
+        positions = [
+            Position(symbol="AAPL", sec_type="STK", con_id=1, position=100,
+                     avg_cost=150.0, market_price=155.0, market_value=15500.0),
+            Position(symbol="AAPL", sec_type="OPT", con_id=2, position=5,
+                     avg_cost=8.0, market_price=10.0, market_value=5000.0,
+                     option_details=OptionDetails(strike=160.0, right="C",
+                                                  expiry=today + timedelta(days=30))),
+            Position(symbol="AAPL", sec_type="OPT", con_id=3, position=-2,
+                     avg_cost=4.0, market_price=3.0, market_value=-600.0,
+                     option_details=OptionDetails(strike=140.0, right="P",
+                                                  expiry=today + timedelta(days=60))),
+            Position(symbol="SPY", sec_type="OPT", con_id=4, position=1,
+                     avg_cost=2.0, market_price=1.0, market_value=100.0,
+                     option_details=OptionDetails(strike=400.0, right="P", expiry=today)),
+            Position(symbol="ES", sec_type="FUT", con_id=5, position=2,
+                     avg_cost=5000.0, market_price=5025.0, market_value=502500.0,
+                     futures_details=FuturesDetails(expiry=today + timedelta(days=90), multiplier=50)),
+            Position(symbol="EUR", sec_type="CASH", con_id=6, position=10000,
+                     avg_cost=1.08, market_price=1.085, market_value=10850.0),
+            Position(symbol="T", sec_type="BOND", con_id=7, position=10,
+                     avg_cost=980.0, market_price=990.0, market_value=9900.0,
+                     bond_details=BondDetails(maturity_date=today + timedelta(days=3650))),
+            Position(symbol="ES", sec_type="FOP", con_id=8, position=-1,
+                     avg_cost=50.0, market_price=45.0, market_value=-2250.0,
+                     option_details=OptionDetails(strike=5100.0, right="C",
+                                                  expiry=today + timedelta(days=20), multiplier=50)),
+            Position(symbol="GLD", sec_type="CMDTY", con_id=9, position=3,
+                     avg_cost=180.0, market_price=185.0, market_value=555.0),
+        ]
+        market_data = {
+            1: MarketData(symbol="AAPL", con_id=1, bid=154.9, ask=155.1),
+            2: MarketData(symbol="AAPL", con_id=2, bid=9.9, ask=10.1,
+                          underlying_price=156.0, implied_volatility=0.32),
+            4: MarketData(symbol="SPY", con_id=4, bid=0.9, ask=1.1,
+                          underlying_price=395.0, implied_volatility=0.18),
+            8: MarketData(symbol="ES", con_id=8, bid=44.0, ask=46.0,
+                          underlying_price=5030.0, implied_volatility=0.2),
+        }
+        return positions, market_data
+
+    def test_portfolio_greeks_match_per_position(self, calculator, mixed_book):
+        """Test columnar portfolio Greeks equal summing per-position Greeks"""
+        positions, market_data = mixed_book
+
+        portfolio = calculator.calculate_portfolio_greeks(positions, market_data)
+
+        expected: dict = {}
+        for position in positions:
+            greeks = calculator.calculate_position_greeks(position, market_data.get(position.con_id))
+            expected[position.symbol] = expected.get(position.symbol, Greeks()) + greeks
+
+        assert list(portfolio.by_underlying) == list(expected)
+        for symbol, greeks in expected.items():
+            actual = portfolio.by_underlying[symbol].greeks
+            for field, value in greeks.model_dump().items():
+                assert getattr(actual, field) == pytest.approx(value, rel=1e-9, abs=1e-9)
+
+        assert portfolio.by_underlying["AAPL"].position_count == 3
+        assert portfolio.by_underlying["AAPL"].underlying_price == 156.0
+        assert portfolio.by_underlying["ES"].underlying_price == 5030.0
+        assert portfolio.total_delta == pytest.approx(sum(g.delta for g in expected.values()))
+        assert portfolio.days_to_nearest_expiry == 0
+        assert 0.18 <= portfolio.weighted_average_iv <= 0.32
+        assert portfolio.weighted_dte > 0
+
+    def test_greeks_columns_shape(self, calculator, mixed_book):
+        """Test calculate_greeks_columns returns one row per position"""
+        positions, market_data = mixed_book
+
+        columns = calculator.calculate_greeks_columns(positions, market_data)
+
+        for field in Greeks.model_fields:
+            assert columns[field].shape == (len(positions),)
+        assert columns["days_to_expiry"][0] == -1
+        assert columns["implied_volatility"][1] == 0.32
+
+    def test_scenario_grid_full_revaluation(self, calculator, sample_stock_position):
+        """Test full revaluation reprices each option and moves linear legs by delta"""
+        short_call = Position(
+            symbol="AAPL", sec_type="OPT", con_id=2, position=-3,
+            avg_cost=3.0, market_price=2.0, market_value=-600.0,
+            option_details=OptionDetails(
+                strike=180.0, right="C", expiry=date.today() + timedelta(days=30)
+            )
+        )
+        market_data = {
+            2: MarketData(symbol="AAPL", con_id=2, bid=1.9, ask=2.1,
+                          underlying_price=155.0, implied_volatility=0.3)
+        }
+        positions = [sample_stock_position, short_call]
+
+        grid = calculator.scenario_grid(positions, market_data, [-20, 0, 20], [-50, 0, 50], [0, 10])
+
+        assert grid.shape == (3, 3, 2)
+        assert grid[1, 1, 0] == pytest.approx(0.0, abs=1e-8)
+
+        # +20% spot, +50% IV, 10 days later, priced directly
+        call_pnl = -300 * (
+            BlackScholesModel.call_price(155.0 * 1.2, 180.0, 20 / 365, 0.05, 0.45)
+            - BlackScholesModel.call_price(155.0, 180.0, 30 / 365, 0.05, 0.3)
+        )
+        stock_pnl = 100 * 155.0 * 0.2
+        assert grid[2, 2, 1] == pytest.approx(stock_pnl + call_pnl, rel=1e-9)
+
+        # Duplicate legs are netted, not double counted in the other direction
+        doubled = calculator.scenario_grid(positions + [short_call], market_data, [20], [50], [10])
+        assert doubled[0, 0, 0] == pytest.approx(stock_pnl + 2 * call_pnl, rel=1e-9)
+
+    def test_scenario_analysis_full_revaluation_vs_taylor(self, calculator, mixed_book):
+        """Test both scenario modes share the layout and agree to first order"""
+        positions, market_data = mixed_book
+        # Drop the option expiring today: its at-expiry delta follows the
+        # calculate_option_greeks convention rather than the intrinsic payoff
+        positions = [p for p in positions if p.con_id != 4]
+
+        taylor = calculator.scenario_analysis(positions, market_data, [-1, 0, 1], [0])
+        full = calculator.scenario_analysis(
+            positions, market_data, [-1, 0, 1], [0], full_revaluation=True
+        )
+
+        assert list(full) == list(taylor) == ["spot_-1%", "spot_+0%", "spot_+1%"]
+        assert full["spot_+0%"]["iv_+0%"] == 0.0
+
+        # Odd part of the P&L is the delta term
+        full_delta = (full["spot_+1%"]["iv_+0%"] - full["spot_-1%"]["iv_+0%"]) / 2
+        taylor_delta = (taylor["spot_+1%"]["iv_+0%"] - taylor["spot_-1%"]["iv_+0%"]) / 2
+        assert full_delta == pytest.approx(taylor_delta, rel=0.01)
+
+    def test_scenario_analysis_iv_shocks_are_relative_in_both_modes(self, calculator, mixed_book):
+        """Test iv_+1% means the same relative IV shock in both modes"""
+        positions, market_data = mixed_book
+        positions = [p for p in positions if p.con_id != 4]
+
+        taylor = calculator.scenario_analysis(positions, market_data, [0], [-1, 1])
+        full = calculator.scenario_analysis(
+            positions, market_data, [0], [-1, 1], full_revaluation=True
+        )
+
+        full_vega = (full["spot_+0%"]["iv_+1%"] - full["spot_+0%"]["iv_-1%"]) / 2
+        taylor_vega = (taylor["spot_+0%"]["iv_+1%"] - taylor["spot_+0%"]["iv_-1%"]) / 2
+        assert full_vega != 0.0
+        assert full_vega == pytest.approx(taylor_vega, rel=0.01)
+
     def test_expired_option_greeks(self, calculator):
         """Test expired option Greeks"""
         greeks = calculator.calculate_option_greeks(
@@ -281,6 +576,139 @@ class TestGreeksCalculator:
         assert greeks.theta == 0
 
 
+class TestNormalKernels:
+    """Test normal CDF/PDF kernels against scipy.stats.norm"""
+
+    @pytest.fixture
+    def grid(self):
+        return np.linspace(-12.0, 12.0, 2001)
+
+    def test_scalar_kernels_match_scipy(self, grid):
+        """Test scalar kernels agree with scipy.stats.norm to machine precision"""
+        from scipy.stats import norm
+
+        cdf = np.array([norm_cdf(float(x)) for x in grid])
+        pdf = np.array([norm_pdf(float(x)) for x in grid])
+
+        np.testing.assert_allclose(cdf, norm.cdf(grid), rtol=1e-13, atol=0)
+        np.testing.assert_allclose(pdf, norm.pdf(grid), rtol=1e-13, atol=0)
+
+    def test_batch_kernels_match_scalar(self, grid):
+        """Test batch kernels agree with the scalar ones and honour out="""
+        out = np.empty_like(grid)
+
+        np.testing.assert_allclose(
+            batch_norm_cdf(grid), [norm_cdf(float(x)) for x in grid], rtol=1e-13, atol=0
+        )
+        assert batch_norm_pdf(grid, out=out) is out
+        np.testing.assert_allclose(out, [norm_pdf(float(x)) for x in grid], rtol=1e-13, atol=0)
+
+    def test_lower_tail_keeps_precision(self):
+        """Test N(x) for very negative x does not underflow to zero"""
+        assert norm_cdf(-10.0) == pytest.approx(7.619853024160527e-24, rel=1e-12)
+        assert norm_cdf(0.0) == 0.5
+
+
+class TestIncrementalGreeksEngine:
+    """Test incremental Greeks recomputation"""
+
+    @pytest.fixture
+    def book(self):
+        today = date.today()
+        positions = [
+            Position(symbol="AAPL", sec_type="STK", con_id=1, position=100,
+                     avg_cost=150.0, market_price=155.0, market_value=15500.0),
+            Position(symbol="AAPL", sec_type="OPT", con_id=2, position=5,
+                     avg_cost=8.0, market_price=10.0, market_value=5000.0,
+                     option_details=OptionDetails(strike=160.0, right="C",
+                                                  expiry=today + timedelta(days=30))),
+            Position(symbol="SPY", sec_type="OPT", con_id=3, position=-2,
+                     avg_cost=5.0, market_price=4.0, market_value=-800.0,
+                     option_details=OptionDetails(strike=450.0, right="P",
+                                                  expiry=today + timedelta(days=45))),
+        ]
+        market_data = {
+            2: MarketData(symbol="AAPL", con_id=2, bid=9.9, ask=10.1,
+                          underlying_price=155.0, implied_volatility=0.30),
+            3: MarketData(symbol="SPY", con_id=3, bid=3.9, ask=4.1,
+                          underlying_price=460.0, implied_volatility=0.20),
+        }
+        return positions, market_data
+
+    def test_update_matches_full_recompute(self, book):
+        """Test an incremental update equals a from-scratch calculation"""
+        positions, market_data = book
+        calculator = GreeksCalculator()
+        engine = IncrementalGreeksEngine(calculator)
+        engine.load(positions, market_data)
+
+        changed = {3: MarketData(symbol="SPY", con_id=3, bid=6.0, ask=6.2,
+                                 underlying_price=440.0, implied_volatility=0.28)}
+        updated = engine.update(changed)
+
+        full = calculator.calculate_portfolio_greeks(positions, {**market_data, **changed})
+        assert updated.summary_dict() == full.summary_dict()
+        assert updated.by_underlying["SPY"].underlying_price == 440.0
+
+    def test_update_only_touches_affected_underlying(self, book):
+        """Test unaffected underlyings keep their summary objects"""
+        positions, market_data = book
+        engine = IncrementalGreeksEngine()
+        before = engine.load(positions, market_data)
+        aapl_before = before.by_underlying["AAPL"]
+
+        after = engine.update({3: MarketData(symbol="SPY", con_id=3, bid=5.0, ask=5.2,
+                                             underlying_price=450.0, implied_volatility=0.25)})
+
+        assert after.by_underlying["AAPL"] is aapl_before
+        assert after.by_underlying["SPY"] is not before.by_underlying["SPY"]
+
+    def test_update_ignores_untracked_con_ids(self, book):
+        """Test quotes for unknown contracts leave the Greeks unchanged"""
+        positions, market_data = book
+        engine = IncrementalGreeksEngine()
+        before = engine.load(positions, market_data)
+
+        after = engine.update({999: MarketData(symbol="QQQ", con_id=999, bid=1, ask=1)})
+
+        assert after is before
+
+    def test_update_requires_load(self):
+        """Test update before load raises"""
+        with pytest.raises(RuntimeError):
+            IncrementalGreeksEngine().update({})
+
+    def test_position_greeks(self, book):
+        """Test per-position Greeks lookup"""
+        positions, market_data = book
+        engine = IncrementalGreeksEngine()
+        engine.load(positions, market_data)
+
+        assert engine.position_greeks(1).delta == 100
+        assert engine.position_greeks(2).gamma > 0
+        assert engine.position_greeks(42) is None
+
+    def test_update_does_not_rescan_portfolio(self, book, monkeypatch):
+        """Test updates move running sums instead of re-running the column passes"""
+        positions, market_data = book
+        calculator = GreeksCalculator()
+        engine = IncrementalGreeksEngine(calculator)
+        engine.load(positions, market_data)
+        monkeypatch.setattr(calculator, "portfolio_metrics", Mock(side_effect=AssertionError))
+
+        quotes = dict(market_data)
+        for bid, iv in ((6.0, 0.28), (3.0, 0.18), (5.5, 0.25)):
+            quotes[3] = MarketData(symbol="SPY", con_id=3, bid=bid, ask=bid + 0.2,
+                                   underlying_price=450.0, implied_volatility=iv)
+            updated = engine.update({3: quotes[3]})
+
+        monkeypatch.undo()
+        full = calculator.calculate_portfolio_greeks(positions, quotes)
+        assert updated.summary_dict() == full.summary_dict()
+        assert updated.weighted_average_iv == pytest.approx(full.weighted_average_iv, rel=1e-12)
+        assert updated.weighted_dte == full.weighted_dte
+
+
 class TestGreeksModels:
     """Test Greeks model objects"""
 
@@ -4,7 +4,7 @@ Tests for IB Client module
 
 import pytest
 from datetime import date
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import Mock, patch, MagicMock, AsyncMock
 
 from src.ib_client.client import (
     IBClient,
@@ -13,6 +13,7 @@ from src.ib_client.client import (
     AuthenticationError,
     TimeoutError
 )
+from src.ib_client.async_client import AsyncIBClient
 from src.ib_client.models import (
     Position, AccountSummary, MarketData,
     OptionDetails, FuturesDetails, ForexDetails,
@@ -63,6 +64,7 @@ class TestIBClientInitialization:
         assert client.state == ConnectionState.DISCONNECTED
         assert client.last_error is None
         assert not client.is_connected
+        assert client.simulation_mode
         assert client._max_reconnect_attempts == 3
         assert client._reconnect_delay == 2.0
 
@@ -275,6 +277,442 @@ class TestIBClientSimulation:
             assert md.last > 0 or md.bid > 0
 
 
+class TestBatchedMarketData:
+    """Test concurrent snapshot fetching against a mocked IB connection"""
+
+    @pytest.fixture
+    def positions(self):
+        return [
+            Position(symbol=f"SYM{i}", sec_type="STK", con_id=100 + i, position=10,
+                     avg_cost=50.0, market_price=51.0, market_value=510.0)
+            for i in range(5)
+        ]
+
+    @staticmethod
+    def make_ticker(price=None):
+        nan = float("nan")
+        ticker = Mock()
+        ticker.bid = price - 0.05 if price else nan
+        ticker.ask = price + 0.05 if price else nan
+        ticker.last = price if price else nan
+        ticker.close = nan
+        ticker.high = nan
+        ticker.low = nan
+        ticker.volume = nan
+        ticker.modelGreeks = None
+        return ticker
+
+    @pytest.fixture
+    def client(self):
+        client = IBClient(simulation_mode=True)
+        client._simulation_mode = False
+        client._ib = MagicMock()
+        client._ib.isConnected.return_value = True
+
+        def qualify(*contracts):
+            for i, contract in enumerate(contracts):
+                contract.conId = 1000 + i
+            return list(contracts)
+
+        client._ib.qualifyContracts.side_effect = qualify
+        return client
+
+    def test_qualifies_all_contracts_in_one_call(self, client, positions):
+        """Test all contracts are qualified together and tickers converted"""
+        client._ib.reqMktData.side_effect = lambda contract, snapshot: self.make_ticker(50.0)
+
+        market_data = client.get_market_data(positions, timeout=1)
+
+        assert client._ib.qualifyContracts.call_count == 1
+        assert len(client._ib.qualifyContracts.call_args.args) == 5
+        assert client._ib.reqMktData.call_count == 5
+        assert set(market_data) == {p.con_id for p in positions}
+        assert market_data[100].mid == pytest.approx(50.0)
+        assert market_data[100].volume == 0  # NaN volume is tolerated
+        assert client._market_data_cache == market_data
+
+    def test_respects_concurrent_line_limit(self, client, positions):
+        """Test no more than max_concurrent_lines requests are open at once"""
+        open_lines = []
+        peak = []
+
+        def req(contract, snapshot):
+            open_lines.append(contract)
+            peak.append(len(open_lines))
+            return self.make_ticker(50.0)
+
+        client._ib.reqMktData.side_effect = req
+        client._ib.cancelMktData.side_effect = lambda contract: open_lines.remove(contract)
+
+        market_data = client.get_market_data(positions, timeout=1, max_concurrent_lines=2)
+
+        assert len(market_data) == 5
+        assert max(peak) == 2
+
+    def test_global_deadline(self, client, positions):
+        """Test unfilled tickers stop waiting at the deadline instead of per position"""
+        import time as time_module
+
+        client._ib.reqMktData.side_effect = lambda contract, snapshot: self.make_ticker()
+        client._ib.sleep.side_effect = time_module.sleep
+
+        start = time_module.monotonic()
+        market_data = client.get_market_data(positions, timeout=0.3)
+        elapsed = time_module.monotonic() - start
+
+        assert elapsed < 1.0
+        assert market_data == {}
+        assert client._market_data_cache == {}
+
+    def test_slow_ticker_does_not_hold_back_queue(self, client, positions):
+        """Test a ticker that never fills only uses its own share of the timeout"""
+        import time as time_module
+
+        def req(contract, snapshot):
+            return self.make_ticker() if contract.symbol == "SYM0" else self.make_ticker(50.0)
+
+        client._ib.reqMktData.side_effect = req
+        client._ib.sleep.side_effect = time_module.sleep
+
+        start = time_module.monotonic()
+        market_data = client.get_market_data(positions, timeout=2, max_concurrent_lines=2)
+        elapsed = time_module.monotonic() - start
+
+        # 5 requests over 2 lines take 3 rounds, so SYM0 gets a third of the timeout
+        assert elapsed < 1.5
+        assert set(market_data) == {101, 102, 103, 104}
+        assert client._ib.cancelMktData.call_count == 5
+
+    def test_option_without_greeks_kept(self, client):
+        """Test a priced option without modelGreeks is stored with IV unset"""
+        option = Position(symbol="AAPL", sec_type="OPT", con_id=300, position=1,
+                          avg_cost=5.0, option_details=OptionDetails(
+                              strike=180.0, right="C", expiry=date(2030, 1, 18)))
+        client._ib.reqMktData.side_effect = lambda contract, snapshot: self.make_ticker(5.0)
+
+        market_data = client.get_market_data([option], timeout=0.1)
+
+        assert market_data[300].mid == pytest.approx(5.0)
+        assert market_data[300].implied_volatility is None
+
+    def test_failure_keeps_streamed_and_partial(self, client, positions):
+        """Test a failure part way returns what already arrived"""
+        client._subscriptions[100] = (positions[0], Mock(), Mock())
+        client._market_data_cache[100] = MarketData(symbol="SYM0", con_id=100, last=42.0)
+
+        calls = []
+
+        def req(contract, snapshot):
+            calls.append(contract)
+            if len(calls) == 2:
+                raise RuntimeError("connection dropped")
+            return self.make_ticker(50.0)
+
+        client._ib.reqMktData.side_effect = req
+        client._ib.sleep.side_effect = RuntimeError("connection dropped")
+
+        market_data = client.get_market_data(positions, timeout=1, max_concurrent_lines=2)
+
+        assert market_data[100].last == 42.0
+        assert market_data[101].mid == pytest.approx(50.0)
+        assert 101 in client._market_data_cache
+
+    def test_unqualified_contracts_skipped(self, client, positions):
+        """Test contracts that fail qualification are not requested"""
+        client._ib.qualifyContracts.side_effect = lambda *contracts: []
+
+        market_data = client.get_market_data(positions, timeout=0.1)
+
+        assert market_data == {}
+        client._ib.reqMktData.assert_not_called()
+
+    def test_sequential_mode_still_available(self, client, positions):
+        """Test batched=False keeps the one-at-a-time behaviour"""
+        client._ib.reqMktData.side_effect = lambda contract, snapshot: self.make_ticker(50.0)
+
+        market_data = client.get_market_data(positions, timeout=1, batched=False)
+
+        assert client._ib.qualifyContracts.call_count == 5
+        assert len(market_data) == 5
+
+
+class TestStreamingMarketData:
+    """Test streaming subscriptions and the live ticker cache"""
+
+    @pytest.fixture
+    def positions(self):
+        return [
+            Position(symbol=f"SYM{i}", sec_type="STK", con_id=100 + i, position=10,
+                     avg_cost=50.0, market_price=51.0, market_value=510.0)
+            for i in range(3)
+        ]
+
+    @pytest.fixture
+    def client(self):
+        client = IBClient(simulation_mode=True)
+        client._simulation_mode = False
+        client._ib = MagicMock()
+        client._ib.isConnected.return_value = True
+
+        con_ids = iter(range(1000, 2000))
+
+        def qualify(*contracts):
+            for contract in contracts:
+                contract.conId = next(con_ids)
+            return list(contracts)
+
+        def req(contract, snapshot):
+            ticker = TestBatchedMarketData.make_ticker()
+            ticker.contract = contract
+            return ticker
+
+        client._ib.qualifyContracts.side_effect = qualify
+        client._ib.reqMktData.side_effect = req
+        return client
+
+    @staticmethod
+    def tick(client, con_id, price):
+        """Simulate a pendingTickersEvent for a subscribed conId"""
+        _, contract, ticker = client._subscriptions[con_id]
+        updated = TestBatchedMarketData.make_ticker(price)
+        updated.contract = contract
+        client._on_pending_tickers([updated])
+
+    def test_subscribe_opens_streaming_lines(self, client, positions):
+        """Test one non-snapshot line per position and no cancellation"""
+        count = client.subscribe_market_data(positions)
+
+        assert count == 3
+        assert client.is_streaming
+        assert all(call.kwargs["snapshot"] is False
+                   for call in client._ib.reqMktData.call_args_list)
+        client._ib.cancelMktData.assert_not_called()
+
+    def test_ticker_updates_cache_and_version(self, client, positions):
+        """Test ticker events update the cache in place and bump versions"""
+        client.subscribe_market_data(positions)
+        assert client.market_data_version(100) == 0
+
+        self.tick(client, 100, 50.0)
+        self.tick(client, 100, 51.0)
+
+        assert client.market_data_version(100) == 2
+        assert client.market_data_version(101) == 0
+        assert client.get_cached_market_data(100).mid == pytest.approx(51.0)
+
+    def test_updates_since_versions(self, client, positions):
+        """Test only quotes newer than the given versions are returned"""
+        client.subscribe_market_data(positions)
+        self.tick(client, 100, 50.0)
+        self.tick(client, 101, 60.0)
+        seen = {100: client.market_data_version(100), 101: client.market_data_version(101)}
+
+        self.tick(client, 101, 61.0)
+
+        assert set(client.get_market_data_updates(seen)) == {101}
+
+    def test_get_market_data_served_from_stream(self, client, positions):
+        """Test fully streamed positions skip the snapshot round-trip"""
+        client.subscribe_market_data(positions)
+        for pos in positions:
+            self.tick(client, pos.con_id, 50.0)
+        client._ib.reqMktData.reset_mock()
+
+        market_data = client.get_market_data(positions)
+
+        client._ib.reqMktData.assert_not_called()
+        assert set(market_data) == {p.con_id for p in positions}
+
+    def test_pending_updates_processed_before_read(self, client, positions):
+        """Test queued ticker events are dispatched before the cache is read"""
+        client.subscribe_market_data(positions)
+        for pos in positions:
+            self.tick(client, pos.con_id, 50.0)
+        client._ib.sleep.side_effect = lambda seconds: self.tick(client, 100, 55.0)
+
+        market_data = client.get_market_data(positions)
+
+        client._ib.sleep.assert_called_once_with(0)
+        assert market_data[100].mid == pytest.approx(55.0)
+
+    def test_mixed_streamed_and_unstreamed_positions(self, client, positions):
+        """Test only unstreamed positions get snapshots and the stream survives"""
+        client.subscribe_market_data(positions[:2])
+        for pos in positions[:2]:
+            self.tick(client, pos.con_id, 50.0)
+        other = Position(symbol="OTHER", sec_type="STK", con_id=200, position=5,
+                         avg_cost=20.0, market_price=21.0, market_value=105.0)
+        client._ib.reqMktData.reset_mock()
+        client._ib.qualifyContracts.reset_mock()
+        client._ib.reqMktData.side_effect = (
+            lambda contract, snapshot: TestBatchedMarketData.make_ticker(70.0)
+        )
+
+        market_data = client.get_market_data(positions[:2] + [other], timeout=1)
+
+        snapshot_calls = client._ib.reqMktData.call_args_list
+        assert [call.kwargs["snapshot"] for call in snapshot_calls] == [True]
+        assert [c.symbol for c in client._ib.qualifyContracts.call_args.args] == ["OTHER"]
+        client._ib.cancelMktData.assert_called_once()
+        assert set(client._subscriptions) == {100, 101}
+        assert set(market_data) == {100, 101, 200}
+        assert market_data[100].mid == pytest.approx(50.0)
+        assert market_data[200].mid == pytest.approx(70.0)
+        assert client.get_cached_market_data(100).mid == pytest.approx(50.0)
+        assert client.get_cached_market_data(200).mid == pytest.approx(70.0)
+
+        self.tick(client, 100, 52.0)
+        assert client.get_cached_market_data(100).mid == pytest.approx(52.0)
+
+    def test_resubscribe_cancels_removed_positions(self, client, positions):
+        """Test a new position set cancels stale lines and keeps existing ones"""
+        client.subscribe_market_data(positions)
+        client._ib.reqMktData.reset_mock()
+
+        client.subscribe_market_data(positions[1:])
+
+        assert client._ib.cancelMktData.call_count == 1
+        client._ib.reqMktData.assert_not_called()
+        assert set(client._subscriptions) == {101, 102}
+
+    def test_disconnect_cancels_all(self, client, positions):
+        """Test disconnect closes every streaming line"""
+        client.subscribe_market_data(positions)
+
+        client.disconnect()
+
+        assert not client.is_streaming
+        assert client._ib.cancelMktData.call_count == 3
+
+    def test_simulation_mode_seeds_cache(self):
+        """Test simulation mode subscriptions populate the cache"""
+        client = IBClient(simulation_mode=True)
+        client.connect()
+        positions = client.get_positions()
+
+        client.subscribe_market_data(positions)
+
+        assert all(client.market_data_version(p.con_id) == 1 for p in positions)
+        assert client.get_market_data(positions) == {
+            p.con_id: client.get_cached_market_data(p.con_id) for p in positions
+        }
+
+
+class TestAsyncIBClient:
+    """Test the asyncio client in simulation mode and against a mocked IB connection"""
+
+    @pytest.fixture
+    def positions(self):
+        return [
+            Position(symbol=f"SYM{i}", sec_type="STK", con_id=100 + i, position=10,
+                     avg_cost=50.0, market_price=51.0, market_value=510.0)
+            for i in range(3)
+        ]
+
+    @pytest.fixture
+    def client(self):
+        client = AsyncIBClient(simulation_mode=True)
+        client._simulation_mode = False
+        client._state = ConnectionState.CONNECTED
+        client._ib = MagicMock()
+        client._ib.isConnected.return_value = True
+
+        async def qualify(*contracts):
+            for i, contract in enumerate(contracts):
+                contract.conId = 1000 + i
+            return list(contracts)
+
+        client._ib.qualifyContractsAsync = AsyncMock(side_effect=qualify)
+        client._ib.reqMktData.side_effect = (
+            lambda contract, snapshot: TestBatchedMarketData.make_ticker(50.0)
+        )
+        return client
+
+    @pytest.mark.asyncio
+    async def test_simulation_mode(self):
+        """Test async connect and fetches in simulation mode"""
+        async with AsyncIBClient(simulation_mode=True) as client:
+            assert await client.connect_async()
+            assert await client.check_connection_async()
+
+            positions, account, market_data = await client.fetch_portfolio_async()
+
+            assert len(positions) > 0
+            assert account is not None
+            assert set(market_data) == {p.con_id for p in positions}
+
+        assert client.state == ConnectionState.DISCONNECTED
+
+    def test_keeps_sync_client_contract(self):
+        """Test the inherited IBClient methods stay blocking"""
+        with AsyncIBClient(simulation_mode=True) as client:
+            assert isinstance(client, IBClient)
+            assert client.connect() is True
+            assert client.ensure_connected() is True
+            assert len(client.get_positions()) > 0
+            assert client.get_account_summary() is not None
+
+        assert client.state == ConnectionState.DISCONNECTED
+
+    @pytest.mark.asyncio
+    async def test_market_data_uses_async_qualification(self, client, positions):
+        """Test contracts are qualified with one awaited call"""
+        market_data = await client.get_market_data_async(positions, timeout=1)
+
+        client._ib.qualifyContractsAsync.assert_awaited_once()
+        client._ib.qualifyContracts.assert_not_called()
+        assert set(market_data) == {p.con_id for p in positions}
+        assert market_data[100].mid == pytest.approx(50.0)
+
+    @pytest.mark.asyncio
+    async def test_positions_filtered_by_account(self, client):
+        """Test reqPositionsAsync results are filtered to the connected account"""
+        def ib_position(account, con_id):
+            contract = Mock(symbol="AAPL", secType="STK", conId=con_id, exchange="SMART",
+                            currency="USD", localSymbol="AAPL", multiplier="")
+            return Mock(account=account, contract=contract, position=10, avgCost=150.0)
+
+        client._account_id = "DU1"
+        client._ib.reqPositionsAsync = AsyncMock(
+            return_value=[ib_position("DU1", 1), ib_position("DU2", 2)]
+        )
+
+        positions = await client.get_positions_async()
+
+        assert [p.con_id for p in positions] == [1]
+        assert client._positions_cache == positions
+
+    @pytest.mark.asyncio
+    async def test_fetches_run_concurrently(self, client):
+        """Test positions and account summary requests overlap"""
+        import asyncio
+
+        in_flight = []
+        peak = []
+
+        async def slow(result):
+            in_flight.append(1)
+            peak.append(len(in_flight))
+            await asyncio.sleep(0.05)
+            in_flight.pop()
+            return result
+
+        client._ib.reqPositionsAsync = lambda: slow([])
+        client._ib.accountSummaryAsync = lambda account: slow([])
+
+        await client.fetch_portfolio_async(timeout=0.1)
+
+        assert max(peak) == 2
+
+    @pytest.mark.asyncio
+    async def test_reconnect_gives_up_after_max_attempts(self):
+        """Test async reconnect stops once attempts are exhausted"""
+        client = AsyncIBClient(simulation_mode=True)
+        client._reconnect_attempts = client._max_reconnect_attempts
+
+        assert await client.reconnect_async() is False
+
+
 class TestPositionConversion:
     """Test IB position conversion"""
 
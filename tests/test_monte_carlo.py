@@ -8,7 +8,15 @@ from datetime import date, timedelta
 
 from src.monte_carlo.simulator import MonteCarloSimulator
 from src.monte_carlo.models import SimulationConfig, SimulationResult, PercentileResults
-from src.ib_client.models import Position, OptionDetails
+from src.monte_carlo.online_stats import RunningMoments, QuantileSketch, max_drawdowns
+from src.monte_carlo.samplers import brownian_bridge, normal_blocks, standard_normals
+from src.monte_carlo.variance_reduction import control_variate_weights, WeightedSample
+from src.monte_carlo.validation import validate_float32, PrecisionError
+from src.monte_carlo.storage import column_percentiles, partition_percentiles, row_blocks
+from src.monte_carlo.repricing import OptionPriceSurface
+from src.monte_carlo import kernels
+from src.greeks.black_scholes import BlackScholesModel
+from src.ib_client.models import Position, OptionDetails, MarketData
 
 
 class TestSimulationConfig:
@@ -51,6 +59,15 @@ class TestPercentileResults:
         assert 95 < percentiles.p50 < 105  # median around mean
         assert 115 < percentiles.p95 < 125  # ~1.645 std above mean
 
+    def test_partition_percentiles_match_numpy(self):
+        """Test the single-partition percentiles equal np.percentile"""
+        values = np.random.default_rng(1).lognormal(size=9999)
+        levels = [0, 1, 5, 10, 25, 50, 75, 90, 95, 99, 100]
+
+        np.testing.assert_allclose(
+            partition_percentiles(values, levels), np.percentile(values, levels), rtol=1e-12
+        )
+
     def test_to_dict(self):
         """Test converting to dictionary"""
         percentiles = PercentileResults(
@@ -174,6 +191,23 @@ class TestMonteCarloSimulator:
         assert result["AAPL"].shape == (1000, 31)
         assert result["MSFT"].shape == (1000, 31)
 
+    def test_correlated_prices_match_full_tensor(self, simulator):
+        """Test block-wise generation equals the full correlated-normal tensor formula"""
+        prices = {"AAPL": 150.0, "MSFT": 350.0, "NVDA": 120.0}
+        volatilities = {"AAPL": 0.25, "MSFT": 0.30, "NVDA": 0.5}
+        correlation_matrix = np.array([[1.0, 0.7, 0.5], [0.7, 1.0, 0.6], [0.5, 0.6, 1.0]])
+
+        result = simulator.simulate_correlated_prices(prices, volatilities, correlation_matrix)
+
+        z = np.random.default_rng(42).standard_normal((1000, 30, 3))
+        z = np.einsum('ijk,lk->ijl', z, np.linalg.cholesky(correlation_matrix))
+        for i, symbol in enumerate(prices):
+            vol = volatilities[symbol]
+            log_returns = (0.05 - 0.5 * vol ** 2) / 252 + vol * np.sqrt(1 / 252) * z[:, :, i]
+            expected = prices[symbol] * np.exp(np.cumsum(log_returns, axis=1))
+            np.testing.assert_allclose(result[symbol][:, 1:], expected, rtol=1e-12)
+            assert np.all(result[symbol][:, 0] == prices[symbol])
+
     def test_portfolio_simulation_result(self, simulator, sample_positions):
         """Test portfolio simulation returns complete result"""
         result = simulator.simulate_portfolio(sample_positions)
@@ -244,6 +278,32 @@ class TestMonteCarloSimulator:
         # Path 2: OTM, value = 0
         assert option_values[1, -1] == 0
 
+    def test_option_values_match_scalar_pricing(self, simulator):
+        """Test vectorized option revaluation equals per-path scalar pricing"""
+        paths = simulator.simulate_price_paths(current_price=100, volatility=0.3)[:50, :8]
+
+        for is_call in (True, False):
+            option_values = simulator.calculate_option_values(
+                price_paths=paths,
+                strike=102,
+                is_call=is_call,
+                initial_dte=5,
+                volatility=0.3,
+                position_size=-2,
+                multiplier=100
+            )
+
+            price_func = simulator.bs_model.call_price if is_call else simulator.bs_model.put_price
+            expected = np.array([
+                [
+                    price_func(spot, 102, max(0, 5 - day) / 365.0, simulator.config.risk_free_rate, 0.3)
+                    for day, spot in enumerate(path)
+                ]
+                for path in paths
+            ]) * -2 * 100
+
+            np.testing.assert_allclose(option_values, expected, rtol=1e-10, atol=1e-8)
+
     def test_summary_dict(self, simulator, sample_positions):
         """Test result summary dictionary"""
         result = simulator.simulate_portfolio(sample_positions)
@@ -256,6 +316,603 @@ class TestMonteCarloSimulator:
         assert "prob_loss_pct" in summary
 
 
+    def test_result_holds_arrays_without_copies(self, simulator, sample_positions):
+        """Test path data is stored as ndarrays and accessors return them directly"""
+        result = simulator.simulate_portfolio(sample_positions)
+
+        assert isinstance(result.portfolio_value_paths, np.ndarray)
+        assert result.portfolio_value_paths.shape == (1000, 31)
+        assert result.get_portfolio_paths_array() is result.portfolio_value_paths
+        assert result.get_final_values_array() is result.final_values
+        for symbol, paths in result.price_paths_by_symbol.items():
+            assert result.get_price_paths_array(symbol) is paths
+
+    def test_result_json_round_trip(self, simulator, sample_positions):
+        """Test arrays serialize to JSON lists and validate back into arrays"""
+        result = simulator.simulate_portfolio(sample_positions)
+
+        dumped = result.model_dump(mode="json")
+        assert isinstance(dumped["final_values"], list)
+        assert isinstance(dumped["price_paths_by_symbol"]["AAPL"], list)
+
+        restored = SimulationResult.model_validate_json(result.model_dump_json())
+        np.testing.assert_array_equal(restored.final_values, result.final_values)
+        np.testing.assert_array_equal(
+            restored.get_price_paths_array("AAPL"), result.get_price_paths_array("AAPL")
+        )
+
+
+class TestPathStorage:
+    """Test memory-mapped path storage and block-wise statistics"""
+
+    @pytest.fixture
+    def sample_positions(self):
+        return [
+            Position(symbol="AAPL", sec_type="STK", con_id=1, position=100,
+                     avg_cost=150.0, market_price=155.0, market_value=15500.0),
+            Position(
+                symbol="AAPL", sec_type="OPT", con_id=2, position=-2,
+                avg_cost=5.0, market_price=4.0, market_value=-800.0,
+                option_details=OptionDetails(
+                    strike=160.0, right="C",
+                    expiry=date.today() + timedelta(days=45), multiplier=100
+                )
+            ),
+        ]
+
+    def test_memmap_matches_in_memory(self, tmp_path, sample_positions):
+        """Test memory-mapped runs give the same results as in-memory runs"""
+        in_memory = MonteCarloSimulator(num_paths=1000, num_days=20, random_seed=7)
+        mapped = MonteCarloSimulator(
+            num_paths=1000, num_days=20, random_seed=7, storage_dir=str(tmp_path)
+        )
+
+        expected = in_memory.simulate_portfolio(sample_positions)
+        result = mapped.simulate_portfolio(sample_positions)
+
+        assert isinstance(result.portfolio_value_paths, np.memmap)
+        assert (tmp_path / "portfolio_value_paths.npy").exists()
+        np.testing.assert_allclose(result.portfolio_value_paths, expected.portfolio_value_paths)
+        assert result.statistics.var_95 == pytest.approx(expected.statistics.var_95)
+        assert result.statistics.sharpe_ratio == pytest.approx(expected.statistics.sharpe_ratio)
+
+    def test_save_and_load(self, tmp_path, sample_positions):
+        """Test a saved result reopens as memory-mapped arrays"""
+        simulator = MonteCarloSimulator(
+            num_paths=500, num_days=10, random_seed=3, storage_dir=str(tmp_path)
+        )
+        result = simulator.simulate_portfolio(sample_positions)
+        result.save(tmp_path)
+
+        loaded = SimulationResult.load(tmp_path)
+
+        assert isinstance(loaded.get_price_paths_array("AAPL"), np.memmap)
+        np.testing.assert_array_equal(loaded.final_values, result.final_values)
+        np.testing.assert_array_equal(
+            loaded.get_price_paths_array("AAPL"), result.get_price_paths_array("AAPL")
+        )
+        assert loaded.summary() == result.summary()
+
+    def test_column_percentiles_blockwise(self):
+        """Test block-wise percentiles match a single np.percentile call"""
+        paths = np.random.default_rng(0).normal(size=(300, 17))
+
+        result = column_percentiles(paths, [5, 50, 95], block_elements=100)
+
+        np.testing.assert_allclose(result, np.percentile(paths, [5, 50, 95], axis=0))
+
+    def test_running_moments_merge(self):
+        """Test moments accumulated over blocks match whole-array values"""
+        values = np.random.default_rng(1).normal(3.0, 2.0, size=(1000, 13))
+        moments = RunningMoments()
+
+        for rows in row_blocks(*values.shape, block_elements=50):
+            moments.update(values[rows])
+
+        assert moments.count == values.size
+        assert moments.mean == pytest.approx(values.mean())
+        assert moments.std == pytest.approx(values.std())
+        assert moments.min == values.min()
+
+
+class TestChunkedSimulation:
+    """Test chunked simulation with online statistics"""
+
+    @pytest.fixture
+    def sample_positions(self):
+        return [
+            Position(symbol="SPY", sec_type="STK", con_id=1, position=50,
+                     avg_cost=450.0, market_price=470.0, market_value=23500.0),
+            Position(
+                symbol="SPY", sec_type="OPT", con_id=2, position=3,
+                avg_cost=6.0, market_price=5.0, market_value=1500.0,
+                option_details=OptionDetails(
+                    strike=450.0, right="P",
+                    expiry=date.today() + timedelta(days=40), multiplier=100
+                )
+            ),
+        ]
+
+    def test_chunked_matches_full_run(self, sample_positions):
+        """Test chunks consume the same random stream and reproduce the full-run statistics"""
+        full = MonteCarloSimulator(num_paths=20000, num_days=20, random_seed=11)
+        chunked = MonteCarloSimulator(num_paths=20000, num_days=20, random_seed=11, chunk_size=5000)
+
+        expected = full.simulate_portfolio(sample_positions).statistics
+        result = chunked.simulate_portfolio(sample_positions)
+        stats = result.statistics
+
+        assert stats.mean == pytest.approx(expected.mean, rel=1e-12)
+        assert stats.std == pytest.approx(expected.std, rel=1e-9)
+        assert stats.max_drawdown == pytest.approx(expected.max_drawdown, rel=1e-12)
+        assert stats.probability_loss == expected.probability_loss
+        assert stats.sharpe_ratio == pytest.approx(expected.sharpe_ratio, rel=1e-9)
+        assert stats.skewness == pytest.approx(expected.skewness, rel=1e-6)
+        assert stats.kurtosis == pytest.approx(expected.kurtosis, rel=1e-6)
+        # Quantiles come from the merged sketch rather than the pooled sample
+        assert stats.var_95 == pytest.approx(expected.var_95, rel=1e-2)
+        assert stats.cvar_99 == pytest.approx(expected.cvar_99, rel=1e-2)
+
+    def test_chunked_result_has_no_paths(self, sample_positions):
+        """Test chunks are discarded and daily series are still produced"""
+        simulator = MonteCarloSimulator(num_paths=5000, num_days=15, random_seed=2, chunk_size=1000)
+
+        result = simulator.simulate_portfolio(sample_positions)
+
+        assert result.portfolio_value_paths.size == 0
+        assert result.final_values.size == 0
+        assert len(result.daily_mean) == 16
+        assert len(result.daily_var_95) == 16
+        assert result.percentiles.p5 < result.percentiles.p50 < result.percentiles.p95
+
+    def test_quantile_sketch_merge(self):
+        """Test merged block sketches track exact quantiles"""
+        values = np.random.default_rng(4).standard_t(df=4, size=50000)
+        sketch = QuantileSketch()
+
+        for block in np.array_split(values, 10):
+            sketch.update(block)
+
+        assert sketch.quantile(0.0) == values.min()
+        assert sketch.quantile(1.0) == values.max()
+        np.testing.assert_allclose(
+            sketch.quantile([0.01, 0.05, 0.25, 0.75, 0.99]),
+            np.quantile(values, [0.01, 0.05, 0.25, 0.75, 0.99]),
+            rtol=1e-2
+        )
+        tail = np.sort(values)[:2500].mean()
+        assert sketch.tail_mean(0.05) == pytest.approx(tail, rel=1e-2)
+
+    def test_max_drawdowns(self):
+        """Test the 2-D drawdown kernel against a per-path loop"""
+        paths = np.random.default_rng(6).lognormal(sigma=0.1, size=(200, 30)).cumprod(axis=1)
+
+        expected = [
+            np.max((np.maximum.accumulate(path) - path) / np.maximum.accumulate(path))
+            for path in paths
+        ]
+
+        np.testing.assert_allclose(max_drawdowns(paths), expected, rtol=1e-12, atol=1e-15)
+
+    def test_running_moments_higher_moments(self):
+        """Test merged skewness and kurtosis match scipy"""
+        from scipy import stats as scipy_stats
+
+        values = np.random.default_rng(5).gamma(2.0, size=10000)
+        moments = RunningMoments(higher_moments=True)
+        for block in np.array_split(values, 7):
+            moments.update(block)
+
+        assert moments.skewness == pytest.approx(scipy_stats.skew(values), rel=1e-9)
+        assert moments.kurtosis == pytest.approx(scipy_stats.kurtosis(values), rel=1e-9)
+
+
+class TestParallelSimulation:
+    """Test multi-process simulation with spawned random streams"""
+
+    @pytest.fixture
+    def sample_positions(self):
+        return [
+            Position(symbol="QQQ", sec_type="STK", con_id=1, position=40,
+                     avg_cost=380.0, market_price=400.0, market_value=16000.0),
+            Position(
+                symbol="QQQ", sec_type="OPT", con_id=2, position=-2,
+                avg_cost=7.0, market_price=6.0, market_value=-1200.0,
+                option_details=OptionDetails(
+                    strike=420.0, right="C",
+                    expiry=date.today() + timedelta(days=30), multiplier=100
+                )
+            ),
+        ]
+
+    @pytest.fixture(autouse=True)
+    def small_runs_in_parallel(self, monkeypatch):
+        monkeypatch.setattr(MonteCarloSimulator, "PARALLEL_MIN_PATHS", 1000)
+
+    def test_parallel_is_reproducible(self, sample_positions):
+        """Test a fixed seed gives identical results for any worker count"""
+        def run(workers):
+            simulator = MonteCarloSimulator(
+                num_paths=6000, num_days=10, random_seed=3, parallel_workers=workers,
+                chunk_size=1000
+            )
+            return simulator.simulate_portfolio(sample_positions)
+
+        a = run(2)
+        b = run(3)
+
+        assert a.statistics == b.statistics
+        assert a.daily_var_95 == b.daily_var_95
+        assert a.portfolio_value_paths.size == 0
+
+    def test_single_core_matches_pool(self, monkeypatch, sample_positions):
+        """Test parallel_workers=-1 on a one-core machine runs the same blocks in-process"""
+        pooled = MonteCarloSimulator(
+            num_paths=6000, num_days=10, random_seed=3, parallel_workers=2
+        ).simulate_portfolio(sample_positions)
+
+        monkeypatch.setattr("os.cpu_count", lambda: 1)
+        simulator = MonteCarloSimulator(
+            num_paths=6000, num_days=10, random_seed=3, parallel_workers=-1
+        )
+        monkeypatch.setattr(simulator, "_process_pool", lambda workers: pytest.fail("pool started"))
+
+        assert simulator.simulate_portfolio(sample_positions).statistics == pooled.statistics
+
+    def test_repeated_parallel_runs_draw_fresh_streams(self, sample_positions):
+        """Test a second run on the same simulator spawns new worker streams"""
+        simulator = MonteCarloSimulator(
+            num_paths=6000, num_days=10, random_seed=3, parallel_workers=2
+        )
+
+        first = simulator.simulate_portfolio(sample_positions).statistics
+        second = simulator.simulate_portfolio(sample_positions).statistics
+
+        assert first.mean != second.mean
+
+    def test_from_config_rebuilds_simulator(self):
+        """Test a simulator rebuilt from config and seed draws the same paths"""
+        simulator = MonteCarloSimulator(
+            num_paths=200, num_days=5, random_seed=4, sampler="sobol", repricing="surface"
+        )
+        rebuilt = MonteCarloSimulator.from_config(simulator.config, np.random.SeedSequence(4))
+
+        assert rebuilt.config is simulator.config
+        np.testing.assert_array_equal(
+            rebuilt.simulate_price_paths(100.0, 0.3), simulator.simulate_price_paths(100.0, 0.3)
+        )
+
+    def test_parallel_matches_sequential(self, sample_positions):
+        """Test merged worker statistics agree with a single-process run"""
+        sequential = MonteCarloSimulator(num_paths=20000, num_days=10, random_seed=8)
+        parallel = MonteCarloSimulator(
+            num_paths=20000, num_days=10, random_seed=8, parallel_workers=3, chunk_size=2500
+        )
+
+        expected = sequential.simulate_portfolio(sample_positions).statistics
+        stats = parallel.simulate_portfolio(sample_positions).statistics
+
+        assert stats.mean == pytest.approx(expected.mean, rel=1e-3)
+        assert stats.std == pytest.approx(expected.std, rel=3e-2)
+        assert stats.var_95 == pytest.approx(expected.var_95, rel=5e-2)
+
+    def test_small_runs_stay_in_process(self):
+        """Test runs below PARALLEL_MIN_PATHS do not start a pool"""
+        simulator = MonteCarloSimulator(num_paths=500, parallel_workers=-1)
+
+        assert simulator._resolve_workers() == 1
+
+
+class TestSobolSampler:
+    """Test quasi-random path generation"""
+
+    def test_brownian_bridge_increments(self):
+        """Test the bridge gives i.i.d. unit normals and is driven by the first column"""
+        z = np.random.default_rng(0).standard_normal((100000, 12))
+
+        increments = brownian_bridge(z)
+
+        np.testing.assert_allclose(increments.sum(axis=1), np.sqrt(12) * z[:, 0])
+        np.testing.assert_allclose(np.cov(increments, rowvar=False), np.eye(12), atol=0.02)
+
+    def test_sobol_normals_are_standard(self):
+        """Test Sobol draws have the right shape and near-exact moments"""
+        z = standard_normals(np.random.default_rng(1), 4096, 20, 3, sampler="sobol")
+
+        assert z.shape == (4096, 20, 3)
+        assert abs(z.mean()) < 0.01
+        assert z.std() == pytest.approx(1.0, abs=0.01)
+
+    def test_sobol_portfolio_simulation(self):
+        """Test the sobol sampler is reproducible and agrees with pseudo-random VaR"""
+        positions = [
+            Position(symbol="SPY", sec_type="STK", con_id=1, position=100,
+                     avg_cost=450.0, market_price=470.0, market_value=47000.0),
+            Position(symbol="TLT", sec_type="STK", con_id=2, position=200,
+                     avg_cost=95.0, market_price=90.0, market_value=18000.0),
+        ]
+
+        def run(sampler, seed):
+            simulator = MonteCarloSimulator(
+                num_paths=8192, num_days=20, random_seed=seed, sampler=sampler
+            )
+            return simulator.simulate_portfolio(positions).statistics
+
+        sobol = run("sobol", 5)
+
+        assert sobol == run("sobol", 5)
+        assert sobol.var_95 == pytest.approx(run("pseudo", 5).var_95, rel=0.1)
+
+    @pytest.mark.parametrize("sampler", ["pseudo", "sobol"])
+    def test_normal_blocks_continue_the_stream(self, sampler):
+        """Test row blocks concatenate to the same draws as one full draw"""
+        expected = standard_normals(np.random.default_rng(7), 1000, 8, 3, sampler=sampler)
+
+        blocks = normal_blocks(
+            np.random.default_rng(7), 1000, 8, 3, sampler=sampler, block_elements=2400
+        )
+        rows, arrays = zip(*blocks, strict=True)
+
+        assert len(rows) == 10
+        np.testing.assert_array_equal(np.concatenate(arrays), expected)
+
+    def test_unknown_sampler_rejected(self):
+        """Test the config only accepts known samplers"""
+        with pytest.raises(ValueError):
+            SimulationConfig(sampler="halton")
+
+
+class TestControlVariates:
+    """Test control-variate weights and weighted statistics"""
+
+    def test_weights_reproduce_control_expectations(self):
+        """Test weights sum to one and match the known control means exactly"""
+        rng = np.random.default_rng(2)
+        controls = np.column_stack([rng.normal(1.0, 0.2, 5000), rng.exponential(size=5000)])
+
+        weights = control_variate_weights(controls, np.array([1.0, 1.0]))
+
+        assert weights.sum() == pytest.approx(1.0)
+        np.testing.assert_allclose(weights @ controls, [1.0, 1.0])
+
+    def test_weighted_sample_equal_weights(self):
+        """Test equal weights give the ordinary quantile, tail mean and probabilities"""
+        values = np.random.default_rng(3).normal(size=1000)
+        sample = WeightedSample(values, np.full(1000, 1 / 1000))
+
+        assert sample.mean() == pytest.approx(values.mean())
+        assert sample.quantile(0.05) == np.sort(values)[49]
+        assert sample.tail_mean(0.05) == pytest.approx(np.sort(values)[:50].mean())
+        assert sample.probability_below(0.0) == pytest.approx(np.mean(values < 0))
+        assert sample.probability_above(0.0) == pytest.approx(np.mean(values > 0))
+
+    def test_linear_portfolio_mean_is_exact(self):
+        """Test a stock-only portfolio's mean equals its analytic expectation"""
+        positions = [
+            Position(symbol="SPY", sec_type="STK", con_id=1, position=100,
+                     avg_cost=450.0, market_price=470.0, market_value=47000.0),
+            Position(symbol="IWM", sec_type="STK", con_id=2, position=50,
+                     avg_cost=200.0, market_price=210.0, market_value=10500.0),
+        ]
+        simulator = MonteCarloSimulator(
+            num_paths=2000, num_days=20, random_seed=4, use_control_variate=True
+        )
+
+        result = simulator.simulate_portfolio(positions)
+
+        expected = 57500.0 * np.exp(0.05 * 20 / 252)
+        assert result.statistics.mean == pytest.approx(expected, rel=1e-9)
+        assert result.percentiles.p1 < result.percentiles.p5 < result.percentiles.p50
+        assert result.statistics.cvar_95 > result.statistics.var_95
+
+
+class TestImportanceSampling:
+    """Test importance-sampled tail estimates"""
+
+    @pytest.fixture
+    def stock_position(self):
+        return [Position(symbol="SPY", sec_type="STK", con_id=1, position=100,
+                         avg_cost=450.0, market_price=470.0, market_value=47000.0)]
+
+    def test_shift_points_toward_losses(self):
+        """Test a long book shifts down and a delta-neutral short-gamma book still shifts"""
+        move = np.array([[10.0]])
+
+        long_shift = MonteCarloSimulator._importance_shift(
+            move, np.array([100.0]), np.array([0.0]), 0.01
+        )
+        straddle_shift = MonteCarloSimulator._importance_shift(
+            move, np.array([0.0]), np.array([-5.0]), 0.01
+        )
+
+        assert long_shift[0] == pytest.approx(-2.326, abs=1e-3)
+        assert abs(straddle_shift[0]) == pytest.approx(2.326, abs=1e-3)
+
+    def test_tail_matches_analytic_var(self, stock_position):
+        """Test IS VaR/CVaR of a single stock match the lognormal closed form"""
+        from scipy.stats import norm
+
+        simulator = MonteCarloSimulator(
+            num_paths=4000, num_days=20, random_seed=9, importance_sampling=True
+        )
+        stats = simulator.simulate_portfolio(stock_position).statistics
+
+        horizon, vol = 20 / 252, 0.25
+        drift = (0.05 - 0.5 * vol ** 2) * horizon
+        for level, var in ((0.01, stats.var_99), (0.001, stats.var_999)):
+            quantile = 47000.0 * np.exp(drift + vol * np.sqrt(horizon) * norm.ppf(level))
+            assert var == pytest.approx(47000.0 - quantile, rel=2e-2)
+        assert stats.var_95 < stats.var_99 < stats.var_999 < stats.cvar_999
+
+    def test_tail_pass_is_chunked(self, stock_position):
+        """Test the tail pass gives the same estimate one chunk at a time"""
+        def tail(chunk_size):
+            simulator = MonteCarloSimulator(
+                num_paths=1000, num_days=10, random_seed=2, chunk_size=chunk_size
+            )
+            result = simulator.simulate_portfolio(stock_position)
+            simulator.rng = np.random.default_rng(5)
+            simulator._apply_importance_sampling(
+                result, {"SPY": stock_position}, {"SPY": 470.0}, {"SPY": 0.25}, None
+            )
+            return result.statistics
+
+        whole, chunked = tail(None), tail(128)
+
+        assert chunked.var_999 == whole.var_999
+        assert chunked.cvar_99 == whole.cvar_99
+
+    def test_statistics_default_without_tail_fields(self, stock_position):
+        """Test plain runs leave the 99.9% fields empty"""
+        simulator = MonteCarloSimulator(num_paths=1000, num_days=10, random_seed=1)
+
+        stats = simulator.simulate_portfolio(stock_position).statistics
+
+        assert stats.var_999 is None
+        assert stats.cvar_999 is None
+
+
+class TestFloat32Mode:
+    """Test reduced-precision simulation and its validation harness"""
+
+    @pytest.fixture
+    def sample_positions(self):
+        return [
+            Position(symbol="SPY", sec_type="STK", con_id=1, position=100,
+                     avg_cost=450.0, market_price=470.0, market_value=47000.0),
+            Position(
+                symbol="SPY", sec_type="OPT", con_id=2, position=2,
+                avg_cost=6.0, market_price=5.0, market_value=1000.0,
+                option_details=OptionDetails(
+                    strike=450.0, right="P",
+                    expiry=date.today() + timedelta(days=60), multiplier=100
+                )
+            ),
+        ]
+
+    def test_float32_paths_follow_float64_stream(self):
+        """Test float32 paths are the float64 paths to single precision"""
+        simulator64 = MonteCarloSimulator(num_paths=1000, num_days=30, random_seed=5)
+        simulator32 = MonteCarloSimulator(
+            num_paths=1000, num_days=30, random_seed=5, dtype="float32"
+        )
+
+        paths64 = simulator64.simulate_price_paths(100.0, 0.3)
+        paths32 = simulator32.simulate_price_paths(100.0, 0.3)
+
+        assert paths32.dtype == np.float32
+        np.testing.assert_allclose(paths32, paths64, rtol=1e-5)
+
+    def test_float32_portfolio_storage(self, sample_positions):
+        """Test price and portfolio paths are stored in float32"""
+        simulator = MonteCarloSimulator(num_paths=1000, num_days=10, random_seed=2, dtype="float32")
+
+        result = simulator.simulate_portfolio(sample_positions)
+
+        assert result.portfolio_value_paths.dtype == np.float32
+        assert result.get_price_paths_array("SPY").dtype == np.float32
+        assert result.final_values.dtype == np.float64
+
+    def test_validation_harness(self, sample_positions):
+        """Test the harness passes at the default tolerance and fails when too strict"""
+        report = validate_float32(sample_positions, num_paths=2000, num_days=20)
+
+        assert report.passed
+        assert set(report.relative_errors) == {"mean", "var_95", "var_99", "cvar_95", "cvar_99"}
+
+        with pytest.raises(PrecisionError):
+            validate_float32(sample_positions, tolerance=1e-15, num_paths=2000, num_days=20)
+
+
+class TestRepricingSurface:
+    """Test interpolated option repricing along paths"""
+
+    @pytest.fixture
+    def price_paths(self):
+        simulator = MonteCarloSimulator(num_paths=2000, num_days=30, random_seed=4)
+        return simulator.simulate_price_paths(100.0, 0.6)
+
+    @pytest.mark.parametrize("is_call,dte", [(True, 45), (False, 20), (True, 3)])
+    def test_surface_within_tolerance(self, price_paths, is_call, dte):
+        """Test interpolated prices match Black-Scholes within the checked bound"""
+        surface = OptionPriceSurface.build(
+            100.0, [105.0], [is_call], [dte], [1.0], 0.3, 0.05, 30, tolerance=1e-4
+        )
+
+        time_to_expiry = np.maximum(dte - np.arange(31), 0)[np.newaxis, :] / 365.0
+        exact = BlackScholesModel.batch_price(price_paths, 105.0, time_to_expiry, 0.05, 0.3, is_call)
+
+        assert surface.max_error <= 1e-4
+        np.testing.assert_allclose(surface.evaluate(price_paths), exact, atol=1e-4)
+
+    def test_spots_outside_grid_priced_exactly(self):
+        """Test spots beyond the grid fall back to exact pricing"""
+        surface = OptionPriceSurface.build(100.0, [100.0], [True], [60], [1.0], 0.2, 0.05, 10)
+        spots = np.array([np.full(11, 1.0), np.full(11, 1000.0)])
+
+        expected = BlackScholesModel.batch_price(
+            spots, 100.0, (60 - np.arange(11))[np.newaxis, :] / 365.0, 0.05, 0.2, True
+        )
+
+        assert spots.min() < surface.spot_low and spots.max() > surface.spot_high
+        np.testing.assert_allclose(surface.evaluate(spots), expected, rtol=1e-12)
+
+    def test_multi_leg_surface_matches_sum_of_legs(self, price_paths):
+        """Test one surface over several legs equals the position-weighted sum of exact values"""
+        strikes, is_call, dte = [90.0, 100.0, 110.0, 95.0], [True, True, False, False], [45, 10, 20, 5]
+        quantities = [300.0, -500.0, 200.0, -100.0]
+        surface = OptionPriceSurface.build(
+            100.0, strikes, is_call, dte, quantities, 0.3, 0.05, 30, tolerance=1e-4
+        )
+
+        expected = np.zeros_like(price_paths)
+        for strike, call, days, quantity in zip(strikes, is_call, dte, quantities, strict=True):
+            time_to_expiry = np.maximum(days - np.arange(31), 0)[np.newaxis, :] / 365.0
+            expected += quantity * BlackScholesModel.batch_price(
+                price_paths, strike, time_to_expiry, 0.05, 0.3, call
+            )
+
+        np.testing.assert_allclose(
+            surface.evaluate(price_paths), expected, atol=sum(map(abs, quantities)) * 1e-4
+        )
+
+    def test_surface_simulation_matches_exact(self):
+        """Test a surface run gives the exact run's statistics on the same draws"""
+        positions = [
+            Position(symbol="SPY", sec_type="STK", con_id=1, position=100,
+                     avg_cost=450.0, market_price=470.0, market_value=47000.0),
+            Position(symbol="SPY", sec_type="OPT", con_id=2, position=-3,
+                     avg_cost=6.0, market_price=5.0, market_value=-1500.0,
+                     option_details=OptionDetails(
+                         strike=480.0, right="C", expiry=date.today() + timedelta(days=20)
+                     )),
+        ]
+
+        exact = MonteCarloSimulator(num_paths=2000, num_days=30, random_seed=6)
+        surface = MonteCarloSimulator(num_paths=2000, num_days=30, random_seed=6, repricing="surface")
+        expected = exact.simulate_portfolio(positions)
+        result = surface.simulate_portfolio(positions)
+
+        # 3 contracts x 100 shares x 1e-3 per share
+        np.testing.assert_allclose(result.final_values, expected.final_values, atol=0.3)
+        assert result.statistics.var_95 == pytest.approx(expected.statistics.var_95, abs=0.3)
+        assert len(surface._surfaces) == 1
+
+    def test_surface_cache_is_bounded(self, monkeypatch):
+        """Test surfaces for changing spots are evicted least recently used first"""
+        monkeypatch.setattr(MonteCarloSimulator, "MAX_CACHED_SURFACES", 2)
+        simulator = MonteCarloSimulator(num_paths=100, num_days=5, repricing="surface")
+        legs = ((100.0, True, 30, 100.0),)
+
+        first = simulator._option_surface(100.0, legs, 0.3)
+        simulator._option_surface(101.0, legs, 0.3)
+        assert simulator._option_surface(100.0, legs, 0.3) is first
+        simulator._option_surface(102.0, legs, 0.3)
+
+        assert [key[0] for key in simulator._surfaces] == [100.0, 102.0]
+        assert simulator._option_surface(100.0, legs, 0.3) is first
+
+
 class TestStressTest:
     """Test stress testing functionality"""
 
@@ -315,3 +972,226 @@ class TestStressTest:
         assert crash_result.statistics is not None
         assert crash_result.statistics.mean > 0  # Portfolio value should be positive
         assert crash_result.initial_portfolio_value > 0
+
+    @pytest.fixture
+    def option_book(self):
+        positions = [
+            Position(symbol="SPY", sec_type="STK", con_id=1, position=100,
+                     avg_cost=450.0, market_price=460.0, market_value=46000.0),
+            Position(symbol="SPY", sec_type="OPT", con_id=2, position=-2,
+                     avg_cost=8.0, market_price=7.0, market_value=-1400.0,
+                     option_details=OptionDetails(
+                         strike=470.0, right="C", expiry=date.today() + timedelta(days=30)
+                     )),
+        ]
+        market_data = {
+            1: MarketData(symbol="SPY", con_id=1, bid=459.9, ask=460.1),
+            2: MarketData(symbol="SPY", con_id=2, bid=6.9, ask=7.1,
+                          underlying_price=460.0, implied_volatility=0.3),
+        }
+        return positions, market_data
+
+    def test_scenarios_share_random_numbers(self, simulator, sample_positions):
+        """Test a pure spot shock rescales the base paths exactly"""
+        market_data = {1: MarketData(symbol="SPY", con_id=1, bid=459.9, ask=460.1)}
+
+        results = simulator.stress_test(
+            sample_positions, market_data, scenarios={"base": {}, "crash": {"_all": -0.2}}
+        )
+
+        np.testing.assert_allclose(
+            results["crash"].final_values, 0.8 * results["base"].final_values, rtol=1e-12
+        )
+
+    def test_volatility_scenario_matches_direct_simulation(self, option_book):
+        """Test transformed paths equal simulating the shocked inputs on the same draws"""
+        positions, market_data = option_book
+        adjustments = {"_all": -0.1, "_vol_mult": 1.5}
+
+        stressed = MonteCarloSimulator(num_paths=500, num_days=10, random_seed=5).stress_test(
+            positions, market_data, scenarios={"spike": adjustments}
+        )["spike"]
+        # stress_test draws from the first child of the simulator's seed sequence
+        direct_simulator = MonteCarloSimulator.from_config(
+            SimulationConfig(num_paths=500, num_days=10, random_seed=5),
+            np.random.SeedSequence(5).spawn(1)[0]
+        )
+        direct = direct_simulator.simulate_portfolio(
+            positions, direct_simulator._apply_scenario(market_data, adjustments)
+        )
+
+        np.testing.assert_allclose(
+            stressed.price_paths_by_symbol["SPY"], direct.price_paths_by_symbol["SPY"], rtol=1e-10
+        )
+        assert stressed.statistics.var_95 == pytest.approx(direct.statistics.var_95, rel=1e-9)
+
+    def test_chunked_stress_test(self, option_book):
+        """Test chunked stress runs keep statistics only and share draws across scenarios"""
+        positions, market_data = option_book
+        scenarios = {"base": {}, "rally": {"_all": 0.1}}
+        chunked = MonteCarloSimulator(
+            num_paths=2000, num_days=10, random_seed=1, chunk_size=500
+        ).stress_test(positions, market_data, scenarios=scenarios)
+        full = MonteCarloSimulator(num_paths=2000, num_days=10, random_seed=1).stress_test(
+            positions, market_data, scenarios=scenarios
+        )
+
+        for name in scenarios:
+            assert chunked[name].portfolio_value_paths.size == 0
+            assert chunked[name].statistics.mean == pytest.approx(
+                full[name].statistics.mean, rel=1e-9
+            )
+
+    def test_parallel_stress_matches_serial(self, monkeypatch, option_book):
+        """Test splitting scenarios across processes gives the serial results"""
+        positions, market_data = option_book
+        monkeypatch.setattr(MonteCarloSimulator, "PARALLEL_MIN_PATHS", 1000)
+
+        serial = MonteCarloSimulator(num_paths=800, num_days=10, random_seed=9).stress_test(
+            positions, market_data
+        )
+        parallel = MonteCarloSimulator(
+            num_paths=800, num_days=10, random_seed=9, parallel_workers=2
+        ).stress_test(positions, market_data)
+
+        assert list(parallel) == list(serial)
+        for name, result in serial.items():
+            assert parallel[name].statistics == result.statistics
+
+    def test_repeated_stress_runs_advance_in_both_modes(self, monkeypatch, option_book):
+        """Test serial and parallel runs both draw fresh paths on every call, in step"""
+        positions, market_data = option_book
+        monkeypatch.setattr(MonteCarloSimulator, "PARALLEL_MIN_PATHS", 1000)
+        scenarios = {"crash": {"_all": -0.1}, "rally": {"_all": 0.1}}
+
+        serial = MonteCarloSimulator(num_paths=800, num_days=10, random_seed=9)
+        parallel = MonteCarloSimulator(num_paths=800, num_days=10, random_seed=9,
+                                       parallel_workers=2)
+        runs = [
+            (serial.stress_test(positions, market_data, scenarios),
+             parallel.stress_test(positions, market_data, scenarios))
+            for _ in range(2)
+        ]
+
+        for serial_run, parallel_run in runs:
+            assert parallel_run["crash"].statistics == serial_run["crash"].statistics
+        assert runs[0][0]["crash"].statistics.mean != runs[1][0]["crash"].statistics.mean
+
+
+requires_numba = pytest.mark.skipif(not kernels.NUMBA_AVAILABLE, reason="numba not installed")
+
+
+class TestPathKernels:
+    """Test NumPy / Numba path kernels and backend selection"""
+
+    @pytest.fixture
+    def sample_positions(self):
+        return [
+            Position(symbol="SPY", sec_type="STK", con_id=1, position=100,
+                     avg_cost=450.0, market_price=470.0, market_value=47000.0),
+            Position(symbol="SPY", sec_type="OPT", con_id=2, position=-3,
+                     avg_cost=6.0, market_price=5.0, market_value=-1500.0,
+                     option_details=OptionDetails(
+                         strike=480.0, right="C", expiry=date.today() + timedelta(days=20)
+                     )),
+            Position(symbol="QQQ", sec_type="OPT", con_id=3, position=2,
+                     avg_cost=4.0, market_price=4.0, market_value=800.0,
+                     option_details=OptionDetails(
+                         strike=380.0, right="P", expiry=date.today() + timedelta(days=8)
+                     )),
+        ]
+
+    @pytest.fixture
+    def draws(self):
+        return np.random.default_rng(11).standard_normal((500, 30))
+
+    def test_resolve_backend(self, monkeypatch):
+        """Test auto picks numba only when importable and numba falls back to NumPy"""
+        assert kernels.resolve_backend("numpy") == "numpy"
+        assert kernels.resolve_backend("auto") == ("numba" if kernels.NUMBA_AVAILABLE else "numpy")
+
+        monkeypatch.setattr(kernels, "NUMBA_AVAILABLE", False)
+        assert kernels.resolve_backend("auto") == "numpy"
+        assert kernels.resolve_backend("numba") == "numpy"
+
+        with pytest.raises(ValueError):
+            kernels.resolve_backend("cuda")
+
+    def test_numba_is_opt_in(self, monkeypatch):
+        """Test the default backend stays NumPy even when numba is importable"""
+        monkeypatch.setattr(kernels, "NUMBA_AVAILABLE", True)
+
+        assert SimulationConfig().backend == "numpy"
+        assert MonteCarloSimulator(num_paths=100).backend == "numpy"
+
+    def test_numpy_gbm_paths(self, draws):
+        """Test the NumPy GBM kernel against the closed-form cumulative sum"""
+        out = kernels.gbm_paths(draws, -0.0002, 0.02, 100.0, np.empty((500, 31)))
+
+        expected = 100.0 * np.exp(np.cumsum(-0.0002 + 0.02 * draws, axis=1))
+
+        assert np.all(out[:, 0] == 100.0)
+        np.testing.assert_allclose(out[:, 1:], expected, rtol=1e-14)
+
+    def test_numpy_option_prices(self, draws):
+        """Test the NumPy repricing kernel is batch_price on a time-to-expiry row"""
+        paths = kernels.gbm_paths(draws, 0.0, 0.02, 100.0, np.empty((500, 31)))
+        time_to_expiry = np.maximum(10 - np.arange(31), 0) / 365.0
+
+        np.testing.assert_array_equal(
+            kernels.option_prices(paths, 102.0, time_to_expiry, 0.05, 0.3, False),
+            BlackScholesModel.batch_price(paths, 102.0, time_to_expiry[np.newaxis, :], 0.05, 0.3, False)
+        )
+
+    @requires_numba
+    @pytest.mark.parametrize("dtype,rtol", [(np.float64, 1e-12), (np.float32, 1e-5)])
+    def test_gbm_paths_parity(self, draws, dtype, rtol):
+        """Test the JIT GBM kernel matches NumPy"""
+        z = draws.astype(dtype)
+        expected = kernels.gbm_paths(z, -0.0002, 0.02, 100.0, np.empty((500, 31), dtype=dtype))
+        result = kernels.gbm_paths(
+            z, -0.0002, 0.02, 100.0, np.empty((500, 31), dtype=dtype), backend="numba"
+        )
+
+        assert result.dtype == dtype
+        np.testing.assert_allclose(result, expected, rtol=rtol)
+
+    @requires_numba
+    @pytest.mark.parametrize("is_call", [True, False])
+    def test_option_prices_parity(self, draws, is_call):
+        """Test the JIT repricing kernel matches batch_price, including expired steps"""
+        paths = kernels.gbm_paths(draws, 0.0, 0.02, 100.0, np.empty((500, 31)))
+        time_to_expiry = np.maximum(20 - np.arange(31), 0) / 365.0
+
+        expected = kernels.option_prices(paths, 101.0, time_to_expiry, 0.05, 0.3, is_call)
+        result = kernels.option_prices(
+            paths, 101.0, time_to_expiry, 0.05, 0.3, is_call, backend="numba"
+        )
+
+        np.testing.assert_allclose(result, expected, rtol=1e-12, atol=1e-12)
+
+    @requires_numba
+    def test_max_drawdowns_parity(self, draws):
+        """Test the single-scan JIT drawdown kernel matches NumPy"""
+        paths = kernels.gbm_paths(draws, 0.0, 0.02, 100.0, np.empty((500, 31)))
+
+        np.testing.assert_allclose(
+            kernels.max_drawdowns(paths, backend="numba"), kernels.max_drawdowns(paths),
+            rtol=1e-14, atol=1e-15
+        )
+
+    @requires_numba
+    @pytest.mark.parametrize("chunk_size", [None, 700])
+    def test_simulation_parity(self, sample_positions, chunk_size):
+        """Test full and chunked simulations give the same statistics on both backends"""
+        results = {
+            backend: MonteCarloSimulator(
+                num_paths=2000, num_days=30, random_seed=8, chunk_size=chunk_size,
+                backend=backend
+            ).simulate_portfolio(sample_positions)
+            for backend in ("numpy", "numba")
+        }
+
+        expected, result = results["numpy"].statistics, results["numba"].statistics
+        for metric in ("mean", "std", "var_95", "cvar_99", "max_drawdown", "avg_drawdown"):
+            assert getattr(result, metric) == pytest.approx(getattr(expected, metric), rel=1e-10)
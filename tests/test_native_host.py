@@ -0,0 +1,338 @@
+"""
+Tests for the Native Messaging host
+"""
+
+import importlib.util
+from pathlib import Path
+from unittest.mock import Mock, patch
+
+import pytest
+
+from src.ib_client.models import MarketData, Position
+
+HOST_PATH = Path(__file__).parent.parent / "extension" / "native-host" / "ib_native_host.py"
+
+_spec = importlib.util.spec_from_file_location("ib_native_host", HOST_PATH)
+ib_native_host = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(ib_native_host)
+
+ResultCache = ib_native_host.ResultCache
+NativeMessagingHost = ib_native_host.NativeMessagingHost
+
+
+class FakeClock:
+    """Stand-in for time.monotonic that only moves when told to"""
+
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(ib_native_host.time, "monotonic", fake)
+    return fake
+
+
+@pytest.fixture
+def positions():
+    return [
+        Position(con_id=1, symbol="AAPL", sec_type="STK", position=100, avg_cost=150.0),
+        Position(con_id=2, symbol="SPY", sec_type="STK", position=-10, avg_cost=450.0),
+    ]
+
+
+@pytest.fixture
+def market_data():
+    return {
+        1: MarketData(symbol="AAPL", con_id=1, bid=180.0, ask=180.2, last=180.1),
+        2: MarketData(symbol="SPY", con_id=2, bid=500.0, ask=500.4, last=500.2),
+    }
+
+
+def _portfolio_data(positions_only: bool = False) -> dict:
+    data = {"positions": [{"symbol": "AAPL"}]}
+    if positions_only:
+        return data
+    data.update(
+        greeks={"delta": 100.0},
+        risk={"level": "low"},
+        account={"net_liquidation": 1.0},
+        recommendations=[],
+    )
+    return data
+
+
+def _mock_ib_client(connects: bool = True) -> Mock:
+    client = Mock()
+    client.connect.return_value = connects
+    client.is_connected = True
+    client.check_connection.return_value = True
+    client.ensure_connected.return_value = True
+    return client
+
+
+class TestResultCache:
+    """Test ResultCache"""
+
+    def test_get_returns_put_value(self, clock):
+        """A stored value is returned until its TTL runs out"""
+        cache = ResultCache()
+        cache.put("k", "get_greeks", {"success": True})
+
+        assert cache.get("k") == {"success": True}
+        assert cache.hits == 1
+        assert cache.get("missing") is None
+        assert cache.misses == 1
+
+    def test_ttl_expiry_per_action(self, clock):
+        """Each action expires after its own TTL and is dropped on lookup"""
+        cache = ResultCache(ttls={"get_greeks": 5.0})
+        cache.put("greeks", "get_greeks", {"g": 1})
+        cache.put("risk", "get_risk", {"r": 1})
+
+        clock.now += 5.5
+        assert cache.get("greeks") is None
+        assert "greeks" not in cache._entries
+        assert cache.get("risk") == {"r": 1}
+
+        clock.now += ResultCache.DEFAULT_TTLS["get_risk"]
+        assert cache.get("risk") is None
+
+    def test_lru_eviction(self, clock):
+        """Past max_entries the least recently used entry is evicted"""
+        cache = ResultCache(max_entries=2)
+        cache.put("a", "get_greeks", {"v": "a"})
+        cache.put("b", "get_greeks", {"v": "b"})
+        assert cache.get("a") is not None  # a is now the most recently used
+
+        cache.put("c", "get_greeks", {"v": "c"})
+
+        assert cache.get("b") is None
+        assert cache.get("a") == {"v": "a"}
+        assert cache.get("c") == {"v": "c"}
+
+    def test_clear(self, clock):
+        cache = ResultCache()
+        cache.put("a", "get_greeks", {})
+        cache.clear()
+        assert cache.get("a") is None
+
+    def test_make_key_is_order_independent(self):
+        """Param order does not matter, every component does"""
+        key = ResultCache.make_key("get_greeks", {"host": "h", "port": 1}, "abc")
+
+        assert key == ResultCache.make_key("get_greeks", {"port": 1, "host": "h"}, "abc")
+        assert key != ResultCache.make_key("get_risk", {"host": "h", "port": 1}, "abc")
+        assert key != ResultCache.make_key("get_greeks", {"host": "h", "port": 2}, "abc")
+        assert key != ResultCache.make_key("get_greeks", {"host": "h", "port": 1}, "abd")
+
+    def test_snapshot_hash_tracks_positions(self, positions):
+        """Order independent, changes with quantity or cost"""
+        base = ResultCache.snapshot_hash(positions)
+
+        assert ResultCache.snapshot_hash(positions[::-1]) == base
+        changed = [positions[0].model_copy(update={"position": 200}), positions[1]]
+        assert ResultCache.snapshot_hash(changed) != base
+
+    def test_snapshot_hash_tracks_market_data(self, positions, market_data):
+        """A quote or IV move changes the hash"""
+        base = ResultCache.snapshot_hash(positions, market_data)
+        assert base != ResultCache.snapshot_hash(positions)
+
+        moved = dict(market_data)
+        moved[1] = market_data[1].model_copy(update={"bid": 170.0, "ask": 170.2})
+        assert ResultCache.snapshot_hash(positions, moved) != base
+
+        iv_moved = dict(market_data)
+        iv_moved[2] = market_data[2].model_copy(update={"implied_volatility": 0.3})
+        assert ResultCache.snapshot_hash(positions, iv_moved) != base
+
+
+class TestHostResultCache:
+    """Test NativeMessagingHost serving requests through the ResultCache"""
+
+    @pytest.fixture
+    def host(self, clock, positions, market_data):
+        host = NativeMessagingHost()
+        ib_client = Mock()
+        ib_client.simulation_mode = False
+        ib_client.is_connected = True
+        ib_client.get_positions.return_value = positions
+        ib_client.get_market_data.return_value = market_data
+        host.ib_client = ib_client
+        host._connection_params = {"host": "127.0.0.1", "port": 7497, "client_id": 1}
+        host._last_health_check = clock.now
+        host._compute_portfolio_data = Mock(
+            side_effect=lambda action, *args: _portfolio_data(action == "get_positions")
+        )
+        return host
+
+    def test_portfolio_projects_into_other_actions(self, host):
+        """One get_portfolio computation serves greeks, risk and positions"""
+        portfolio = host._serve_cached("get_portfolio", {})
+        assert portfolio["success"]
+
+        assert host._serve_cached("get_greeks", {}) == {
+            "success": True, "greeks": {"delta": 100.0}
+        }
+        assert host._serve_cached("get_risk", {}) == {"success": True, "risk": {"level": "low"}}
+        assert host._serve_cached("get_positions", {})["positions"] == [{"symbol": "AAPL"}]
+        assert host._serve_cached("get_portfolio", {}) == portfolio
+
+        assert host._compute_portfolio_data.call_count == 1
+
+    def test_market_move_invalidates(self, host, market_data):
+        """A quote change recomputes market-dependent actions only"""
+        host._serve_cached("get_portfolio", {})
+
+        moved = dict(market_data)
+        moved[1] = market_data[1].model_copy(update={"bid": 170.0, "ask": 170.2})
+        host.ib_client.get_market_data.return_value = moved
+
+        host._serve_cached("get_positions", {})
+        assert host._compute_portfolio_data.call_count == 1
+
+        host._serve_cached("get_greeks", {})
+        assert host._compute_portfolio_data.call_count == 2
+        assert host._compute_portfolio_data.call_args.args[3] is moved
+
+    def test_positions_streamed(self, host, positions):
+        """Held positions are subscribed before market data is read"""
+        calls = []
+        host.ib_client.subscribe_market_data.side_effect = lambda p: calls.append("subscribe")
+        host.ib_client.get_market_data.side_effect = (
+            lambda p: calls.append("market_data") or host.ib_client.get_market_data.return_value
+        )
+
+        host._serve_cached("get_greeks", {})
+
+        host.ib_client.subscribe_market_data.assert_called_once_with(positions)
+        assert calls == ["subscribe", "market_data"]
+
+    def test_keyed_on_request_params(self, host):
+        """Requests with different params do not share entries"""
+        host._serve_cached("get_greeks", {"port": 7497})
+        host._serve_cached("get_greeks", {"port": 7497})
+        assert host._compute_portfolio_data.call_count == 1
+
+        host._serve_cached("get_greeks", {"port": 7497, "clientId": 1})
+        assert host._compute_portfolio_data.call_count == 2
+
+
+class TestHostConnection:
+    """Test the resident IB connection of NativeMessagingHost"""
+
+    @pytest.fixture
+    def ib_client_cls(self):
+        with patch("src.ib_client.client.IBClient") as cls:
+            cls.side_effect = lambda **kwargs: _mock_ib_client()
+            yield cls
+
+    def test_connects_once_and_reuses(self, clock, ib_client_cls):
+        host = NativeMessagingHost()
+
+        client = host._get_ib_client({})
+        assert host._get_ib_client({}) is client
+
+        ib_client_cls.assert_called_once()
+        client.connect.assert_called_once_with(host="127.0.0.1", port=7497, client_id=1)
+
+    def test_health_check_every_interval(self, clock, ib_client_cls):
+        """The connection is only probed once HEALTH_CHECK_INTERVAL has passed"""
+        host = NativeMessagingHost()
+        client = host._get_ib_client({})
+
+        clock.now += NativeMessagingHost.HEALTH_CHECK_INTERVAL - 1
+        host._get_ib_client({})
+        client.check_connection.assert_not_called()
+
+        clock.now += 1
+        host._get_ib_client({})
+        client.check_connection.assert_called_once()
+
+        # The successful check restarts the interval
+        clock.now += 1
+        host._get_ib_client({})
+        client.check_connection.assert_called_once()
+
+    def test_health_check_reconnects(self, clock, ib_client_cls):
+        """A failed probe falls back to ensure_connected"""
+        host = NativeMessagingHost()
+        client = host._get_ib_client({})
+        client.check_connection.return_value = False
+
+        clock.now += NativeMessagingHost.HEALTH_CHECK_INTERVAL
+        assert host._get_ib_client({}) is client
+        client.ensure_connected.assert_called_once()
+
+        client.ensure_connected.return_value = False
+        clock.now += NativeMessagingHost.HEALTH_CHECK_INTERVAL
+        with pytest.raises(ConnectionError):
+            host._get_ib_client({})
+
+    def test_disconnected_client_checked_immediately(self, clock, ib_client_cls):
+        host = NativeMessagingHost()
+        client = host._get_ib_client({})
+        client.is_connected = False
+
+        host._get_ib_client({})
+        client.check_connection.assert_called_once()
+
+    def test_reconnects_when_params_change(self, clock, ib_client_cls):
+        """New connection params tear down the client and clear the cache"""
+        host = NativeMessagingHost()
+        first = host._get_ib_client({"port": 7497})
+        host.result_cache.put("k", "get_greeks", {})
+
+        second = host._get_ib_client({"port": 4001, "clientId": 3})
+
+        assert second is not first
+        first.disconnect.assert_called_once()
+        second.connect.assert_called_once_with(host="127.0.0.1", port=4001, client_id=3)
+        assert host.result_cache.get("k") is None
+
+    def test_failed_connect_raises(self, clock, ib_client_cls):
+        ib_client_cls.side_effect = lambda **kwargs: _mock_ib_client(connects=False)
+        host = NativeMessagingHost()
+
+        with pytest.raises(ConnectionError):
+            host._get_ib_client({})
+
+
+class TestRequestId:
+    """Test request_id echoing on the long-lived port"""
+
+    def _run(self, host, messages, monkeypatch):
+        sent = []
+        incoming = iter(messages + [None])
+        monkeypatch.setattr(host, "_read_message", lambda: next(incoming))
+        monkeypatch.setattr(host, "_send_message", sent.append)
+        host.run()
+        return sent
+
+    def test_request_id_echoed(self, monkeypatch):
+        host = NativeMessagingHost()
+        sent = self._run(host, [
+            {"action": "ping", "request_id": 7},
+            {"action": "unknown", "request_id": "abc"},
+            {"action": "ping"},
+        ], monkeypatch)
+
+        assert sent[0]["request_id"] == 7
+        assert sent[0]["message"] == "pong"
+        assert sent[1]["request_id"] == "abc"
+        assert not sent[1]["success"]
+        assert "request_id" not in sent[2]
+
+    def test_request_id_echoed_on_error(self, monkeypatch):
+        """A handler exception still answers the request it belongs to"""
+        host = NativeMessagingHost()
+        monkeypatch.setattr(host, "_handle_ping", Mock(side_effect=RuntimeError("boom")))
+
+        sent = self._run(host, [{"action": "ping", "request_id": 9}], monkeypatch)
+
+        assert sent == [{"success": False, "error": "boom", "request_id": 9}]